@@ -236,22 +236,22 @@ class DJClient(_internal.DJClient):
             force_tty=True,
             calibrate=5e40,
         ) as progress_bar:
+            # Submit the query once, then poll its handle until it completes, so
+            # that the SQL is not rebuilt and resubmitted on every poll
+            response = self._session.get(
+                "/data/",
+                params={
+                    "metrics": metrics,
+                    "dimensions": dimensions or [],
+                    "filters": filters or [],
+                    "engine_name": engine_name or self.engine_name,
+                    "engine_version": engine_version or self.engine_version,
+                    "async_": async_,
+                },
+            )
             poll_interval = 1  # Initial polling interval in seconds
-            job_state = models.QueryState.UNKNOWN
-            results = None
-            while job_state not in models.END_JOB_STATES:
+            while True:
                 progress_bar()  # pylint: disable=not-callable
-                response = self._session.get(
-                    "/data/",
-                    params={
-                        "metrics": metrics,
-                        "dimensions": dimensions or [],
-                        "filters": filters or [],
-                        "engine_name": engine_name or self.engine_name,
-                        "engine_version": engine_version or self.engine_version,
-                        "async_": async_,
-                    },
-                )
                 results = response.json()
 
                 # Raise errors if any
@@ -273,10 +273,13 @@ class DJClient(_internal.DJClient):
                     )
                     printed_links = True
                 progress_bar.title = f"Status: {job_state.value}"
+                if job_state in models.END_JOB_STATES:
+                    break
 
-                # Update the polling interval
+                # Poll the query handle with an increasing interval
                 time.sleep(poll_interval)
                 poll_interval *= 2
+                response = self._session.get(f"/data/query/{results['id']}")
 
             # Return results if the job has finished
             if job_state == models.QueryState.FINISHED:
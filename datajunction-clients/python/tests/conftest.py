@@ -19,9 +19,13 @@ from datajunction_server.database.column import Column
 from datajunction_server.database.engine import Engine
 from datajunction_server.models.materialization import MaterializationInfo
 from datajunction_server.models.query import QueryCreate, QueryWithResults
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import (
+    AsyncQueryServiceClient,
+    QueryServiceClient,
+)
 from datajunction_server.typing import QueryState
 from datajunction_server.utils import (
+    get_async_query_service_client,
     get_query_service_client,
     get_session,
     get_settings,
@@ -121,6 +125,7 @@ def query_service_client(mocker: MockerFixture) -> Iterator[QueryServiceClient]:
     """
     qs_client = QueryServiceClient(uri="query_service:8001")
     qs_client.query_state = QueryState.RUNNING  # type: ignore
+    submitted: Dict[str, QueryWithResults] = {}
 
     def mock_get_columns_for_table(
         catalog: str,
@@ -157,6 +162,7 @@ def query_service_client(mocker: MockerFixture) -> Iterator[QueryServiceClient]:
         if results.state not in (QueryState.FAILED,):
             results.state = qs_client.query_state  # type: ignore
             qs_client.query_state = QueryState.FINISHED  # type: ignore
+        submitted[str(results.id)] = results
         return results
 
     mocker.patch.object(
@@ -165,6 +171,23 @@ def query_service_client(mocker: MockerFixture) -> Iterator[QueryServiceClient]:
         mock_submit_query,
     )
 
+    def mock_get_query(
+        query_id: str,
+        request_headers: Optional[  # pylint: disable=unused-argument
+            Dict[str, str]
+        ] = None,
+    ) -> QueryWithResults:
+        results = submitted[query_id].copy()
+        if results.state not in (QueryState.FAILED,):
+            results.state = QueryState.FINISHED  # type: ignore
+        return results
+
+    mocker.patch.object(
+        qs_client,
+        "get_query",
+        mock_get_query,
+    )
+
     mock_materialize = MagicMock()
     mock_materialize.return_value = MaterializationInfo(
         urls=["http://fake.url/job"],
@@ -213,6 +236,19 @@ def server(  # pylint: disable=too-many-statements
     def get_query_service_client_override() -> QueryServiceClient:
         return query_service_client
 
+    def get_async_query_service_client_override() -> AsyncQueryServiceClient:
+        async_client = AsyncQueryServiceClient(uri=query_service_client.uri)
+
+        def delegate(name: str):
+            async def _delegate(*args, **kwargs):
+                return getattr(query_service_client, name)(*args, **kwargs)
+
+            return _delegate
+
+        for name in ("get_columns_for_table", "submit_query", "get_query"):
+            setattr(async_client, name, delegate(name))
+        return async_client
+
     async def get_session_override() -> AsyncSession:
         return session
 
@@ -224,6 +260,9 @@ def server(  # pylint: disable=too-many-statements
     app.dependency_overrides[
         get_query_service_client
     ] = get_query_service_client_override
+    app.dependency_overrides[
+        get_async_query_service_client
+    ] = get_async_query_service_client_override
 
     with TestClient(app) as test_client:
 
@@ -3,12 +3,13 @@ Engine related APIs.
 """
 
 from http import HTTPStatus
-from typing import List
+from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
 from djqs.api.helpers import get_engine
+from djqs.engine import get_engine_registry
 from djqs.models.engine import BaseEngineInfo, Engine, EngineInfo
 from djqs.utils import get_session
 
@@ -24,6 +25,14 @@ def list_engines(*, session: Session = Depends(get_session)) -> List[EngineInfo]
     return list(session.exec(select(Engine)))
 
 
+@get_router.get("/engines/pools/")
+def list_engine_pools() -> Dict[str, Any]:
+    """
+    Return the status of the connection pools kept for each engine
+    """
+    return get_engine_registry().stats()
+
+
 @get_router.get("/engines/{name}/{version}/", response_model=BaseEngineInfo)
 def list_engine(
     name: str, version: str, *, session: Session = Depends(get_session)
@@ -1,14 +1,17 @@
 """
 Helper functions for API
 """
+import hashlib
+import json
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy import inspect
 from sqlalchemy.exc import NoResultFound, NoSuchTableError, OperationalError
 from sqlmodel import Session, create_engine, select
 
+from djqs.engine import get_engine_registry
 from djqs.exceptions import DJException, DJTableNotFound
 from djqs.models.catalog import Catalog
 from djqs.models.engine import Engine
@@ -79,3 +82,60 @@ def get_columns(
         {"name": column["name"], "type": column["type"].python_type.__name__.upper()}
         for column in column_metadata
     ]
+
+
+def get_schema_columns(
+    engine: Engine,
+    catalog: str,
+    schema: str,
+    tables: Optional[List[str]] = None,
+) -> Tuple[Dict[str, List[Dict[str, str]]], List[str]]:
+    """
+    Return the columns of many tables in a schema, introspected over a single pooled
+    connection. Defaults to all tables in the schema. Tables that cannot be found are
+    returned separately instead of failing the whole batch.
+    """
+    if not engine.uri:
+        raise DJException("Cannot retrieve columns without a uri")
+
+    sqla_engine = get_engine_registry().sqlalchemy_engine(
+        engine.name,
+        engine.version,
+        engine.uri,
+        engine.extra_params,
+    )
+    columns: Dict[str, List[Dict[str, str]]] = {}
+    missing = []
+    with sqla_engine.connect() as connection:
+        inspector = inspect(connection)
+        if schema not in inspector.get_schema_names():
+            raise DJException(
+                message=f"No such schema `{schema}` in catalog `{catalog}`",
+                http_status_code=404,
+            )
+        if tables is None:
+            tables = inspector.get_table_names(schema=schema)
+        for table in tables:
+            try:
+                column_metadata = inspector.get_columns(table, schema=schema)
+            except NoSuchTableError:  # pragma: no cover
+                column_metadata = []
+            # Some dialects return no columns for a table that doesn't exist
+            if not column_metadata:
+                missing.append(table)
+                continue
+            columns[table] = [
+                {
+                    "name": column["name"],
+                    "type": column["type"].python_type.__name__.upper(),
+                }
+                for column in column_metadata
+            ]
+    return columns, missing
+
+
+def get_table_fingerprint(columns: List[Dict[str, str]]) -> str:
+    """
+    Fingerprint a table by the names and types of its columns
+    """
+    return hashlib.sha256(json.dumps(columns).encode()).hexdigest()
@@ -16,6 +16,7 @@ from fastapi.responses import JSONResponse
 from djqs import __version__
 from djqs.api import catalogs, engines, queries, tables
 from djqs.config import load_djqs_config
+from djqs.engine import get_engine_registry
 from djqs.exceptions import DJException
 from djqs.utils import get_session, get_settings
 
@@ -28,13 +29,14 @@ session = next(get_session())
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pylint: disable=W0621,W0613
     """
-    Load DJQS config on app startup
+    Load DJQS config on app startup, and close pooled engine connections on shutdown
     """
     try:
         load_djqs_config(settings=settings, session=session)
     except Exception as e:  # pylint: disable=W0718,C0103
         _logger.warning("Could not load DJQS config: %s", e)
     yield
+    get_engine_registry().dispose()
 
 
 app = FastAPI(
@@ -22,7 +22,7 @@ from fastapi import (
 from sqlmodel import Session
 
 from djqs.config import Settings
-from djqs.engine import process_query
+from djqs.engine import page_key, page_url, process_query
 from djqs.models.query import (
     Query,
     QueryCreate,
@@ -181,6 +181,7 @@ def load_query_results(
 @router.get("/queries/{query_id}/", response_model=QueryResults)
 def read_query(
     query_id: uuid.UUID,
+    page: int = 0,
     *,
     session: Session = Depends(get_session),
     settings: Settings = Depends(get_settings),
@@ -188,16 +189,21 @@ def read_query(
     """
     Fetch information about a query.
 
-    For paginated queries we move the data from the results backend to the cache for a
-    short period, anticipating additional requests.
+    Results that were written in pages are fetched one page at a time, with links to
+    the next and previous pages.
     """
     query = session.get(Query, query_id)
     if not query:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Query not found")
 
-    query_results = load_query_results(settings, str(query_id))
+    query_results = load_query_results(settings, page_key(query_id, page))
 
-    prev = next_ = None
+    prev = page_url(settings, query_id, page - 1) if page > 0 else None
+    next_ = (
+        page_url(settings, query_id, page + 1)
+        if settings.results_backend.has(page_key(query_id, page + 1))
+        else None
+    )
     results = Results(__root__=query_results)
 
     return QueryResults(
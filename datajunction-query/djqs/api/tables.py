@@ -1,19 +1,53 @@
 """
 Table related APIs.
 """
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends
 from sqlmodel import Session
 
-from djqs.api.helpers import get_columns, get_engine
+from djqs.api.helpers import (
+    get_columns,
+    get_engine,
+    get_schema_columns,
+    get_table_fingerprint,
+)
 from djqs.exceptions import DJInvalidTableRef
-from djqs.models.table import TableInfo
+from djqs.models.engine import Engine
+from djqs.models.table import (
+    SchemaColumnsRequest,
+    SchemaFingerprints,
+    SchemaFingerprintsRequest,
+    SchemaInfo,
+    TableInfo,
+)
 from djqs.utils import get_session, get_settings
 
 router = APIRouter(tags=["Table Reflection"])
 
 
+def get_reflection_engine(
+    session: Session,
+    engine: Optional[str],
+    engine_version: Optional[str],
+) -> Engine:
+    """
+    The engine to reflect tables with, falling back to the configured default
+    """
+    settings = get_settings()
+
+    if engine_version == "":
+        version = ""
+    else:  # pragma: no cover
+        version = engine_version or settings.default_reflection_engine_version
+
+    return get_engine(
+        session=session,
+        name=engine or settings.default_reflection_engine,
+        version=version,
+    )
+
+
 @router.get("/table/{table}/columns/", response_model=TableInfo)
 def table_columns(
     table: str,
@@ -32,21 +66,10 @@ def table_columns(
             message=f"The provided table value `{table}` is invalid. A valid value "
             f"for `table` must be in the format `<catalog>.<schema>.<table>`",
         )
-    settings = get_settings()
-
-    if engine_version == "":
-        version = ""
-    else:  # pragma: no cover
-        version = engine_version or settings.default_reflection_engine_version
-
-    engine = get_engine(
-        session=session,
-        name=engine or settings.default_reflection_engine,
-        version=version,
-    )
+    reflection_engine = get_reflection_engine(session, engine, engine_version)
     external_columns = get_columns(
-        uri=engine.uri,
-        extra_params=engine.extra_params,
+        uri=reflection_engine.uri,
+        extra_params=reflection_engine.extra_params,
         catalog=table_parts[0],
         schema=table_parts[1],
         table=table_parts[2],
@@ -55,3 +78,99 @@ def table_columns(
         name=table,
         columns=external_columns,
     )
+
+
+def get_requested_schema_columns(
+    session: Session,
+    schema: str,
+    data: SchemaColumnsRequest,
+    engine: Optional[str],
+    engine_version: Optional[str],
+) -> Tuple[Dict[str, List[Dict[str, str]]], List[str]]:
+    """
+    The columns of the requested tables in a `<catalog>.<schema>` schema
+    """
+    schema_parts = schema.split(".")
+    if len(schema_parts) != 2:
+        raise DJInvalidTableRef(
+            http_status_code=422,
+            message=f"The provided schema value `{schema}` is invalid. A valid value "
+            f"for `schema` must be in the format `<catalog>.<schema>`",
+        )
+    reflection_engine = get_reflection_engine(session, engine, engine_version)
+    return get_schema_columns(
+        engine=reflection_engine,
+        catalog=schema_parts[0],
+        schema=schema_parts[1],
+        tables=data.tables,
+    )
+
+
+@router.post("/schema/{schema}/columns/", response_model=SchemaInfo)
+def schema_columns(  # pylint: disable=too-many-arguments
+    schema: str,
+    data: SchemaColumnsRequest,
+    engine: Optional[str] = None,
+    engine_version: Optional[str] = None,
+    *,
+    session: Session = Depends(get_session),
+) -> SchemaInfo:
+    """
+    Get column information for many tables in a schema at once, or for all of its
+    tables if none are requested. Tables that don't exist are listed as missing.
+    """
+    columns, missing = get_requested_schema_columns(
+        session,
+        schema,
+        data,
+        engine,
+        engine_version,
+    )
+    return SchemaInfo(
+        name=schema,
+        tables=[
+            TableInfo(name=f"{schema}.{table}", columns=table_columns)
+            for table, table_columns in columns.items()
+        ],
+        missing=[f"{schema}.{table}" for table in missing],
+    )
+
+
+@router.post("/schema/{schema}/fingerprints/", response_model=SchemaFingerprints)
+def schema_fingerprints(  # pylint: disable=too-many-arguments
+    schema: str,
+    data: SchemaFingerprintsRequest,
+    engine: Optional[str] = None,
+    engine_version: Optional[str] = None,
+    *,
+    session: Session = Depends(get_session),
+) -> SchemaFingerprints:
+    """
+    Get a fingerprint of the columns of many tables in a schema. Only the columns of
+    tables whose fingerprint differs from the one given by the caller are returned,
+    so that callers can refresh changed tables without introspecting them again.
+    """
+    columns, missing = get_requested_schema_columns(
+        session,
+        schema,
+        data,
+        engine,
+        engine_version,
+    )
+    fingerprints = {
+        table: get_table_fingerprint(table_columns)
+        for table, table_columns in columns.items()
+    }
+    return SchemaFingerprints(
+        name=schema,
+        fingerprints={
+            f"{schema}.{table}": fingerprint
+            for table, fingerprint in fingerprints.items()
+        },
+        tables=[
+            TableInfo(name=f"{schema}.{table}", columns=columns[table])
+            for table, fingerprint in fingerprints.items()
+            if data.fingerprints.get(table) != fingerprint
+        ],
+        missing=[f"{schema}.{table}" for table in missing],
+    )
@@ -41,6 +41,12 @@ class Settings(BaseSettings):  # pylint: disable=too-few-public-methods
 
     paginating_timeout: timedelta = timedelta(minutes=5)
 
+    # Rows are fetched from the engines in batches of this size. When a page size is
+    # set results are written to the results backend in pages of at most that many
+    # rows, served by ``GET /queries/{id}/?page=N``; otherwise they're a single page.
+    results_fetch_size: int = 1000
+    results_page_size: Optional[int] = None
+
     # How long to wait when pinging databases to find out the fastest online database.
     do_ping_timeout: timedelta = timedelta(seconds=5)
 
@@ -50,6 +56,17 @@ class Settings(BaseSettings):  # pylint: disable=too-few-public-methods
     # Enable setting catalog and engine config via REST API calls
     enable_dynamic_config: bool = True
 
+    # Connection pools kept per query engine. Connections idle for longer than the
+    # recycle interval are replaced, and connections are pinged before being reused.
+    engine_pool_size: int = 5
+    engine_max_overflow: int = 10
+    engine_pool_timeout: int = 30
+    engine_pool_recycle: int = 1800
+    engine_pool_pre_ping: bool = True
+
+    # Share a single read-only connection per DuckDB database file across queries
+    duckdb_shared_connection: bool = True
+
 
 def load_djqs_config(settings: Settings, session: Session) -> None:  # pragma: no cover
     """
@@ -1,17 +1,26 @@
 """
 Query related functions.
 """
+import json
 import logging
 import os
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import duckdb
 import snowflake.connector
 import sqlparse
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine as SqlaEngine
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, select
 
+from djqs import utils
 from djqs.config import Settings
 from djqs.constants import SQLALCHEMY_URI
 from djqs.models.engine import Engine, EngineType
@@ -66,16 +75,156 @@ def get_columns_from_description(
     return columns
 
 
+class EngineRegistry:
+    """
+    Process-wide registry of query engine connections, so that queries reuse pooled
+    connections instead of opening new ones every time.
+
+    SQLAlchemy engines (each with its own connection pool) are kept per engine name,
+    version, URI and extra params. DuckDB database files can be shared through a
+    single read-only connection, with a cursor handed out per query.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.engines: Dict[Tuple[str, ...], SqlaEngine] = {}
+        self.duckdb_connections: Dict[str, duckdb.DuckDBPyConnection] = {}
+        self.lock = threading.Lock()
+
+    def pool_args(self, uri: str) -> Dict[str, Any]:
+        """
+        Pool configuration for an engine URI. Sizes only apply to dialects that use a
+        queue pool (e.g. not file-based SQLite).
+        """
+        args: Dict[str, Any] = {
+            "pool_pre_ping": self.settings.engine_pool_pre_ping,
+            "pool_recycle": self.settings.engine_pool_recycle,
+        }
+        url = make_url(uri)
+        if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+            args.update(
+                pool_size=self.settings.engine_pool_size,
+                max_overflow=self.settings.engine_max_overflow,
+                pool_timeout=self.settings.engine_pool_timeout,
+            )
+        return args
+
+    def sqlalchemy_engine(
+        self,
+        name: str,
+        version: str,
+        uri: str,
+        connect_args: Optional[Dict[str, Any]] = None,
+    ) -> SqlaEngine:
+        """
+        The pooled SQLAlchemy engine for an engine definition.
+        """
+        key = (name, version, uri, json.dumps(connect_args or {}, sort_keys=True))
+        with self.lock:
+            if key not in self.engines:
+                _logger.info("Creating sqlalchemy engine for %s %s", name, version)
+                self.engines[key] = create_engine(
+                    uri,
+                    connect_args=connect_args or {},
+                    **self.pool_args(uri),
+                )
+            return self.engines[key]
+
+    @contextmanager
+    def duckdb_connection(
+        self,
+        engine: Engine,
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        A DuckDB connection for the engine. In-memory databases always get a fresh
+        connection, while database files are opened read-only.
+        """
+        if engine.uri == "duckdb:///:memory:":
+            yield duckdb.connect()
+            return
+
+        location = engine.extra_params["location"]
+        if not self.settings.duckdb_shared_connection:
+            conn = duckdb.connect(database=location, read_only=True)
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        with self.lock:
+            conn = self.duckdb_connections.get(location)
+            try:
+                cursor = conn.cursor() if conn else None
+            except duckdb.Error:  # the shared connection is no longer usable
+                cursor = None
+            if cursor is None:
+                _logger.info("Opening shared duckdb connection to %s", location)
+                conn = duckdb.connect(database=location, read_only=True)
+                self.duckdb_connections[location] = conn
+                cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pool status for every registered engine.
+        """
+        with self.lock:
+            return {
+                "engines": [
+                    {"name": name, "version": version, "pool": engine.pool.status()}
+                    for (name, version, _, _), engine in self.engines.items()
+                ],
+                "duckdb_connections": len(self.duckdb_connections),
+            }
+
+    def dispose(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        with self.lock:
+            for engine in self.engines.values():
+                engine.dispose()
+            for conn in self.duckdb_connections.values():
+                conn.close()
+            self.engines.clear()
+            self.duckdb_connections.clear()
+
+
+@lru_cache(maxsize=None)
+def get_engine_registry() -> EngineRegistry:
+    """
+    The process-wide engine registry.
+    """
+    return EngineRegistry(utils.get_settings())
+
+
+def fetch_rows(cursor: Any, size: int) -> Stream:
+    """
+    Stream rows from a cursor, fetching them in batches.
+    """
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        for row in rows:
+            yield tuple(row)
+
+
 def run_query(  # pylint: disable=R0914
     session: Session,
     query: Query,
     headers: Optional[Dict[str, str]] = None,
-) -> List[Tuple[str, List[ColumnMetadata], Stream]]:
+) -> Iterator[Tuple[str, List[ColumnMetadata], Stream]]:
     """
     Run a query and return its results.
 
-    For each statement we return a tuple with the statement SQL, a description of the
-    columns (name and type) and a stream of rows (tuples).
+    For each statement we yield a tuple with the statement SQL, a description of the
+    columns (name and type) and a stream of rows (tuples). Statements run lazily, so
+    each stream should be consumed before moving on to the next statement.
     """
 
     _logger.info("Running query on catalog %s", query.catalog_name)
@@ -85,6 +234,8 @@ def run_query(  # pylint: disable=R0914
         .where(Engine.name == query.engine_name)
         .where(Engine.version == query.engine_version),
     ).one()
+    registry = get_engine_registry()
+    fetch_size = registry.settings.results_fetch_size
 
     query_server = headers.get("SQLALCHEMY_URI") if headers else None
 
@@ -95,16 +246,9 @@ def run_query(  # pylint: disable=R0914
         )
         sqla_engine = create_engine(query_server)
     elif engine.type == EngineType.DUCKDB:
-        _logger.info("Creating duckdb connection")
-        conn = (
-            duckdb.connect()
-            if engine.uri == "duckdb:///:memory:"
-            else duckdb.connect(
-                database=engine.extra_params["location"],
-                read_only=True,
-            )
-        )
-        return run_duckdb_query(query, conn)
+        with registry.duckdb_connection(engine) as conn:
+            yield from run_duckdb_query(query, conn, fetch_size)
+        return
     elif engine.type == EngineType.SNOWFLAKE:
         _logger.info("Creating snowflake connection")
         conn = snowflake.connector.connect(
@@ -113,57 +257,170 @@ def run_query(  # pylint: disable=R0914
         )
         cur = conn.cursor()
 
-        return run_snowflake_query(query, cur)
+        yield from run_snowflake_query(query, cur, fetch_size)
+        return
 
-    _logger.info(
-        "Creating sqlalchemy engine using engine name and version defined on query",
+    sqla_engine = registry.sqlalchemy_engine(
+        engine.name,
+        engine.version,
+        engine.uri,
+        engine.extra_params,
     )
-    sqla_engine = create_engine(engine.uri, connect_args=engine.extra_params)
-    connection = sqla_engine.connect()
 
-    output: List[Tuple[str, List[ColumnMetadata], Stream]] = []
+    # The connection goes back to the pool once all the statements have been read
     statements = sqlparse.parse(query.executed_query)
-    for statement in statements:
-        # Druid doesn't like statements that end in a semicolon...
-        sql = str(statement).strip().rstrip(";")
-
-        results = connection.execute(text(sql))
-        stream = (tuple(row) for row in results)
-        columns = get_columns_from_description(
-            results.cursor.description,
-            sqla_engine.dialect,
-        )
-        output.append((sql, columns, stream))
-
-    return output
+    with sqla_engine.connect() as connection:
+        for statement in statements:
+            # Druid doesn't like statements that end in a semicolon...
+            sql = str(statement).strip().rstrip(";")
+
+            results = connection.execute(text(sql))
+            columns = get_columns_from_description(
+                results.cursor.description,
+                sqla_engine.dialect,
+            )
+            yield sql, columns, fetch_rows(results, fetch_size)
 
 
 def run_duckdb_query(
     query: Query,
     conn: duckdb.DuckDBPyConnection,
-) -> List[Tuple[str, List[ColumnMetadata], Stream]]:
+    fetch_size: int,
+) -> Iterator[Tuple[str, List[ColumnMetadata], Stream]]:
     """
     Run a duckdb query against the local duckdb database
     """
-    output: List[Tuple[str, List[ColumnMetadata], Stream]] = []
-    rows = conn.execute(query.submitted_query).fetchall()
     columns: List[ColumnMetadata] = []
-    output.append((query.submitted_query, columns, rows))
-    return output
+    cursor = conn.execute(query.submitted_query)
+    yield query.submitted_query, columns, fetch_rows(cursor, fetch_size)
 
 
 def run_snowflake_query(
     query: Query,
     cur: snowflake.connector.cursor.SnowflakeCursor,
-) -> List[Tuple[str, List[ColumnMetadata], Stream]]:
+    fetch_size: int,
+) -> Iterator[Tuple[str, List[ColumnMetadata], Stream]]:
     """
     Run a query against a snowflake warehouse
     """
-    output: List[Tuple[str, List[ColumnMetadata], Stream]] = []
-    rows = cur.execute(query.submitted_query).fetchall()
     columns: List[ColumnMetadata] = []
-    output.append((query.submitted_query, columns, rows))
-    return output
+    cursor = cur.execute(query.submitted_query)
+    yield query.submitted_query, columns, fetch_rows(cursor, fetch_size)
+
+
+def page_key(query_id: uuid.UUID, page: int) -> str:
+    """
+    The results backend key for a page of query results. The first page is stored
+    under the query ID.
+    """
+    return str(query_id) if page == 0 else f"{query_id}/{page}"
+
+
+def page_url(settings: Settings, query_id: uuid.UUID, page: int) -> str:
+    """
+    The URL for a page of query results.
+    """
+    return f"{settings.url.rstrip('/')}/queries/{query_id}/?page={page}"
+
+
+class ResultPages:
+    """
+    Writes query results to the results backend as they're streamed, in pages of at
+    most ``results_page_size`` rows, so that only a single page is held in memory.
+
+    A statement whose rows span multiple pages has a fragment in each of them, and
+    every fragment carries the total row count for the statement.
+    """
+
+    def __init__(self, settings: Settings, query_id: uuid.UUID):
+        self.backend = settings.results_backend
+        self.page_size = settings.results_page_size
+        self.query_id = query_id
+        self.pages = 0
+        self.first: List[StatementResults] = []
+        self.current: List[StatementResults] = []
+        self.rows = 0
+        # statement index for each fragment in the pages written so far
+        self.layout: List[List[int]] = []
+        self.statements: List[int] = []
+        self.row_counts: List[int] = []
+
+    def add(self, sql: str, columns: List[ColumnMetadata], stream: Stream) -> None:
+        """
+        Add the results of a statement.
+        """
+        index = len(self.row_counts)
+        self.row_counts.append(0)
+        fragment = self.start(index, sql, columns)
+        for row in stream:
+            if self.full():
+                fragment = self.start(index, sql, columns)
+            fragment.rows.append(row)
+            fragment.row_count += 1
+            self.row_counts[index] += 1
+            self.rows += 1
+
+    def start(
+        self,
+        index: int,
+        sql: str,
+        columns: List[ColumnMetadata],
+    ) -> StatementResults:
+        """
+        Start a fragment for a statement, in a new page if the current one is full.
+        """
+        if self.full():
+            self.flush()
+        fragment = StatementResults(sql=sql, columns=columns, rows=[])
+        self.current.append(fragment)
+        self.statements.append(index)
+        return fragment
+
+    def full(self) -> bool:
+        """
+        Whether the current page is full.
+        """
+        return bool(self.page_size and self.rows >= self.page_size)
+
+    def flush(self) -> None:
+        """
+        Write the current page to the results backend.
+        """
+        results = Results(__root__=self.current)
+        self.backend.set(page_key(self.query_id, self.pages), results.json())
+        if self.pages == 0:
+            self.first = self.current
+        self.layout.append(self.statements)
+        self.pages += 1
+        self.current, self.statements, self.rows = [], [], 0
+
+    def close(self) -> Results:
+        """
+        Write the last page and return the first one.
+
+        When results span multiple pages the pages are updated with the total row
+        counts, which are only known at the end.
+        """
+        self.flush()
+        if self.pages > 1:
+            for page, statements in enumerate(self.layout):
+                key = page_key(self.query_id, page)
+                fragments = json.loads(self.backend.get(key))
+                for fragment, index in zip(fragments, statements):
+                    fragment["row_count"] = self.row_counts[index]
+                self.backend.set(key, json.dumps(fragments))
+            for fragment, index in zip(self.first, self.layout[0]):
+                fragment.row_count = self.row_counts[index]
+        return Results(__root__=self.first)
+
+    def discard(self) -> None:
+        """
+        Replace any pages written so far with empty results.
+        """
+        self.backend.set(page_key(self.query_id, 0), Results(__root__=[]).json())
+        for page in range(1, self.pages):
+            self.backend.delete(page_key(self.query_id, page))
+        self.pages = 1
 
 
 def process_query(
@@ -174,6 +431,8 @@ def process_query(
 ) -> QueryResults:
     """
     Process a query.
+
+    Results are streamed to the results backend, and the first page is returned.
     """
     query.scheduled = datetime.now(timezone.utc)
     query.state = QueryState.SCHEDULED
@@ -181,27 +440,20 @@ def process_query(
 
     errors = []
     query.started = datetime.now(timezone.utc)
+    pages = ResultPages(settings, query.id)
     try:
-        root = []
         for sql, columns, stream in run_query(
             session=session,
             query=query,
             headers=headers,
         ):
-            rows = list(stream)
-            root.append(
-                StatementResults(
-                    sql=sql,
-                    columns=columns,
-                    rows=rows,
-                    row_count=len(rows),
-                ),
-            )
-        results = Results(__root__=root)
+            pages.add(sql, columns, stream)
+        results = pages.close()
 
         query.state = QueryState.FINISHED
         query.progress = 1.0
     except Exception as ex:  # pylint: disable=broad-except
+        pages.discard()
         results = Results(__root__=[])
         query.state = QueryState.FAILED
         errors = [str(ex)]
@@ -212,6 +464,5 @@ def process_query(
     session.commit()
     session.refresh(query)
 
-    settings.results_backend.add(str(query.id), results.json())
-
-    return QueryResults(results=results, errors=errors, **query.dict())
+    next_ = page_url(settings, query.id, 1) if pages.pages > 1 else None
+    return QueryResults(results=results, next=next_, errors=errors, **query.dict())
@@ -1,7 +1,7 @@
 """
 Models for use in table API requests and responses
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -13,3 +13,43 @@ class TableInfo(BaseModel):
 
     name: str
     columns: List[Dict[str, str]]
+
+
+class SchemaColumnsRequest(BaseModel):
+    """
+    Tables to introspect in a schema, or all of its tables if none are given
+    """
+
+    tables: Optional[List[str]] = None
+
+
+class SchemaInfo(BaseModel):
+    """
+    Column information for many tables in a schema
+    """
+
+    name: str
+    tables: List[TableInfo]
+    missing: List[str] = []
+
+
+class SchemaFingerprintsRequest(SchemaColumnsRequest):
+    """
+    Tables to fingerprint in a schema, along with the fingerprints the caller already
+    has for them, if any
+    """
+
+    fingerprints: Dict[str, str] = {}
+
+
+class SchemaFingerprints(BaseModel):
+    """
+    Fingerprints for many tables in a schema, which change whenever the names or
+    types of a table's columns change, and the columns of the tables whose
+    fingerprints differ from the caller's
+    """
+
+    name: str
+    fingerprints: Dict[str, str]
+    tables: List[TableInfo] = []
+    missing: List[str] = []
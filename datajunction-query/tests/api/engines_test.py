@@ -151,3 +151,12 @@ def test_engine_raise_on_engine_already_exists(
     assert response.status_code == 409
     data = response.json()
     assert data == {"detail": "Engine already exists: `foo` version `1.0`"}
+
+
+def test_engine_pools(client: TestClient) -> None:
+    """
+    Test listing the status of engine connection pools
+    """
+    response = client.get("/engines/pools/")
+    assert response.status_code == 200
+    assert set(response.json()) == {"engines", "duckdb_connections"}
@@ -308,7 +308,8 @@ def test_submit_query_multiple_statements(session: Session, client: TestClient)
     assert len(data["results"]) == 2
     assert data["results"][0]["sql"] == "SELECT 1 AS col"
     assert data["results"][0]["columns"] == [{"name": "col", "type": "STR"}]
-    assert data["results"][0]["rows"] == [[2]]
+    assert data["results"][0]["rows"] == [[1]]
+    assert data["results"][1]["rows"] == [[2]]
     assert data["errors"] == []
 
 
@@ -595,6 +596,107 @@ def test_read_query_no_results_backend(session: Session, client: TestClient) ->
     response = client.get("/queries/123")
 
 
+def test_submit_query_paginated(
+    session: Session,
+    settings: Settings,
+    client: TestClient,
+) -> None:
+    """
+    Test that results are written in pages which can be read with ``GET /queries/``.
+    """
+    settings.results_page_size = 2
+    engine = Engine(
+        name="test_engine",
+        type=EngineType.DUCKDB,
+        version="1.0",
+        uri="duckdb:///:memory:",
+    )
+    catalog = Catalog(name="test_catalog", engines=[engine])
+    session.add(catalog)
+    session.commit()
+    session.refresh(catalog)
+
+    query_create = QueryCreate(
+        catalog_name=catalog.name,
+        engine_name=engine.name,
+        engine_version=engine.version,
+        submitted_query="SELECT * FROM range(5)",
+    )
+    response = client.post(
+        "/queries/",
+        data=query_create.json(),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+    )
+    data = response.json()
+    query_id = data["id"]
+    url = f"http://localhost:8001/queries/{query_id}/?page="
+    assert data["results"] == [
+        {
+            "sql": "SELECT * FROM range(5)",
+            "columns": [],
+            "rows": [[0], [1]],
+            "row_count": 5,
+        },
+    ]
+    assert data["next"] == f"{url}1"
+    assert data["previous"] is None
+
+    data = client.get(f"/queries/{query_id}/", params={"page": 1}).json()
+    assert data["results"][0]["rows"] == [[2], [3]]
+    assert data["results"][0]["row_count"] == 5
+    assert data["next"] == f"{url}2"
+    assert data["previous"] == f"{url}0"
+
+    data = client.get(f"/queries/{query_id}/", params={"page": 2}).json()
+    assert data["results"][0]["rows"] == [[4]]
+    assert data["next"] is None
+    assert data["previous"] == f"{url}1"
+
+
+def test_submit_query_paginated_multiple_statements(
+    session: Session,
+    settings: Settings,
+    client: TestClient,
+) -> None:
+    """
+    Test paginating the results of multiple statements.
+    """
+    settings.results_page_size = 1
+    engine = Engine(
+        name="test_engine",
+        type=EngineType.SQLALCHEMY,
+        version="1.0",
+        uri="sqlite://",
+    )
+    catalog = Catalog(name="test_catalog", engines=[engine])
+    session.add(catalog)
+    session.commit()
+    session.refresh(catalog)
+
+    query_create = QueryCreate(
+        catalog_name=catalog.name,
+        engine_name=engine.name,
+        engine_version=engine.version,
+        submitted_query="SELECT 1 AS col; SELECT 2 AS col WHERE 1 = 0; SELECT 3 AS col",
+    )
+    response = client.post(
+        "/queries/",
+        data=query_create.json(),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+    )
+    data = response.json()
+    assert [(result["rows"], result["row_count"]) for result in data["results"]] == [
+        ([[1]], 1),
+    ]
+
+    data = client.get(data["next"]).json()
+    assert [(result["sql"], result["rows"]) for result in data["results"]] == [
+        ("SELECT 2 AS col WHERE 1 = 0", []),
+        ("SELECT 3 AS col", [[3]]),
+    ]
+    assert data["next"] is None
+
+
 @mock.patch("djqs.engine.duckdb.connect")
 def test_submit_duckdb_query(
     mock_duckdb_connect,
@@ -670,7 +772,7 @@ def test_submit_snowflake_query(
     Test submitting a Snowflake query
     """
     mock_exec = mock.MagicMock()
-    mock_exec.fetchall.return_value = [[1, "a"]]
+    mock_exec.fetchmany.side_effect = [[[1, "a"]], []]
     mock_cur = mock.MagicMock()
     mock_cur.execute.return_value = mock_exec
     mock_conn = mock.MagicMock()
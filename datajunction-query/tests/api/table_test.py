@@ -1,7 +1,14 @@
 """
 Tests for the catalog API.
 """
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlmodel import Session
+
+from djqs.api.helpers import get_schema_columns
+from djqs.exceptions import DJException
+from djqs.models.engine import Engine, EngineType
 
 
 def test_table_columns(client: TestClient, mocker):
@@ -64,3 +71,129 @@ def test_raise_on_invalid_table_name(client: TestClient):
         "errors": [],
         "warnings": [],
     }
+
+
+def test_schema_columns(client: TestClient, tmp_path):
+    """
+    Test getting the columns of many tables in a schema at once
+    """
+    uri = f"sqlite:///{tmp_path / 'reflection.db'}"
+    with create_engine(uri).begin() as connection:
+        connection.execute(text("CREATE TABLE foo (col_a VARCHAR, col_b INTEGER)"))
+        connection.execute(text("CREATE TABLE bar (col_c FLOAT)"))
+    response = client.post(
+        "/engines/",
+        json={"name": "sqlite", "type": "sqlalchemy", "version": "", "uri": uri},
+    )
+    assert response.status_code == 201
+
+    response = client.post(
+        "/schema/db.main/columns/?engine=sqlite&engine_version=",
+        json={"tables": ["foo", "baz"]},
+    )
+    assert response.json() == {
+        "name": "db.main",
+        "tables": [
+            {
+                "name": "db.main.foo",
+                "columns": [
+                    {"name": "col_a", "type": "STR"},
+                    {"name": "col_b", "type": "INT"},
+                ],
+            },
+        ],
+        "missing": ["db.main.baz"],
+    }
+
+    # Without a list of tables, all tables in the schema are returned
+    response = client.post(
+        "/schema/db.main/columns/?engine=sqlite&engine_version=",
+        json={},
+    )
+    assert {table["name"] for table in response.json()["tables"]} == {
+        "db.main.foo",
+        "db.main.bar",
+    }
+
+    response = client.post(
+        "/schema/db.other/columns/?engine=sqlite&engine_version=",
+        json={},
+    )
+    assert response.status_code == 404
+    assert response.headers["X-DJ-Error"] == "true"
+    assert response.json()["message"] == "No such schema `other` in catalog `db`"
+
+    response = client.post("/schema/main/columns/", json={})
+    assert response.status_code == 422
+    assert response.json()["message"] == (
+        "The provided schema value `main` is invalid. A valid value for `schema` "
+        "must be in the format `<catalog>.<schema>`"
+    )
+
+
+def test_schema_columns_without_uri(session: Session):
+    """
+    Test that schema columns can't be retrieved from an engine without a uri
+    """
+    with pytest.raises(DJException) as excinfo:
+        get_schema_columns(
+            engine=Engine(name="empty", type=EngineType.SQLALCHEMY, version=""),
+            catalog="db",
+            schema="main",
+        )
+    assert str(excinfo.value) == "Cannot retrieve columns without a uri"
+
+
+def test_schema_fingerprints(client: TestClient, tmp_path):
+    """
+    Test fingerprinting many tables in a schema at once
+    """
+    uri = f"sqlite:///{tmp_path / 'reflection.db'}"
+    with create_engine(uri).begin() as connection:
+        connection.execute(text("CREATE TABLE foo (col_a VARCHAR, col_b INTEGER)"))
+        connection.execute(text("CREATE TABLE bar (col_a VARCHAR, col_b INTEGER)"))
+    response = client.post(
+        "/engines/",
+        json={"name": "sqlite", "type": "sqlalchemy", "version": "", "uri": uri},
+    )
+    assert response.status_code == 201
+
+    def fingerprints():
+        response = client.post(
+            "/schema/db.main/fingerprints/?engine=sqlite&engine_version=",
+            json={"tables": ["foo", "bar", "baz"]},
+        )
+        assert response.status_code == 200
+        assert response.json()["missing"] == ["db.main.baz"]
+        return response.json()["fingerprints"]
+
+    # Tables with the same columns have the same fingerprint
+    before = fingerprints()
+    assert before["db.main.foo"] == before["db.main.bar"]
+    assert fingerprints() == before
+
+    with create_engine(uri).begin() as connection:
+        connection.execute(text("ALTER TABLE foo ADD COLUMN col_c FLOAT"))
+    after = fingerprints()
+    assert after["db.main.foo"] != before["db.main.foo"]
+    assert after["db.main.bar"] == before["db.main.bar"]
+
+    # Only the columns of tables with a different fingerprint than the caller's are
+    # returned
+    response = client.post(
+        "/schema/db.main/fingerprints/?engine=sqlite&engine_version=",
+        json={
+            "tables": ["foo", "bar"],
+            "fingerprints": {"foo": before["db.main.foo"], "bar": after["db.main.bar"]},
+        },
+    )
+    assert response.json()["tables"] == [
+        {
+            "name": "db.main.foo",
+            "columns": [
+                {"name": "col_a", "type": "STR"},
+                {"name": "col_b", "type": "INT"},
+                {"name": "col_c", "type": "FLOAT"},
+            ],
+        },
+    ]
@@ -0,0 +1,118 @@
+"""
+Tests for ``djqs.engine``.
+"""
+# pylint: disable=protected-access
+
+import uuid
+
+import duckdb
+import pytest
+from cachelib.simple import SimpleCache
+from pytest_mock import MockerFixture
+from sqlalchemy import text
+
+from djqs.config import Settings
+from djqs.engine import EngineRegistry, ResultPages
+from djqs.models.engine import Engine, EngineType
+
+
+@pytest.fixture
+def registry() -> EngineRegistry:
+    """
+    An engine registry with default settings.
+    """
+    registry = EngineRegistry(Settings())
+    yield registry
+    registry.dispose()
+
+
+def test_sqlalchemy_engines_are_reused(registry: EngineRegistry) -> None:
+    """
+    Test that engines (and their pools) are kept per engine definition.
+    """
+    engine = registry.sqlalchemy_engine("duck", "1.0", "duckdb:///:memory:")
+    assert registry.sqlalchemy_engine("duck", "1.0", "duckdb:///:memory:") is engine
+    assert (
+        registry.sqlalchemy_engine("duck", "1.0", "duckdb:///:memory:", {"a": 1})
+        is not engine
+    )
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).fetchall() == [(1,)]
+
+    stats = registry.stats()
+    assert [(pool["name"], pool["version"]) for pool in stats["engines"]] == [
+        ("duck", "1.0"),
+        ("duck", "1.0"),
+    ]
+    assert stats["duckdb_connections"] == 0
+
+
+def test_pool_args(registry: EngineRegistry) -> None:
+    """
+    Test that pool sizes are only set for dialects with a queue pool.
+    """
+    assert registry.pool_args("sqlite:///djqs.db") == {
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    assert registry.pool_args("postgresql://localhost/db") == {
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+    }
+
+
+def test_duckdb_shared_connection(
+    registry: EngineRegistry,
+    mocker: MockerFixture,
+    tmp_path,
+) -> None:
+    """
+    Test that duckdb database files are shared through one read-only connection.
+    """
+    location = str(tmp_path / "test.duckdb")
+    duckdb.connect(location).close()
+    engine = Engine(
+        name="duckdb",
+        type=EngineType.DUCKDB,
+        version="0.7.1",
+        uri="duckdb://local",
+        extra_params={"location": location},
+    )
+    connect = mocker.spy(duckdb, "connect")
+    with registry.duckdb_connection(engine) as cursor:
+        assert cursor.execute("SELECT 1").fetchall() == [(1,)]
+    with registry.duckdb_connection(engine) as cursor:
+        assert cursor.execute("SELECT 2").fetchall() == [(2,)]
+    assert connect.call_count == 1
+    assert registry.stats()["duckdb_connections"] == 1
+
+    # A broken shared connection is replaced
+    registry.duckdb_connections[location].close()
+    with registry.duckdb_connection(engine) as cursor:
+        assert cursor.execute("SELECT 3").fetchall() == [(3,)]
+    assert connect.call_count == 2
+
+    # Without sharing, every query gets its own connection
+    registry.settings.duckdb_shared_connection = False
+    with registry.duckdb_connection(engine) as conn:
+        assert conn.execute("SELECT 4").fetchall() == [(4,)]
+    assert connect.call_count == 3
+
+
+def test_result_pages_discard() -> None:
+    """
+    Test that pages written for a failed query are replaced with empty results.
+    """
+    settings = Settings(results_backend=SimpleCache(), results_page_size=1)
+    query_id = uuid.uuid4()
+    pages = ResultPages(settings, query_id)
+    pages.add("SELECT 1", [], iter([(1,), (2,), (3,)]))
+    assert pages.pages == 2
+    assert settings.results_backend.has(f"{query_id}/1")
+
+    pages.discard()
+    assert settings.results_backend.get(str(query_id)) == "[]"
+    assert not settings.results_backend.has(f"{query_id}/1")
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     # Set the number of seconds to wait in between polling
     polling_interval: int = 3600
 
+    # Set the number of source nodes to refresh with each reflection task
+    refresh_batch_size: int = 500
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,5 +1,6 @@
 """Reflection service celery tasks."""
 from abc import ABC
+from typing import List
 
 import celery
 import requests
@@ -31,7 +32,9 @@ class ReflectionServiceTask(celery.Task, ABC):
 def refresh():
     """
     Find available DJ nodes and kick off reflection tasks for
-    nodes with associated tables.
+    nodes with associated tables. Source nodes are refreshed in
+    batches, so that the core service can introspect the tables
+    of each schema together.
     """
     settings = get_settings()
     response = requests.get(
@@ -39,17 +42,47 @@ def refresh():
         timeout=30,
     )
     response.raise_for_status()
-    source_nodes = response.json()
+    # Sorting keeps nodes in the same namespace, and thus usually the same
+    # schema, in the same batch
+    source_nodes = sorted(response.json())
 
     tasks = []
-    for node_name in source_nodes:
+    for idx in range(0, len(source_nodes), settings.refresh_batch_size):
         task = celery_app.send_task(
-            "datajunction_reflection.worker.tasks.reflect_source",
-            (node_name,),
+            "datajunction_reflection.worker.tasks.reflect_sources",
+            (source_nodes[idx : idx + settings.refresh_batch_size],),
         )
         tasks.append(task)
 
 
+@shared_task(
+    queue="celery",
+    name="datajunction_reflection.worker.tasks.reflect_sources",
+    base=ReflectionServiceTask,
+)
+def reflect_sources(
+    node_names: List[str],
+):
+    """
+    This reflects the state of many source nodes' associated tables
+    back to the DJ core service with a single bulk refresh.
+    """
+    logger.info(f"Refreshing {len(node_names)} source nodes in DJ core")
+    settings = get_settings()
+
+    response = requests.post(
+        f"{settings.core_service}/nodes/refresh/",
+        json=node_names,
+        timeout=600,
+    )
+
+    logger.info(
+        "Finished refreshing %s source nodes. Response: %s",
+        len(node_names),
+        response.reason,
+    )
+
+
 @shared_task(
     queue="celery",
     name="datajunction_reflection.worker.tasks.reflect_source",
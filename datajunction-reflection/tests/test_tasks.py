@@ -1,7 +1,11 @@
 """Tests the celery app."""
 from unittest.mock import call
 
-from datajunction_reflection.worker.tasks import reflect_source, refresh
+from datajunction_reflection.worker.tasks import (
+    reflect_source,
+    reflect_sources,
+    refresh,
+)
 
 
 def test_refresh(celery_app, mocker):
@@ -16,7 +20,7 @@ def test_refresh(celery_app, mocker):
 
     assert {
         "datajunction_reflection.worker.app.refresh",
-        "datajunction_reflection.worker.tasks.reflect_source",
+        "datajunction_reflection.worker.tasks.reflect_sources",
     }.intersection(
         celery_app.tasks.keys(),
     )
@@ -39,3 +43,27 @@ def test_reflect_source(celery_app, mocker, freezer):  # pylint: disable=unused-
     assert mock_dj_refresh.call_args_list == [
         call("http://dj:8000/nodes/postgres.test.revenue/refresh/", timeout=30),
     ]
+
+
+def test_reflect_sources(
+    celery_app,
+    mocker,
+    freezer,
+):  # pylint: disable=unused-argument
+    """
+    Tests the bulk reflection task.
+    """
+    mock_dj_refresh = mocker.patch("requests.post")
+    mock_dj_refresh.return_value.status = 201
+
+    reflect_sources.apply(
+        args=(["postgres.test.revenue", "postgres.test.costs"],),
+    ).get()
+
+    assert mock_dj_refresh.call_args_list == [
+        call(
+            "http://dj:8000/nodes/refresh/",
+            json=["postgres.test.revenue", "postgres.test.costs"],
+            timeout=600,
+        ),
+    ]
@@ -0,0 +1,32 @@
+"""Index queryrequest.query_id
+
+Revision ID: 3b1e0c9d7a52
+Revises: f3c9b40deb6f
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+# pylint: disable=no-member, invalid-name, missing-function-docstring, unused-import, no-name-in-module
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b1e0c9d7a52"
+down_revision = "f3c9b40deb6f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("queryrequest", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_queryrequest_query_id"),
+            ["query_id"],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("queryrequest", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_queryrequest_query_id"))
@@ -0,0 +1,30 @@
+"""Add column_fingerprint to noderevision
+
+Revision ID: 8d4f2e6a1c3b
+Revises: 3b1e0c9d7a52
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+# pylint: disable=no-member, invalid-name, missing-function-docstring, unused-import, no-name-in-module
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8d4f2e6a1c3b"
+down_revision = "3b1e0c9d7a52"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("noderevision", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("column_fingerprint", sa.String(), nullable=True),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("noderevision", schema=None) as batch_op:
+        batch_op.drop_column("column_fingerprint")
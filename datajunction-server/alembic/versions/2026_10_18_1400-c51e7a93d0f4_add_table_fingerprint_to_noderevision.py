@@ -0,0 +1,30 @@
+"""Add table_fingerprint to noderevision
+
+Revision ID: c51e7a93d0f4
+Revises: 8d4f2e6a1c3b
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+"""
+# pylint: disable=no-member, invalid-name, missing-function-docstring, unused-import, no-name-in-module
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c51e7a93d0f4"
+down_revision = "8d4f2e6a1c3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("noderevision", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("table_fingerprint", sa.String(), nullable=True),
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("noderevision", schema=None) as batch_op:
+        batch_op.drop_column("table_fingerprint")
@@ -19,6 +19,7 @@ from datajunction_server.api.sql import get_node_sql
 from datajunction_server.database.availabilitystate import AvailabilityState
 from datajunction_server.database.history import ActivityType, EntityType, History
 from datajunction_server.database.node import Node, NodeRevision
+from datajunction_server.database.queryrequest import QueryBuildType, QueryRequest
 from datajunction_server.database.user import User
 from datajunction_server.errors import (
     DJException,
@@ -34,11 +35,15 @@ from datajunction_server.internal.engines import get_engine
 from datajunction_server.models import access
 from datajunction_server.models.node import AvailabilityStateBase
 from datajunction_server.models.node_type import NodeType
-from datajunction_server.models.query import QueryCreate, QueryWithResults
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.models.query import (
+    ColumnMetadata,
+    QueryCreate,
+    QueryWithResults,
+)
+from datajunction_server.service_clients import AsyncQueryServiceClient
 from datajunction_server.utils import (
     get_and_update_current_user,
-    get_query_service_client,
+    get_async_query_service_client,
     get_session,
     get_settings,
 )
@@ -174,7 +179,9 @@ async def get_data(  # pylint: disable=too-many-locals
     ),
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     engine_name: Optional[str] = None,
     engine_version: Optional[str] = None,
     current_user: User = Depends(get_and_update_current_user),
@@ -220,11 +227,15 @@ async def get_data(  # pylint: disable=too-many-locals
         submitted_query=query.sql,
         async_=async_,
     )
-    result = query_service_client.submit_query(
+    result = await query_service_client.submit_query(
         query_create,
         request_headers=request_headers,
     )
+
+    # Save the external query id reference, so that clients can poll by it
     query_request.query_id = result.id
+    session.add(query_request)
+    await session.commit()
 
     # Inject column info if there are results
     if result.results.__root__:  # pragma: no cover
@@ -245,7 +256,9 @@ async def get_data_stream_for_node(  # pylint: disable=R0914, R0913
     ),
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     engine_name: Optional[str] = None,
     engine_version: Optional[str] = None,
     current_user: User = Depends(get_and_update_current_user),
@@ -307,7 +320,7 @@ async def get_data_stream_for_node(  # pylint: disable=R0914, R0913
         submitted_query=query.sql,
         async_=True,
     )
-    initial_query_info = query_service_client.submit_query(
+    initial_query_info = await query_service_client.submit_query(
         query_create,
         request_headers=request_headers,
     )
@@ -333,18 +346,23 @@ async def get_data_stream_for_node(  # pylint: disable=R0914, R0913
     response_model=QueryWithResults,
     name="Get Data For Query ID",
 )
-def get_data_for_query(
+async def get_data_for_query(
     query_id: str,
     *,
+    session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
 ) -> QueryWithResults:
     """
-    Return data for a specific query ID.
+    Return the state and data for a specific query ID. This is the handle returned
+    by the data endpoints, so polling it only checks on the submitted query and
+    never rebuilds or resubmits its SQL.
     """
     request_headers = dict(request.headers)
     try:
-        return query_service_client.get_query(
+        result = await query_service_client.get_query(
             query_id=query_id,
             request_headers=request_headers,
         )
@@ -354,6 +372,16 @@ def get_data_for_query(
             http_status_code=HTTPStatus.NOT_FOUND,
         ) from exc
 
+    # Inject column info from the original request if there are results
+    if result.results.__root__:
+        query_request = await QueryRequest.get_by_query_id(session, query_id)
+        if query_request and query_request.columns:
+            result.results.__root__[0].columns = [
+                ColumnMetadata(**column)
+                for column in query_request.columns  # type: ignore
+            ]
+    return result
+
 
 @router.get("/data/", response_model=QueryWithResults, name="Get Data For Metrics")
 async def get_data_for_metrics(  # pylint: disable=R0914, R0913
@@ -366,7 +394,9 @@ async def get_data_for_metrics(  # pylint: disable=R0914, R0913
     *,
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     engine_name: Optional[str] = None,
     engine_version: Optional[str] = None,
     current_user: User = Depends(get_and_update_current_user),
@@ -403,11 +433,29 @@ async def get_data_for_metrics(  # pylint: disable=R0914, R0913
         submitted_query=translated_sql.sql,
         async_=async_,
     )
-    result = query_service_client.submit_query(
+    result = await query_service_client.submit_query(
         query_create,
         request_headers=request_headers,
     )
 
+    # Save the external query id reference, so that clients can poll by it
+    query_request = await QueryRequest.save_query_request(
+        session=session,
+        query_type=QueryBuildType.METRICS,
+        nodes=metrics,
+        dimensions=dimensions,
+        filters=filters,
+        engine_name=engine_name,
+        engine_version=engine_version,
+        limit=limit,
+        orderby=orderby,
+        query=translated_sql.sql,
+        columns=[col.dict() for col in translated_sql.columns or []],
+    )
+    query_request.query_id = result.id
+    session.add(query_request)
+    await session.commit()
+
     # Inject column info if there are results
     if result.results.__root__:  # pragma: no cover
         result.results.__root__[0].columns = translated_sql.columns or []
@@ -424,7 +472,9 @@ async def get_data_stream_for_metrics(  # pylint: disable=R0914, R0913
     *,
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     engine_name: Optional[str] = None,
     engine_version: Optional[str] = None,
 ) -> QueryWithResults:
@@ -451,7 +501,7 @@ async def get_data_stream_for_metrics(  # pylint: disable=R0914, R0913
         async_=True,
     )
     # Submits the query, equivalent to calling POST /data/ directly
-    initial_query_info = query_service_client.submit_query(
+    initial_query_info = await query_service_client.submit_query(
         query_create,
         request_headers=request_headers,
     )
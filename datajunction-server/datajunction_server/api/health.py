@@ -2,14 +2,16 @@
 Application healthchecks.
 """
 
-from typing import List
+from typing import Dict, List
 
 from fastapi import APIRouter, Depends
 from pydantic.main import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from datajunction_server.database.queryrequest import get_query_request_cache
 from datajunction_server.enum import StrEnum
+from datajunction_server.sql.parsing.backends.antlr4 import parse_cache
 from datajunction_server.utils import get_session, get_settings
 
 settings = get_settings()
@@ -62,3 +64,14 @@ async def health_check(
             status=await database_health(session),
         ),
     ]
+
+
+@router.get("/health/cache/", response_model=Dict[str, Dict[str, int]])
+async def cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Hit/miss metrics for the in-process caches.
+    """
+    return {
+        "query_requests": get_query_request_cache().stats(),
+        "parse": parse_cache.info(),
+    }
@@ -21,6 +21,7 @@ from datajunction_server.construction.build import (
     build_materialized_cube_node,
     build_metric_nodes,
     build_node,
+    build_temp_select,
     get_default_criteria,
     rename_columns,
     validate_shared_dimensions,
@@ -52,13 +53,15 @@ from datajunction_server.internal.engines import get_engine
 from datajunction_server.models import access
 from datajunction_server.models.attribute import RESERVED_ATTRIBUTE_NAMESPACE
 from datajunction_server.models.history import status_change_history
+from datajunction_server.models.materialization import GenericCubeConfig, MetricMeasures
 from datajunction_server.models.metric import TranslatedSQL
 from datajunction_server.models.node import NodeStatus
 from datajunction_server.models.node_type import NodeType
 from datajunction_server.models.query import ColumnMetadata, QueryWithResults
 from datajunction_server.naming import LOOKUP_CHARS
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import AsyncQueryServiceClient
 from datajunction_server.sql.parsing import ast
+from datajunction_server.sql.parsing.backends.antlr4 import parse
 from datajunction_server.typing import END_JOB_STATES
 from datajunction_server.utils import SEPARATOR
 
@@ -66,6 +69,9 @@ _logger = logging.getLogger(__name__)
 
 COLUMN_NAME_REGEX = r"([A-Za-z0-9_\.]+)(\[[A-Za-z0-9_]+\])?"
 
+# Aggregations that can be re-aggregated from partial aggregates at a finer grain
+ADDITIVE_AGGREGATIONS = {"sum", "min", "max"}
+
 
 async def get_node_namespace(  # pylint: disable=too-many-arguments
     session: AsyncSession,
@@ -321,6 +327,7 @@ async def resolve_downstream_references(
 
             await session.refresh(downstream_node_revision, ["columns"])
             downstream_node_revision.columns = node_validator.columns
+            downstream_node_revision.update_column_fingerprint()
             if node_validator.status == NodeStatus.VALID:
                 newly_valid_nodes.append(downstream_node_revision)
             session.add(downstream_node_revision)
@@ -545,15 +552,148 @@ def validate_orderby(
         )
 
 
+def is_additive_combiner(
+    metric_measures: MetricMeasures,
+    materialization_name: str = "default",
+) -> bool:
+    """
+    Whether a metric can be re-aggregated from its materialized measures at a coarser
+    grain, i.e., the combiner only re-aggregates measures with additive aggregations
+    (SUM, MIN, MAX). Ratios of sums, for example, are fine, while AVG or COUNT(DISTINCT)
+    over already-aggregated rows are not.
+
+    The default materialization declares each measure's aggregation, which the combiner
+    has to re-apply, so that e.g. the MAX of a SUM measure isn't re-aggregated. Other
+    materializations reference their measures by field name and don't record how they
+    are aggregated, so the metric's own aggregation of each measure is used instead.
+    """
+    measures = {
+        (
+            measure.name if materialization_name == "default" else measure.field_name
+        ): measure
+        for measure in metric_measures.measures
+    }
+    combiner = parse(f"SELECT {metric_measures.combiner}")
+    for function in combiner.find_all(ast.Function):
+        try:
+            is_aggregation = function.function().is_aggregation
+        except DJException:  # pragma: no cover
+            return False
+        if is_aggregation and (
+            function.name.name.lower() not in ADDITIVE_AGGREGATIONS
+            or function.quantifier
+        ):
+            return False
+    for column in combiner.find_all(ast.Column):
+        aggregation = column.parent
+        while aggregation is not None and not (
+            isinstance(aggregation, ast.Function)
+            and aggregation.function().is_aggregation
+        ):
+            aggregation = aggregation.parent
+        measure = measures.get(column.alias_or_name.name)
+        if aggregation is None or measure is None:
+            return False
+        if (
+            materialization_name == "default"
+            and aggregation.name.name.lower() != measure.agg.lower()
+        ):
+            return False
+    return True
+
+
+def cube_dimension_columns(cube: NodeRevision) -> List[str]:
+    """
+    The names of the dimension columns of a materialized cube
+    """
+    return [
+        (node_revision.name + SEPARATOR + element.name).replace(
+            SEPARATOR,
+            f"_{LOOKUP_CHARS.get(SEPARATOR)}_",
+        )
+        for element, node_revision in cube.cube_elements_with_nodes()
+        if node_revision and node_revision.type != NodeType.METRIC
+    ]
+
+
+def can_answer_from_cube(  # pylint: disable=too-many-return-statements
+    cube: NodeRevision,
+    metric_columns: List[Column],
+    dimension_columns: List[Column],
+    filters: List[str],
+    materialized: bool,
+) -> bool:
+    """
+    Whether a query for these metrics, dimensions and filters can be answered by the
+    cube. The cube needs to have all of the metrics and a superset of the dimensions,
+    including any dimensions that are filtered on. If the query groups by fewer
+    dimensions than the cube, it is at a coarser grain even if it filters on the rest,
+    so the metrics need to be re-aggregatable from the cube's measures.
+    """
+    elements = {
+        (node_revision.name, element.name)
+        for element, node_revision in cube.cube_elements_with_nodes()
+        if node_revision
+    }
+    if any(
+        (col.node_revision().name, col.name) not in elements  # type: ignore
+        for col in metric_columns + dimension_columns
+    ):
+        return False
+
+    cube_dimensions = set(cube_dimension_columns(cube))
+    group_by_dimensions = {
+        (col.node_revision().name + SEPARATOR + col.name).replace(  # type: ignore
+            SEPARATOR,
+            f"_{LOOKUP_CHARS.get(SEPARATOR)}_",
+        )
+        for col in dimension_columns
+    }
+    filter_dimensions = {
+        col.identifier(False)
+        for filter_ in filters
+        for col in build_temp_select(f"select * where {filter_}").find_all(
+            ast.Column,
+        )
+    }
+    if not (group_by_dimensions | filter_dimensions) <= cube_dimensions:
+        return False
+    if not materialized:
+        return True
+    if not cube.materializations or not cube.availability:
+        return False
+
+    materialization = cube.materializations[0]
+    measures = GenericCubeConfig.parse_obj(materialization.config).measures or {}
+    for col in metric_columns:
+        metric_key = (
+            col.name
+            if materialization.name == "default"
+            else col.node_revision().name  # type: ignore
+        )
+        if metric_key not in measures:
+            return False
+        if group_by_dimensions != cube_dimensions and not is_additive_combiner(
+            measures[metric_key],
+            materialization.name,
+        ):
+            return False
+    return True
+
+
 async def find_existing_cube(
     session: AsyncSession,
     metric_columns: List[Column],
     dimension_columns: List[Column],
     materialized: bool = True,
+    filters: Optional[List[str]] = None,
 ) -> Optional[NodeRevision]:
     """
-    Find an existing cube with these metrics and dimensions, if any.
-    If `materialized` is set, it will only look for materialized cubes.
+    Find an existing cube that can answer a query for these metrics and dimensions,
+    if any. Any cube with all of the metrics and a superset of the dimensions is a
+    candidate, and the cheapest one is picked, i.e., the one with the fewest
+    dimensions, since it is at the coarsest grain. If `materialized` is set, it will
+    only look for materialized cubes that can be re-aggregated to the query's grain.
     """
     element_names = [col.name for col in (metric_columns + dimension_columns)]
     statement = select(Node).join(
@@ -568,21 +708,38 @@ async def find_existing_cube(
     for name in element_names:
         statement = statement.filter(
             NodeRevision.cube_elements.any(Column.name == name),  # type: ignore  # pylint: disable=no-member
-        ).options(
-            joinedload(Node.current).options(
-                joinedload(NodeRevision.materializations),
-                joinedload(NodeRevision.availability),
-            ),
         )
+    statement = statement.options(
+        joinedload(Node.current).options(
+            joinedload(NodeRevision.materializations),
+            joinedload(NodeRevision.availability),
+            selectinload(NodeRevision.cube_elements).selectinload(
+                Column.node_revisions,
+            ),
+        ),
+    )
 
     existing_cubes = (await session.execute(statement)).unique().scalars().all()
-    for cube in existing_cubes:
-        if not materialized or (  # pragma: no cover
-            materialized and cube.current.materializations and cube.current.availability
-        ):
-            return cube.current
-
-    return None
+    candidates = [
+        cube.current
+        for cube in existing_cubes
+        if can_answer_from_cube(
+            cube.current,
+            metric_columns,
+            dimension_columns,
+            filters or [],
+            materialized,
+        )
+    ]
+    return min(
+        candidates,
+        key=lambda cube: (
+            len(cube_dimension_columns(cube)),
+            len(cube.cube_elements),
+            cube.name,
+        ),
+        default=None,
+    )
 
 
 async def build_sql_for_multiple_metrics(  # pylint: disable=too-many-arguments,too-many-locals
@@ -630,6 +787,7 @@ async def build_sql_for_multiple_metrics(  # pylint: disable=too-many-arguments,
         metric_columns,
         dimension_columns,
         materialized=True,
+        filters=filters,
     )
     if cube:
         catalog = await get_catalog_by_name(session, cube.availability.catalog)  # type: ignore
@@ -730,22 +888,28 @@ async def build_sql_for_multiple_metrics(  # pylint: disable=too-many-arguments,
     )
 
 
-async def query_event_stream(  # pylint: disable=too-many-arguments
+async def query_event_stream(  # pylint: disable=too-many-arguments,too-many-locals
     query: QueryWithResults,
     request_headers: Optional[Dict[str, str]],
-    query_service_client: QueryServiceClient,
+    query_service_client: AsyncQueryServiceClient,
     columns: List[Column],
     request,
     timeout: float = 0.0,
-    stream_delay: float = 0.5,
     retry_timeout: int = 5000,
+    check_interval: float = 1.0,
 ):
     """
-    A generator of events from a query submitted to the query service
+    A generator of events from a query submitted to the query service. The query is
+    watched through the client's shared watcher, so any number of streams on the same
+    query only poll the query service once.
+
+    While waiting on the next update, the stream checks every `check_interval` seconds
+    whether the client has disconnected or the timeout has passed, so a stalled query
+    doesn't keep the stream open.
     """
     starting_time = time.time()
-    # Start with query and query_next as the initial state of the query
-    query_prev = query_next = query
+    # Start with query as the initial state of the query
+    query_prev = query
     query_id = query_prev.id
     _logger.info("sending initial event to the client for query %s", query_id)
     yield {
@@ -754,46 +918,71 @@ async def query_event_stream(  # pylint: disable=too-many-arguments
         "retry": retry_timeout,
         "data": json.dumps(query.json()),
     }
-    # Continuously check the query until it's complete
-    while not timeout or (time.time() - starting_time < timeout):
-        # Check if the client closed the connection
-        if await request.is_disconnected():  # pragma: no cover
-            _logger.error("connection closed by the client")
-            break
-
-        # Check the current state of the query
-        query_next = query_service_client.get_query(  # type: ignore # pragma: no cover
-            query_id=query_id,
-            request_headers=request_headers,
-        )
-        if query_next.state in END_JOB_STATES:  # pragma: no cover
-            _logger.info(  # pragma: no cover
-                "query end state detected (%s), sending final event to the client",
-                query_next.state,
-            )
-            if query_next.results.__root__:  # pragma: no cover
-                query_next.results.__root__[0].columns = columns or []
-            yield {
-                "event": "message",
-                "id": uuid.uuid4(),
-                "retry": retry_timeout,
-                "data": json.dumps(query_next.json()),
-            }
-            _logger.info("connection closed by the server")
-            break
-        if query_prev != query_next:  # pragma: no cover
-            _logger.info(
-                "query information has changed, sending an event to the client",
-            )
-            yield {
-                "event": "message",
-                "id": uuid.uuid4(),
-                "retry": retry_timeout,
-                "data": json.dumps(query_next.json()),
-            }
-
-            query = query_next
-        await asyncio.sleep(stream_delay)  # pragma: no cover
+    # Push every change to the query until it's complete
+    updates = query_service_client.watcher.subscribe(query_id, request_headers)
+    next_update: Optional[asyncio.Future] = None
+    try:
+        while True:
+            # Check if the client closed the connection
+            if await request.is_disconnected():
+                _logger.error("connection closed by the client")
+                break
+            wait = check_interval
+            if timeout:
+                remaining = timeout - (time.time() - starting_time)
+                if remaining <= 0:
+                    _logger.info("timed out waiting on query %s", query_id)
+                    break
+                wait = min(wait, remaining)
+
+            if next_update is None:
+                # The anext() built-in is only available from Python 3.10
+                next_update = asyncio.ensure_future(
+                    updates.__anext__(),  # pylint: disable=unnecessary-dunder-call
+                )
+            done, _ = await asyncio.wait({next_update}, timeout=wait)
+            if not done:
+                continue
+            update, next_update = next_update, None
+            try:
+                query_next = update.result()
+            except StopAsyncIteration:
+                break
+
+            if query_next.state in END_JOB_STATES:
+                _logger.info(
+                    "query end state detected (%s), sending final event to the client",
+                    query_next.state,
+                )
+                # The update is shared with other subscribers, so copy it before
+                # injecting this stream's column info
+                query_next = query_next.copy(deep=True)
+                if query_next.results.__root__:
+                    query_next.results.__root__[0].columns = columns or []
+                yield {
+                    "event": "message",
+                    "id": uuid.uuid4(),
+                    "retry": retry_timeout,
+                    "data": json.dumps(query_next.json()),
+                }
+                _logger.info("connection closed by the server")
+                break
+            if query_prev != query_next:
+                _logger.info(
+                    "query information has changed, sending an event to the client",
+                )
+                yield {
+                    "event": "message",
+                    "id": uuid.uuid4(),
+                    "retry": retry_timeout,
+                    "data": json.dumps(query_next.json()),
+                }
+                query_prev = query_next
+    finally:
+        if next_update is not None:
+            next_update.cancel()
+            await asyncio.wait({next_update})
+        await updates.aclose()
 
 
 async def build_sql_for_dj_query(  # pylint: disable=too-many-arguments,too-many-locals
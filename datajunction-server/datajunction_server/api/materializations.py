@@ -8,6 +8,7 @@ from http import HTTPStatus
 from typing import List
 
 from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
@@ -148,7 +149,8 @@ async def upsert_materialization(  # pylint: disable=too-many-locals
             )
             await session.commit()
             await session.refresh(existing_materialization)
-        existing_materialization_info = query_service_client.get_materialization_info(
+        existing_materialization_info = await run_in_threadpool(
+            query_service_client.get_materialization_info,
             node_name,
             current_revision.version,  # type: ignore
             new_materialization.name,  # type: ignore
@@ -256,7 +258,8 @@ async def list_node_materializations(
     materializations = []
     for materialization in node.current.materializations:  # type: ignore
         if not materialization.deactivated_at or show_deleted:  # pragma: no cover
-            info = query_service_client.get_materialization_info(
+            info = await run_in_threadpool(
+                query_service_client.get_materialization_info,
                 node_name,
                 node.current.version,  # type: ignore
                 materialization.name,  # type: ignore
@@ -295,7 +298,8 @@ async def deactivate_node_materializations(
     """
     request_headers = dict(request.headers)
     node = await Node.get_by_name(session, node_name)
-    query_service_client.deactivate_materialization(
+    await run_in_threadpool(
+        query_service_client.deactivate_materialization,
         node_name,
         materialization_name,
         request_headers=request_headers,
@@ -407,7 +411,7 @@ async def run_materialization_backfill(  # pylint: disable=too-many-locals
             f"Materialization job {materialization.job} does not exist",
         )
 
-    materialization_output = clazz().run_backfill(  # type: ignore
+    materialization_output = await clazz().run_backfill(  # type: ignore
         materialization,
         backfill_partitions,
         query_service_client,
@@ -2,6 +2,7 @@
 """
 Node related APIs.
 """
+import asyncio
 import logging
 import os
 from http import HTTPStatus
@@ -26,7 +27,6 @@ from datajunction_server.api.helpers import (
 from datajunction_server.api.namespaces import create_node_namespace
 from datajunction_server.api.tags import get_tags_by_name
 from datajunction_server.constants import NODE_LIST_MAX
-from datajunction_server.database import DimensionLink
 from datajunction_server.database.attributetype import ColumnAttribute
 from datajunction_server.database.column import Column
 from datajunction_server.database.history import ActivityType, EntityType, History
@@ -36,7 +36,6 @@ from datajunction_server.database.user import User
 from datajunction_server.errors import (
     DJActionNotAllowedException,
     DJAlreadyExistsException,
-    DJDoesNotExistException,
     DJException,
     DJInvalidInputException,
     ErrorCode,
@@ -55,12 +54,17 @@ from datajunction_server.internal.nodes import (
     deactivate_node,
     get_column_level_lineage,
     get_node_column,
+    get_schema_changed_table_columns,
+    group_source_nodes_by_schema,
     hard_delete_node,
+    refresh_schema_source_nodes,
+    refresh_source_node_revision,
     remove_dimension_link,
     revalidate_node,
     save_column_level_lineage,
     save_node,
     set_node_column_attributes,
+    source_table_unchanged,
     update_any_node,
     upsert_complex_dimension_link,
 )
@@ -82,6 +86,7 @@ from datajunction_server.models.node import (
     LineageColumn,
     NodeIndexItem,
     NodeMode,
+    NodeNameList,
     NodeOutput,
     NodeRevisionBase,
     NodeRevisionOutput,
@@ -89,6 +94,7 @@ from datajunction_server.models.node import (
     NodeStatusDetails,
     NodeValidation,
     NodeValidationError,
+    RefreshedSourceNodes,
     UpdateNode,
 )
 from datajunction_server.models.node_type import NodeType
@@ -97,7 +103,10 @@ from datajunction_server.models.partition import (
     PartitionInput,
     PartitionType,
 )
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import (
+    AsyncQueryServiceClient,
+    QueryServiceClient,
+)
 from datajunction_server.sql.dag import (
     _node_output_options,
     get_dimensions,
@@ -105,10 +114,10 @@ from datajunction_server.sql.dag import (
     get_filter_only_dimensions,
     get_upstream_nodes,
 )
-from datajunction_server.sql.parsing.backends.antlr4 import parse, parse_rule
+from datajunction_server.sql.parsing.backends.antlr4 import parse
 from datajunction_server.utils import (
-    Version,
     get_and_update_current_user,
+    get_async_query_service_client,
     get_namespace_from_name,
     get_query_service_client,
     get_session,
@@ -685,7 +694,9 @@ async def register_table(
     *,
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     current_user: User = Depends(get_and_update_current_user),
     background_tasks: BackgroundTasks,
 ) -> NodeOutput:
@@ -712,7 +723,7 @@ async def register_table(
 
     # Use reflection to get column names and types
     _catalog = await get_catalog_by_name(session=session, name=catalog)
-    columns = query_service_client.get_columns_for_table(
+    columns = await query_service_client.get_columns_for_table(
         _catalog.name,
         schema_,
         table,
@@ -945,6 +956,74 @@ async def tags_node(
     )
 
 
+@router.post(
+    "/nodes/refresh/",
+    response_model=RefreshedSourceNodes,
+    status_code=201,
+)
+async def refresh_source_nodes(
+    data: NodeNameList,
+    *,
+    session: AsyncSession = Depends(get_session),
+    request: Request,
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
+    current_user: User = Depends(get_and_update_current_user),
+) -> RefreshedSourceNodes:
+    """
+    Refresh many source nodes with the latest columns from the query service. Nodes
+    are grouped by the catalog and schema of their tables, and each schema is
+    introspected with a single request to the query service. Tables whose fingerprint
+    is unchanged since the last refresh are skipped without fetching their columns.
+    Nodes in a schema that the query service fails to introspect are reported as
+    failed, without failing the rest.
+    """
+    request_headers = dict(request.headers)
+    names = set(data.__root__)
+    source_nodes = [
+        node
+        for node in await Node.get_by_names(
+            session,
+            list(names),
+            options=[
+                joinedload(Node.current).options(*NodeRevision.default_load_options()),
+            ],
+        )
+        if node.type == NodeType.SOURCE
+    ]
+    result = RefreshedSourceNodes(
+        not_found=sorted(names - {node.name for node in source_nodes}),
+    )
+
+    schemas = group_source_nodes_by_schema(source_nodes)
+    schema_tables = await asyncio.gather(
+        *(
+            get_schema_changed_table_columns(
+                query_service_client,
+                nodes,
+                request_headers,
+            )
+            for nodes in schemas.values()
+        ),
+        return_exceptions=True,
+    )
+    refresh_schema_source_nodes(
+        session,
+        schemas,
+        schema_tables,
+        current_user,
+        result,
+    )
+    await session.commit()
+
+    # Refreshed nodes point to new revisions now
+    for node in source_nodes:
+        if node.name in result.refreshed:
+            session.expire(node, ["current"])
+    return result
+
+
 @router.post(
     "/nodes/{name}/refresh/",
     response_model=NodeOutput,
@@ -955,7 +1034,9 @@ async def refresh_source_node(
     *,
     session: AsyncSession = Depends(get_session),
     request: Request,
-    query_service_client: QueryServiceClient = Depends(get_query_service_client),
+    query_service_client: AsyncQueryServiceClient = Depends(
+        get_async_query_service_client,
+    ),
     current_user: User = Depends(get_and_update_current_user),
 ) -> NodeOutput:
     """
@@ -972,102 +1053,27 @@ async def refresh_source_node(
     )
     current_revision = source_node.current  # type: ignore
 
-    # Get the latest columns for the source node's table from the query service
-    new_columns = []
-    try:
-        new_columns = query_service_client.get_columns_for_table(
-            current_revision.catalog.name,
-            current_revision.schema_,  # type: ignore
-            current_revision.table,  # type: ignore
-            request_headers,
-            current_revision.catalog.engines[0]
-            if len(current_revision.catalog.engines) >= 1
-            else None,
-        )
-    except DJDoesNotExistException:
-        # continue with the update, if the table was not found
-        pass
-
-    refresh_details = {}
-    if new_columns:
-        # check if any of the columns have changed (only continue with update if they have)
-        column_changes = {col.identifier() for col in current_revision.columns} != {
-            (col.name, str(parse_rule(str(col.type), "dataType")))
-            for col in new_columns
-        }
-
-        # if the columns haven't changed and the node has a table, we can skip the update
-        if not column_changes:
-            if not source_node.missing_table:  # type: ignore
-                return source_node  # type: ignore
-            # if the columns haven't changed but the node has a missing table, we should fix it
-            source_node.missing_table = False  # type: ignore
-            refresh_details["missing_table"] = "False"
-    else:
-        # since we don't see any columns, we'll assume the table is gone
-        source_node.missing_table = True  # type: ignore
-        new_columns = current_revision.columns
-        refresh_details["missing_table"] = "True"
-
-    # Create a new node revision with the updated columns and bump the version
-    old_version = Version.parse(source_node.current_version)  # type: ignore
-    new_revision = NodeRevision(
-        name=current_revision.name,
-        type=current_revision.type,
-        node_id=current_revision.node_id,
-        display_name=current_revision.display_name,
-        description=current_revision.description,
-        mode=current_revision.mode,
-        catalog_id=current_revision.catalog_id,
-        schema_=current_revision.schema_,
-        table=current_revision.table,
-        status=current_revision.status,
-        dimension_links=[
-            DimensionLink(
-                dimension_id=link.dimension_id,
-                join_sql=link.join_sql,
-                join_type=link.join_type,
-                join_cardinality=link.join_cardinality,
-                materialization_conf=link.materialization_conf,
-            )
-            for link in current_revision.dimension_links
-        ],
-        created_by_id=current_user.id,
+    # Skip the node if the query service reports the same table as at the last refresh,
+    # or get the latest columns for its table otherwise
+    fingerprints, columns = await get_schema_changed_table_columns(
+        query_service_client,
+        [source_node],  # type: ignore
+        request_headers,
     )
-    new_revision.version = str(old_version.next_major_version())
-    new_revision.columns = [
-        Column(
-            name=column.name,
-            type=column.type,
-            node_revisions=[new_revision],
-            order=idx,
-        )
-        for idx, column in enumerate(new_columns)
-    ]
-
-    # Keep the dimension links and attributes on the columns from the node's
-    # last revision if any existed
-    new_revision.copy_dimension_links_from_revision(current_revision)
+    table_fingerprint = fingerprints.get(current_revision.table)  # type: ignore
+    if source_table_unchanged(source_node, table_fingerprint):  # type: ignore
+        return source_node  # type: ignore
 
-    # Point the source node to the new revision
-    source_node.current_version = new_revision.version  # type: ignore
-    new_revision.extra_validation()
-
-    session.add(new_revision)
-    session.add(source_node)
-
-    refresh_details["version"] = new_revision.version
-    session.add(
-        History(
-            entity_type=EntityType.NODE,
-            entity_name=source_node.name,  # type: ignore
-            node=source_node.name,  # type: ignore
-            activity_type=ActivityType.REFRESH,
-            details=refresh_details,
-            user=current_user.username,
-        ),
+    new_revision = refresh_source_node_revision(
+        session,
+        source_node,  # type: ignore
+        columns.get(current_revision.table, []),  # type: ignore
+        current_user,
+        table_fingerprint,
     )
     await session.commit()
+    if not new_revision:
+        return source_node  # type: ignore
 
     source_node = await Node.get_by_name(
         session,
@@ -25,7 +25,7 @@ from datajunction_server.models import access
 from datajunction_server.models.access import AccessControlStore
 from datajunction_server.models.metric import TranslatedSQL
 from datajunction_server.models.node_type import NodeType
-from datajunction_server.models.sql import GeneratedSQL
+from datajunction_server.models.sql import GeneratedSQL, MeasuresSQLRequest
 from datajunction_server.models.user import UserOutput
 from datajunction_server.utils import (
     Settings,
@@ -177,6 +177,45 @@ async def get_measures_sql_for_cube_v2(
     return measures_query
 
 
+@router.post(
+    "/sql/measures/v2/batch/",
+    response_model=List[List[GeneratedSQL]],
+    name="Get Measures SQL In Batch",
+)
+async def get_measures_sql_batch(
+    requests: List[MeasuresSQLRequest],
+    *,
+    settings: Settings = Depends(get_settings),  # pylint: disable=redefined-outer-name
+    session: AsyncSession = Depends(get_session),
+    engine_name: Optional[str] = None,
+    engine_version: Optional[str] = None,
+    current_user: Optional[User] = Depends(get_and_update_current_user),
+    validate_access: access.ValidateAccessFn = Depends(  # pylint: disable=W0621
+        validate_access,
+    ),
+) -> List[List[GeneratedSQL]]:
+    """
+    Return the measures SQL for each of a list of metrics, dimensions and filters
+    combinations, in the same order as the requests. This is equivalent to calling
+    ``GET /sql/measures/v2`` once per request, but identical requests are built once
+    and the builds share the loaded nodes and any parent node queries they have in
+    common.
+    """
+    from datajunction_server.construction.build_v2 import (  # pylint: disable=import-outside-toplevel,line-too-long
+        get_measures_queries,
+    )
+
+    return await get_measures_queries(
+        session=session,
+        requests=requests,
+        engine_name=engine_name,
+        engine_version=engine_version,
+        current_user=current_user,
+        validate_access=validate_access,
+        sql_transpilation_library=settings.sql_transpilation_library,
+    )
+
+
 async def build_and_save_node_sql(  # pylint: disable=too-many-locals
     node_name: str,
     dimensions: List[str] = Query([]),
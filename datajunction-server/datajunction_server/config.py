@@ -54,6 +54,15 @@ class Settings(
     # Query service
     query_service: Optional[str] = None
 
+    # Async query service client: request timeout (in seconds), retries for requests
+    # that fail to connect or get a retryable status, the size of the connection pool
+    # and how many requests can be in flight at once
+    query_service_timeout = 30.0
+    query_service_retries = 2
+    query_service_max_connections = 100
+    query_service_max_keepalive_connections = 20
+    query_service_max_concurrency = 50
+
     # The namespace where source nodes for registered tables should exist
     source_node_namespace: Optional[str] = "source"
 
@@ -91,6 +100,14 @@ class Settings(
     # Interval in seconds with which to expire caching of any indexes
     index_cache_expire = 60
 
+    # Size and TTL (in seconds) of the in-process cache in front of saved query requests
+    query_request_cache_size = 4096
+    query_request_cache_ttl = 3600
+
+    # How many downstream nodes are validated at once, each with its own session, when
+    # changes to a node are propagated down the DAG
+    node_validation_concurrency = 8
+
     # SQLAlchemy engine config
     db_pool_size = 20
     db_max_overflow = 20
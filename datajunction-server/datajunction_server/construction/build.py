@@ -9,6 +9,7 @@ from typing import DefaultDict, Deque, Dict, List, Optional, Set, Tuple, Union,
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from datajunction_server.construction.snapshots import NodeSnapshot
 from datajunction_server.construction.utils import to_namespaced_name
 from datajunction_server.database import Engine
 from datajunction_server.database.column import Column
@@ -1037,7 +1038,10 @@ def _deduplicate_filters(
     return filter_asts
 
 
-def rename_columns(built_ast: ast.Query, node: NodeRevision):
+def rename_columns(
+    built_ast: ast.Query,
+    node: Union[NodeRevision, NodeSnapshot],
+):
     """
     Rename columns in the built ast to fully qualified column names.
     """
@@ -1120,9 +1124,9 @@ async def validate_shared_dimensions(
     """
     Determine if dimensions are shared.
     """
-    shared_dimensions = [
+    shared_dimensions = {
         dim.name for dim in await get_shared_dimensions(session, metric_nodes)
-    ]
+    }
     for dimension_attribute in dimensions:
         if dimension_attribute not in shared_dimensions:
             message = (
@@ -1213,6 +1217,7 @@ async def build_metric_nodes(
 
     for parent_node, metrics in common_parents.items():
         # parent_node_ = await Node.get_by_name(session, parent_node.name)
+        await session.refresh(parent_node, attribute_names=["current"])
         parent_ast = await build_node(
             session=session,
             node=parent_node.current,
@@ -1608,7 +1613,6 @@ async def get_measures_query(
     """
     from datajunction_server.api.helpers import (  # pylint: disable=import-outside-toplevel
         assemble_column_metadata,
-        validate_cube,
     )
 
     engine = (
@@ -1619,6 +1623,61 @@ async def get_measures_query(
     build_criteria = BuildCriteria(
         dialect=engine.dialect if engine and engine.dialect else Dialect.SPARK,
     )
+    combined_ast = await build_measures_query(
+        session,
+        metrics,
+        dimensions,
+        filters,
+        current_user,
+        validate_access,
+        build_criteria=build_criteria,
+        cast_timestamp_to_ms=cast_timestamp_to_ms,
+        include_all_columns=include_all_columns,
+    )
+
+    # Assemble column metadata
+    columns_metadata = []
+    for col in combined_ast.select.projection:
+        metadata = assemble_column_metadata(  # pragma: no cover
+            cast(ast.Column, col),
+        )
+        columns_metadata.append(metadata)
+    dependencies, _ = await combined_ast.extract_dependencies(
+        CompileContext(session, DJException()),
+    )
+    return TranslatedSQL(
+        sql=str(combined_ast),
+        columns=columns_metadata,
+        dialect=build_criteria.dialect,
+        upstream_tables=[
+            f"{dep.catalog.name}.{dep.schema_}.{dep.table}"
+            for dep in dependencies
+            if dep.type == NodeType.SOURCE
+        ],
+    )
+
+
+async def build_measures_query(  # pylint: disable=too-many-locals
+    session: AsyncSession,
+    metrics: List[str],
+    dimensions: List[str],
+    filters: List[str],
+    current_user: User,
+    validate_access: access.ValidateAccessFn,
+    build_criteria: Optional[BuildCriteria] = None,
+    cast_timestamp_to_ms: bool = False,
+    include_all_columns: bool = False,
+) -> ast.Query:
+    """
+    Builds the measures query AST for a set of metrics with dimensions and filters.
+    The projection is typed and carries semantic metadata, so callers can compose it
+    into larger queries without rendering it to SQL and parsing it back.
+    """
+    from datajunction_server.api.helpers import (  # pylint: disable=import-outside-toplevel
+        validate_cube,
+    )
+
+    build_criteria = build_criteria or BuildCriteria(dialect=Dialect.SPARK)
     access_control = access.AccessControlStore(
         validate_access=validate_access,
         user=current_user,
@@ -1799,24 +1858,4 @@ async def get_measures_query(
                 .set_semantic_type(SemanticType.TIMESTAMP)
             )
             combined_ast.select.projection.append(col)
-
-    # Assemble column metadata
-    columns_metadata = []
-    for col in combined_ast.select.projection:
-        metadata = assemble_column_metadata(  # pragma: no cover
-            cast(ast.Column, col),
-        )
-        columns_metadata.append(metadata)
-    dependencies, _ = await combined_ast.extract_dependencies(
-        CompileContext(session, DJException()),
-    )
-    return TranslatedSQL(
-        sql=str(combined_ast),
-        columns=columns_metadata,
-        dialect=build_criteria.dialect,
-        upstream_tables=[
-            f"{dep.catalog.name}.{dep.schema_}.{dep.table}"
-            for dep in dependencies
-            if dep.type == NodeType.SOURCE
-        ],
-    )
+    return combined_ast
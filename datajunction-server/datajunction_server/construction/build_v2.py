@@ -3,15 +3,19 @@
 import collections
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import DefaultDict, Dict, List, Optional, Union, cast
+from typing import DefaultDict, Dict, List, Optional, Tuple, Union, cast
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from datajunction_server.construction.snapshots import (
+    DimensionLinkSnapshot,
+    NodeSnapshot,
+    NodeSnapshots,
+)
 from datajunction_server.construction.utils import to_namespaced_name
 from datajunction_server.database import Engine
-from datajunction_server.database.dimensionlink import DimensionLink
 from datajunction_server.database.node import NodeRevision
 from datajunction_server.database.user import User
 from datajunction_server.errors import (
@@ -26,7 +30,7 @@ from datajunction_server.models.column import SemanticType
 from datajunction_server.models.engine import Dialect
 from datajunction_server.models.node import BuildCriteria
 from datajunction_server.models.node_type import NodeType
-from datajunction_server.models.sql import GeneratedSQL
+from datajunction_server.models.sql import GeneratedSQL, MeasuresSQLRequest
 from datajunction_server.naming import amenable_name, from_amenable_name
 from datajunction_server.sql.parsing.ast import CompileContext
 from datajunction_server.sql.parsing.backends.antlr4 import ast, parse
@@ -64,11 +68,58 @@ class DimensionJoin:
     Info on a dimension join
     """
 
-    join_path: List[DimensionLink]
+    join_path: List[DimensionLinkSnapshot]
     requested_dimensions: List[str]
     node_query: Optional[ast.Query] = None
 
 
+@dataclass
+class MeasuresQueryBatch:
+    """
+    State shared by the measures query builds of a batch: the node snapshots, and the
+    measures queries already built for each parent node, keyed by the parent node,
+    requested dimensions and filters, and the measures selected from the parent.
+    """
+
+    snapshots: NodeSnapshots
+    measures_queries: Dict[Tuple, GeneratedSQL] = field(default_factory=dict)
+
+
+async def get_measures_queries(
+    session: AsyncSession,
+    requests: List[MeasuresSQLRequest],
+    engine_name: Optional[str] = None,
+    engine_version: Optional[str] = None,
+    current_user: Optional[User] = None,
+    validate_access: access.ValidateAccessFn = None,
+    sql_transpilation_library: Optional[str] = None,
+) -> List[List[GeneratedSQL]]:
+    """
+    Builds the measures SQL for each of a batch of requests, in order. Identical
+    requests are only built once, and requests share node snapshots as well as the
+    measures queries for any parent nodes built with the same dimensions and filters.
+    """
+    batch = MeasuresQueryBatch(snapshots=NodeSnapshots(session))
+    results: Dict[Tuple, List[GeneratedSQL]] = {}
+    for request in requests:
+        key = request.key()
+        if key not in results:
+            results[key] = await get_measures_query(
+                session=session,
+                metrics=request.metrics,
+                dimensions=request.dimensions,
+                filters=request.filters,
+                engine_name=engine_name,
+                engine_version=engine_version,
+                current_user=current_user,
+                validate_access=validate_access,
+                include_all_columns=request.include_all_columns,
+                sql_transpilation_library=sql_transpilation_library,
+                batch=batch,
+            )
+    return [results[request.key()] for request in requests]
+
+
 async def get_measures_query(  # pylint: disable=too-many-locals
     session: AsyncSession,
     metrics: List[str],
@@ -81,6 +132,7 @@ async def get_measures_query(  # pylint: disable=too-many-locals
     cast_timestamp_to_ms: bool = False,  # pylint: disable=unused-argument
     include_all_columns: bool = False,
     sql_transpilation_library: Optional[str] = None,
+    batch: Optional[MeasuresQueryBatch] = None,
 ) -> List[GeneratedSQL]:
     """
     Builds the measures SQL for a set of metrics with dimensions and filters.
@@ -136,9 +188,26 @@ async def get_measures_query(  # pylint: disable=too-many-locals
     dimensions_without_roles = [matcher.findall(dim)[0][0] for dim in dimensions]
 
     measures_queries = []
+    batch = batch or MeasuresQueryBatch(snapshots=NodeSnapshots(session))
     for parent_node, _ in common_parents.items():  # type: ignore
+        build_key = (
+            parent_node.name,
+            tuple(dimensions),
+            tuple(filters),
+            None
+            if include_all_columns
+            else frozenset(parents_to_measures[parent_node.name]),
+        )
+        if build_key in batch.measures_queries:
+            measures_queries.append(batch.measures_queries[build_key])
+            continue
+
         measure_columns, dimensional_columns = [], []
-        query_builder = await QueryBuilder.create(session, parent_node.current)
+        query_builder = await QueryBuilder.create(
+            session,
+            parent_node.current,
+            snapshots=batch.snapshots,
+        )
         parent_ast = await (
             query_builder.ignore_errors()
             .with_access_control(access_control)
@@ -162,8 +231,7 @@ async def get_measures_query(  # pylint: disable=too-many-locals
                 or from_amenable_name(expr.alias_or_name.identifier(False))  # type: ignore
                 in dimensions_without_roles
             ]
-        await session.refresh(parent_node.current, ["columns"])
-        parent_ast = rename_columns(parent_ast, parent_node.current)
+        parent_ast = rename_columns(parent_ast, query_builder.node_snapshot)
 
         # Sort the selected columns into dimension vs measure columns and
         # generate identifiers for them
@@ -187,21 +255,20 @@ async def get_measures_query(  # pylint: disable=too-many-locals
         dependencies, _ = await parent_ast.extract_dependencies(
             CompileContext(session, DJException()),
         )
-        measures_queries.append(
-            GeneratedSQL(
-                node=parent_node.current,
-                sql_transpilation_library=sql_transpilation_library,
-                sql=str(parent_ast),
-                columns=columns_metadata,
-                dialect=build_criteria.dialect,
-                upstream_tables=[
-                    f"{dep.catalog.name}.{dep.schema_}.{dep.table}"
-                    for dep in dependencies
-                    if dep.type == NodeType.SOURCE
-                ],
-                errors=query_builder.errors,
-            ),
+        batch.measures_queries[build_key] = GeneratedSQL(
+            node=parent_node.current,
+            sql_transpilation_library=sql_transpilation_library,
+            sql=str(parent_ast),
+            columns=columns_metadata,
+            dialect=build_criteria.dialect,
+            upstream_tables=[
+                f"{dep.catalog.name}.{dep.schema_}.{dep.table}"
+                for dep in dependencies
+                if dep.type == NodeType.SOURCE
+            ],
+            errors=query_builder.errors,
         )
+        measures_queries.append(batch.measures_queries[build_key])
     return measures_queries
 
 
@@ -213,14 +280,20 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
     validation, allowing for dynamic node query generation based on runtime conditions.
     """
 
-    def __init__(self, session: AsyncSession, node_revision: NodeRevision):
+    def __init__(
+        self,
+        session: AsyncSession,
+        node_revision: NodeRevision,
+        snapshots: Optional[NodeSnapshots] = None,
+    ):
         self.session = session
         self.node_revision = node_revision
+        self.snapshots = snapshots or NodeSnapshots(session)
 
         self._filters: List[str] = []
-        self._required_dimensions: List[str] = [
-            required.name for required in self.node_revision.required_dimensions
-        ]
+        self._required_dimensions: List[str] = list(
+            self.node_snapshot.required_dimensions,
+        )
         self._dimensions: List[str] = []
         self._orderby: List[str] = []
         self._limit: Optional[int] = None
@@ -242,14 +315,24 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
         cls,
         session: AsyncSession,
         node_revision: NodeRevision,
+        snapshots: Optional[NodeSnapshots] = None,
     ) -> "QueryBuilder":
         """
-        Create a QueryBuilder instance for the node revision.
+        Create a QueryBuilder instance for the node revision. Node snapshots can be
+        shared between builders to avoid loading the same nodes again.
         """
-        await session.refresh(node_revision, ["required_dimensions", "dimension_links"])
-        instance = cls(session, node_revision)
+        snapshots = snapshots or NodeSnapshots(session)
+        await snapshots.load([node_revision])
+        instance = cls(session, node_revision, snapshots)
         return instance
 
+    @property
+    def node_snapshot(self) -> NodeSnapshot:
+        """
+        The snapshot of the node revision being built
+        """
+        return self.snapshots[self.node_revision.id]
+
     def ignore_errors(self):
         """Do not raise on errors in query build."""
         self._ignore_errors = True
@@ -380,7 +463,7 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
         8. Add order by and limit to the final select (TODO)
         """
         node_ast = (
-            await compile_node_ast(self.session, self.node_revision)
+            await compile_node_ast(self.session, self.node_snapshot)
             if not self.physical_table
             else self.create_query_from_physical_table(self.physical_table)
         )
@@ -436,11 +519,12 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
         node_alias = ast.Name(amenable_name(self.node_revision.name))
         return node_alias, await build_ast(
             self.session,
-            self.node_revision,
+            self.node_snapshot,
             node_ast,
             filters=self._filters,
             build_criteria=self._build_criteria,
             ctes_mapping=self.cte_mapping,
+            snapshots=self.snapshots,
         )
 
     def initialize_final_query_ast(self, node_ast, node_alias):
@@ -484,14 +568,13 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
             )
 
             for link in join_path:
-                link = cast(DimensionLink, link)
                 if all(
                     dim in link.foreign_keys_reversed for dim in requested_dimensions
                 ):  # pylint: disable=line-too-long # pragma: no cover
                     continue  # pragma: no cover
 
-                if link.dimension.name in self.cte_mapping:
-                    dimension_join.node_query = self.cte_mapping[link.dimension.name]
+                if link.dimension_name in self.cte_mapping:
+                    dimension_join.node_query = self.cte_mapping[link.dimension_name]
                     continue
 
                 dimension_node_query = await build_dimension_node_query(
@@ -500,14 +583,15 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
                     link,
                     self._filters,
                     self.cte_mapping,
+                    self.snapshots,
                 )
                 dimension_join.node_query = convert_to_cte(
                     dimension_node_query,
                     self.final_ast,
-                    link.dimension.name,
+                    link.dimension_name,
                 )
                 # Add it to the list of CTEs
-                self.cte_mapping[link.dimension.name] = dimension_join.node_query  # type: ignore
+                self.cte_mapping[link.dimension_name] = dimension_join.node_query  # type: ignore
                 self.final_ast.ctes.append(dimension_join.node_query)  # type: ignore
 
                 # Build the join statement
@@ -546,7 +630,7 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
         for dim_name in self.dimensions:
             column_name = get_column_from_canonical_dimension(
                 dim_name,
-                self.node_revision,
+                self.node_snapshot,
             )
             node_col = (
                 self.final_ast.select.column_mapping.get(column_name)
@@ -598,6 +682,7 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
                     self.session,
                     self.node_revision,
                     dimension_attr.name,
+                    self.snapshots,
                 )
                 if not join_path:
                     self.errors.append(
@@ -611,11 +696,7 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
                             context=str(self),
                         ),
                     )
-                if join_path and await needs_dimension_join(
-                    self.session,
-                    dimension_attr.name,
-                    join_path,
-                ):
+                if join_path and needs_dimension_join(dimension_attr.name, join_path):
                     dimension_node_joins[dim_node] = DimensionJoin(
                         join_path=join_path,  # type: ignore
                         requested_dimensions=[dimension_attr.name],
@@ -628,7 +709,7 @@ class QueryBuilder:  # pylint: disable=too-many-instance-attributes,too-many-pub
 
 def get_column_from_canonical_dimension(
     dimension_name: str,
-    node: NodeRevision,
+    node: NodeSnapshot,
 ) -> Optional[str]:
     """
     Gets a column based on a dimension request on a node.
@@ -678,7 +759,8 @@ async def dimension_join_path(
     session: AsyncSession,
     node: NodeRevision,
     dimension: str,
-) -> Optional[List[DimensionLink]]:
+    snapshots: Optional[NodeSnapshots] = None,
+) -> Optional[List[DimensionLinkSnapshot]]:
     """
     Find a join path between this node and the dimension attribute.
     * If there is no possible join path, returns None
@@ -686,37 +768,38 @@ async def dimension_join_path(
     * If it is in one of the dimension nodes on the dimensions graph, return a
     list of dimension links that represent the join path
     """
+    snapshots = snapshots or NodeSnapshots(session)
+    node_snapshot = await snapshots.get(node)
+
     # Check if it is a local dimension
-    if dimension.startswith(node.name):
-        for col in node.columns:  # pragma: no cover
-            # Decide if we should restrict this to only columns marked as dimensional
-            # await session.refresh(col, ["attributes"]) TODO
+    if dimension.startswith(node_snapshot.name):
+        for col in node_snapshot.columns:  # pragma: no cover
+            # Decide if we should restrict this to only columns marked as dimensional,
+            # which needs the column snapshots to carry the columns' attributes
             # if col.is_dimensional():
             #     ...
-            if f"{node.name}.{col.name}" == dimension:
+            if f"{node_snapshot.name}.{col.name}" == dimension:
                 return []
 
     dimension_attr = FullColumnName(dimension)
 
     # If it's not a local dimension, traverse the node's dimensions graph
     # This queue tracks the dimension link being processed and the path to that link
-    await session.refresh(node, ["dimension_links"])
+    await snapshots.load_dimension_graph(node_snapshot)
 
     # Start with first layer of linked dims
     processing_queue = collections.deque(
-        [(link, [link]) for link in node.dimension_links],
+        [(link, [link]) for link in node_snapshot.dimension_links],
     )
     while processing_queue:
         current_link, join_path = processing_queue.pop()
-        await session.refresh(current_link, ["dimension"])
-        if current_link.dimension.name == dimension_attr.node_name:
+        if current_link.dimension_name == dimension_attr.node_name:
             return join_path
-        await session.refresh(current_link.dimension, ["current"])
-        await session.refresh(current_link.dimension.current, ["dimension_links"])
+        dimension_node = snapshots.current(current_link.dimension_name)
         processing_queue.extend(
             [
                 (link, join_path + [link])
-                for link in current_link.dimension.current.dimension_links
+                for link in (dimension_node.dimension_links if dimension_node else ())
             ],
         )
     return None
@@ -725,23 +808,24 @@ async def dimension_join_path(
 async def build_dimension_node_query(
     session: AsyncSession,
     build_criteria: Optional[BuildCriteria],
-    link: DimensionLink,
+    link: DimensionLinkSnapshot,
     filters: List[str],
     cte_mapping: Dict[str, ast.Query],
+    snapshots: NodeSnapshots,
 ):
     """
     Builds a dimension node query with the requested filters
     """
-    await session.refresh(link.dimension, ["current"])
-    await session.refresh(link.dimension.current, ["columns"])
-    dimension_node_ast = await compile_node_ast(session, link.dimension.current)
+    dimension_node = cast(NodeSnapshot, snapshots.current(link.dimension_name))
+    dimension_node_ast = await compile_node_ast(session, dimension_node)
     dimension_node_query = await build_ast(
         session,
-        link.dimension.current,
+        dimension_node,
         dimension_node_ast,
         filters=filters,  # type: ignore
         build_criteria=build_criteria,
         ctes_mapping=cte_mapping,
+        snapshots=snapshots,
     )
     return dimension_node_query
 
@@ -789,11 +873,11 @@ def build_requested_dimensions_columns(
     return dimensions_columns
 
 
-async def compile_node_ast(session, node_revision: NodeRevision) -> ast.Query:
+async def compile_node_ast(session, node: NodeSnapshot) -> ast.Query:
     """
     Parses the node's query into an AST and compiles it.
     """
-    node_ast = parse(node_revision.query)
+    node_ast = node.query_ast()
     ctx = CompileContext(session, DJException())
     await node_ast.compile(ctx)
     return node_ast
@@ -802,7 +886,7 @@ async def compile_node_ast(session, node_revision: NodeRevision) -> ast.Query:
 def build_dimension_attribute(
     full_column_name: str,
     dimension_node_joins: Dict[str, DimensionJoin],
-    link: DimensionLink,
+    link: DimensionLinkSnapshot,
     alias: Optional[str] = None,
 ) -> Optional[ast.Column]:
     """
@@ -838,10 +922,9 @@ def build_dimension_attribute(
     return None  # pragma: no cover
 
 
-async def needs_dimension_join(
-    session: AsyncSession,
+def needs_dimension_join(
     dimension_attribute: str,
-    join_path: List["DimensionLink"],
+    join_path: List[DimensionLinkSnapshot],
 ) -> bool:
     """
     Checks if the requested dimension attribute needs a dimension join or
@@ -849,8 +932,6 @@ async def needs_dimension_join(
     """
     if len(join_path) == 1:
         link = join_path[0]
-        await session.refresh(link.dimension, ["current"])
-        await session.refresh(link.dimension.current, ["columns"])
         if dimension_attribute in link.foreign_keys_reversed:
             return False
     return True
@@ -870,7 +951,7 @@ def combine_filter_conditions(
 
 
 def build_join_for_link(
-    link: "DimensionLink",
+    link: DimensionLinkSnapshot,
     cte_mapping: Dict[str, ast.Query],
     join_right: ast.Query,
 ):
@@ -881,11 +962,11 @@ def build_join_for_link(
     join_ast = link.joins()[0]
     join_ast.right = join_right.alias  # type: ignore
     dimension_node_columns = join_right.select.column_mapping
-    join_left = cte_mapping.get(link.node_revision.name)
+    join_left = cte_mapping.get(link.node_name)
     node_columns = join_left.select.column_mapping  # type: ignore
     for col in join_ast.criteria.find_all(ast.Column):  # type: ignore
         full_column = FullColumnName(col.identifier())
-        is_dimension_node = full_column.node_name == link.dimension.name
+        is_dimension_node = full_column.node_name == link.dimension_name
         replacement = ast.Column(
             name=ast.Name(full_column.column_name),
             _table=join_right if is_dimension_node else join_left,
@@ -899,13 +980,14 @@ def build_join_for_link(
 
 async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
     session: AsyncSession,
-    node: NodeRevision,
+    node: NodeSnapshot,
     query: ast.Query,
     filters: Optional[List[str]],
     memoized_queries: Dict[int, ast.Query] = None,
     build_criteria: Optional[BuildCriteria] = None,
     access_control=None,
     ctes_mapping: Dict[str, ast.Query] = None,
+    snapshots: Optional[NodeSnapshots] = None,
 ) -> ast.Query:
     """
     Recursively replaces DJ node references with query ASTs. These are replaced with
@@ -915,7 +997,7 @@ async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
     This function will apply any filters that can be pushed down to each referenced node's AST
     (filters are only applied if they don't require dimension node joins).
     """
-    await session.refresh(node, ["dimension_links"])
+    snapshots = snapshots or NodeSnapshots(session)
     context = CompileContext(session=session, exception=DJException())
     await query.compile(context)
     query.bake_ctes()  # pylint: disable=W0212
@@ -925,8 +1007,9 @@ async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
         ctes_mapping = new_cte_mapping  # pragma: no cover
 
     node_to_tables_mapping = get_dj_node_references_from_select(query.select)
+    await snapshots.load(node_to_tables_mapping)
     for referenced_node, reference_expressions in node_to_tables_mapping.items():
-        await session.refresh(referenced_node, ["dimension_links"])
+        referenced_snapshot = snapshots[referenced_node.id]
 
         for ref_expr in reference_expressions:
 
@@ -941,16 +1024,17 @@ async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
             if not physical_table:
                 # Build a new CTE with the query AST if there is no materialized table
                 if referenced_node.name not in ctes_mapping:
-                    node_query = parse(cast(str, referenced_node.query))
+                    node_query = referenced_snapshot.query_ast()
                     query_ast = await build_ast(  # type: ignore
                         session,
-                        referenced_node,
+                        referenced_snapshot,
                         node_query,
                         filters=filters,
                         memoized_queries=memoized_queries,
                         build_criteria=build_criteria,
                         access_control=access_control,
                         ctes_mapping=ctes_mapping,
+                        snapshots=snapshots,
                     )
                     cte_name = ast.Name(amenable_name(referenced_node.name))
                     query_ast = query_ast.to_cte(cte_name, parent_ast=query)
@@ -979,7 +1063,7 @@ async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
                 )
                 query_ast.parenthesized = True
                 apply_filters_to_node(
-                    referenced_node,
+                    referenced_snapshot,
                     query_ast,
                     to_filter_asts(filters),
                 )
@@ -1023,7 +1107,7 @@ async def build_ast(  # pylint: disable=too-many-arguments,too-many-locals
 
 
 def apply_filters_to_node(
-    node: NodeRevision,
+    node: NodeSnapshot,
     query: ast.Query,
     filters: List[ast.Expression],
 ):
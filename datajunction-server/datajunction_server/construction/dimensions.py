@@ -6,7 +6,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from datajunction_server.api.helpers import get_catalog_by_name
-from datajunction_server.construction.build import get_measures_query
+from datajunction_server.construction.build import build_measures_query
 from datajunction_server.database.node import NodeRevision
 from datajunction_server.database.user import User
 from datajunction_server.errors import DJInvalidInputException
@@ -95,7 +95,7 @@ async def build_dimensions_from_cube_query(  # pylint: disable=too-many-argument
             query_ast.select.where = temp_filters_select.select.where
     else:
         catalog = cube.catalog
-        measures_query = await get_measures_query(
+        measures_query_ast = await build_measures_query(
             session=session,
             metrics=[metric.name for metric in cube.cube_metrics()],
             dimensions=dimensions,
@@ -103,7 +103,6 @@ async def build_dimensions_from_cube_query(  # pylint: disable=too-many-argument
             current_user=current_user,
             validate_access=validate_access,
         )
-        measures_query_ast = parse(measures_query.sql)
         measures_query_ast.bake_ctes()
         measures_query_ast.parenthesized = True
         query_ast.select.from_.relations.append(  # type: ignore
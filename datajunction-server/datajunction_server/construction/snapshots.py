@@ -0,0 +1,307 @@
+"""
+Read-only snapshots of the nodes that a SQL build touches.
+
+Building a node's SQL walks the same node revisions, dimension links and columns over
+and over. Rather than refreshing ORM relationships one at a time as the builders go, the
+nodes are loaded in bulk into immutable snapshots once per build, and the builders read
+everything they need from those.
+"""
+import collections
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from datajunction_server.database.column import Column
+from datajunction_server.database.dimensionlink import DimensionLink
+from datajunction_server.database.node import (
+    BoundDimensionsRelationship,
+    Node,
+    NodeColumns,
+    NodeRevision,
+)
+from datajunction_server.models.dimensionlink import JoinType
+from datajunction_server.models.node_type import NodeType
+from datajunction_server.sql.parsing.backends.antlr4 import ast, parse
+from datajunction_server.sql.parsing.types import ColumnType
+
+
+@dataclass(frozen=True)
+class ColumnSnapshot:
+    """
+    A column on a node revision
+    """
+
+    name: str
+    type: ColumnType
+
+
+@dataclass(frozen=True)
+class DimensionLinkSnapshot:
+    """
+    A dimension link between a node revision and a dimension node
+    """
+
+    node_name: str
+    dimension_name: str
+    role: Optional[str]
+
+    # A query joining the node to the dimension with this link
+    join_query: str
+
+    # Primary key column(s) on the dimension -> foreign key column(s) on the node
+    foreign_keys_reversed: Dict[str, str] = field(compare=False)
+
+    @classmethod
+    def create(  # pylint: disable=too-many-arguments
+        cls,
+        node_name: str,
+        dimension_name: str,
+        join_type: Optional[JoinType],
+        join_sql: str,
+        role: Optional[str],
+    ) -> "DimensionLinkSnapshot":
+        """
+        Snapshot of a dimension link, working out its foreign keys from the join SQL
+        """
+        join_query = DimensionLink.build_join_query(
+            node_name,
+            dimension_name,
+            join_type,
+            join_sql,
+        )
+        mapping = DimensionLink.join_foreign_key_mapping(
+            cls.parse_joins(join_query)[0],
+            node_name,
+        )
+        return cls(
+            node_name=node_name,
+            dimension_name=dimension_name,
+            role=role,
+            join_query=join_query,
+            foreign_keys_reversed={
+                left.identifier(): right.identifier() for left, right in mapping.items()
+            },
+        )
+
+    @staticmethod
+    def parse_joins(join_query: str) -> List[ast.Join]:
+        """
+        The join ASTs of a dimension link's join query
+        """
+        return parse(join_query).select.from_.relations[-1].extensions  # type: ignore
+
+    def joins(self) -> List[ast.Join]:
+        """
+        Fresh join ASTs for this dimension link
+        """
+        return self.parse_joins(self.join_query)
+
+
+@dataclass(frozen=True)
+class NodeSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    The parts of a node revision that are needed to build SQL for it
+    """
+
+    revision_id: int
+    node_id: int
+    name: str
+    type: NodeType
+    query: Optional[str]
+    columns: Tuple[ColumnSnapshot, ...]
+    required_dimensions: Tuple[str, ...]
+    dimension_links: Tuple[DimensionLinkSnapshot, ...]
+
+    def query_ast(self) -> ast.Query:
+        """
+        A fresh AST of the node's query
+        """
+        return parse(cast(str, self.query))
+
+
+class NodeSnapshots:
+    """
+    The node snapshots loaded for one or more SQL builds, keyed by node revision id.
+    Dimension nodes are also tracked by name, as links reference the dimension node
+    rather than a particular revision of it.
+
+    Snapshots are read straight from the metadata tables and never touch the ORM
+    objects in the session.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.snapshots: Dict[int, NodeSnapshot] = {}
+        self.current_revisions: Dict[str, Optional[int]] = {}
+
+    def __getitem__(self, revision_id: int) -> NodeSnapshot:
+        return self.snapshots[revision_id]
+
+    def current(self, node_name: str) -> Optional[NodeSnapshot]:
+        """
+        The snapshot of the node's current revision, if it has been loaded
+        """
+        revision_id = self.current_revisions.get(node_name)
+        return self.snapshots.get(revision_id) if revision_id else None
+
+    async def get(self, revision: NodeRevision) -> NodeSnapshot:
+        """
+        The snapshot of the node revision, loading it if needed
+        """
+        await self.load([revision])
+        return self.snapshots[revision.id]
+
+    async def load(self, revisions: Iterable[NodeRevision]):
+        """
+        Load snapshots for all of the node revisions that haven't been loaded yet
+        """
+        missing = {revision.id for revision in revisions} - self.snapshots.keys()
+        if missing:
+            await self._load(NodeRevision.id.in_(missing))
+
+    async def load_dimension_graph(self, node: NodeSnapshot):
+        """
+        Load the current revisions of all dimension nodes reachable from the node
+        through dimension links, one round of queries per level of the dimensions graph.
+        """
+        seen: Set[str] = set(self.current_revisions)
+        to_load = {link.dimension_name for link in node.dimension_links} - seen
+        while to_load:
+            seen |= to_load
+            self.current_revisions.update(dict.fromkeys(to_load))
+            for snapshot in await self._load(
+                Node.name.in_(to_load),  # type: ignore  # pylint: disable=no-member
+                current=True,
+            ):
+                self.current_revisions[snapshot.name] = snapshot.revision_id
+            to_load = {
+                link.dimension_name
+                for name in to_load
+                if (dimension := self.current(name))
+                for link in dimension.dimension_links
+            } - seen
+
+    async def _load(self, criterion, current: bool = False) -> List[NodeSnapshot]:
+        """
+        Load snapshots of the node revisions matching the criterion, only considering
+        the nodes' current revisions if requested
+        """
+        revision_filter = (
+            and_(
+                Node.id == NodeRevision.node_id,
+                Node.current_version == NodeRevision.version,
+            )
+            if current
+            else Node.id == NodeRevision.node_id
+        )
+        revisions = (
+            await self.session.execute(
+                select(
+                    NodeRevision.id,
+                    NodeRevision.node_id,
+                    NodeRevision.name,
+                    NodeRevision.type,
+                    NodeRevision.query,
+                )
+                .join(Node, revision_filter)
+                .where(criterion),
+            )
+        ).all()
+        if not revisions:
+            return []
+        revision_ids = [revision.id for revision in revisions]
+        columns = await self._load_columns(revision_ids)
+        required_dimensions = await self._load_required_dimensions(revision_ids)
+        dimension_links = await self._load_dimension_links(
+            {revision.id: revision.name for revision in revisions},
+        )
+
+        snapshots = [
+            NodeSnapshot(
+                revision_id=revision.id,
+                node_id=revision.node_id,
+                name=revision.name,
+                type=revision.type,
+                query=revision.query,
+                columns=tuple(columns[revision.id]),
+                required_dimensions=tuple(required_dimensions[revision.id]),
+                dimension_links=tuple(dimension_links[revision.id]),
+            )
+            for revision in revisions
+        ]
+        self.snapshots.update(
+            {snapshot.revision_id: snapshot for snapshot in snapshots}
+        )
+        return snapshots
+
+    async def _load_columns(
+        self,
+        revision_ids: List[int],
+    ) -> Dict[int, List[ColumnSnapshot]]:
+        """
+        Load the columns of the node revisions, in order
+        """
+        columns = collections.defaultdict(list)
+        for revision_id, name, type_ in await self.session.execute(
+            select(NodeColumns.node_id, Column.name, Column.type)
+            .join(Column, NodeColumns.column_id == Column.id)
+            .where(NodeColumns.node_id.in_(revision_ids))
+            .order_by(NodeColumns.node_id, Column.order),
+        ):
+            columns[revision_id].append(ColumnSnapshot(name, type_))
+        return columns
+
+    async def _load_required_dimensions(
+        self,
+        revision_ids: List[int],
+    ) -> Dict[int, List[str]]:
+        """
+        Load the names of the required dimension columns of the node revisions
+        """
+        required_dimensions = collections.defaultdict(list)
+        for revision_id, name in await self.session.execute(
+            select(BoundDimensionsRelationship.metric_id, Column.name)
+            .join(Column, BoundDimensionsRelationship.bound_dimension_id == Column.id)
+            .where(BoundDimensionsRelationship.metric_id.in_(revision_ids)),
+        ):
+            required_dimensions[revision_id].append(name)
+        return required_dimensions
+
+    async def _load_dimension_links(
+        self,
+        names: Dict[int, str],
+    ) -> Dict[int, List[DimensionLinkSnapshot]]:
+        """
+        Load the dimension links of the node revisions, given by id and node name
+        """
+        dimension_links = collections.defaultdict(list)
+        for (
+            revision_id,
+            dimension_name,
+            join_type,
+            join_sql,
+            role,
+        ) in await self.session.execute(
+            select(
+                DimensionLink.node_revision_id,
+                Node.name,
+                DimensionLink.join_type,
+                DimensionLink.join_sql,
+                DimensionLink.role,
+            )
+            .join(Node, DimensionLink.dimension_id == Node.id)
+            .where(DimensionLink.node_revision_id.in_(list(names)))
+            .order_by(DimensionLink.id),
+        ):
+            dimension_links[revision_id].append(
+                DimensionLinkSnapshot.create(
+                    names[revision_id],
+                    dimension_name,
+                    join_type,
+                    join_sql,
+                    role,
+                ),
+            )
+        return dimension_links
@@ -2,12 +2,11 @@
 Utilities used around construction
 """
 
-from typing import TYPE_CHECKING, Optional, Set, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Set, Union
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
-from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy.orm import Session, joinedload
 
 from datajunction_server.database.node import Node, NodeRevision
 from datajunction_server.errors import DJError, DJErrorException, ErrorCode
@@ -17,40 +16,73 @@ if TYPE_CHECKING:
     from datajunction_server.sql.parsing.ast import Column, Name
 
 
+# Key in ``Session.info`` of the nodes that have been loaded by name in the session
+DJ_NODES = "dj_nodes"
+
+
+def _clear_dj_nodes(session: Session, *args):  # pylint: disable=unused-argument
+    """
+    Forget the nodes loaded in a session once anything is written, as writes can
+    change a node's current revision or create nodes that were missing before
+    """
+    session.info.pop(DJ_NODES, None)
+
+
+for _event in ("after_flush", "after_commit", "after_soft_rollback"):
+    event.listen(Session, _event, _clear_dj_nodes)
+
+
+def _node_load_options():
+    return [joinedload(Node.current).options(*NodeRevision.default_load_options())]
+
+
+async def prefetch_dj_nodes(session: AsyncSession, node_names: Iterable[str]):
+    """
+    Load all of the named nodes that the session hasn't loaded yet in one query, so that
+    ``get_dj_node`` can serve them without going to the database. Names that don't match
+    any node are remembered as missing.
+    """
+    nodes = session.info.setdefault(DJ_NODES, {})
+    missing = {name for name in node_names if name not in nodes}
+    if not missing:
+        return
+    results = (
+        (
+            await session.execute(
+                select(Node)
+                .filter(Node.name.in_(missing))  # type: ignore  # pylint: disable=no-member
+                .options(*_node_load_options()),
+            )
+        )
+        .unique()
+        .scalars()
+        .all()
+    )
+    nodes.update(dict.fromkeys(missing))
+    nodes.update({node.name: node for node in results})
+
+
 async def get_dj_node(
     session: AsyncSession,
     node_name: str,
     kinds: Optional[Set[NodeType]] = None,
     current: bool = True,
 ) -> NodeRevision:
-    """Return the DJ Node with a given name from a set of node types"""
-    query = select(Node).filter(Node.name == node_name)
-    if kinds:
-        query = query.filter(Node.type.in_(kinds))  # type: ignore  # pylint: disable=no-member
-    match = None
-    try:
-        match = (
-            (
-                await session.execute(
-                    query.options(
-                        joinedload(Node.current).options(
-                            *NodeRevision.default_load_options()
-                        ),
-                    ),
-                )
-            )
-            .unique()
-            .scalar_one()
-        )
-    except NoResultFound as no_result_exc:
+    """
+    Return the DJ Node with a given name from a set of node types. Nodes are remembered
+    by the session, so that repeated references to the same node only load it once.
+    """
+    await prefetch_dj_nodes(session, [node_name])
+    match = session.info[DJ_NODES][node_name]
+    if not match or (kinds and match.type not in kinds):
         kind_msg = " or ".join(str(k) for k in kinds) if kinds else ""
         raise DJErrorException(
             DJError(
                 code=ErrorCode.UNKNOWN_NODE,
                 message=f"No node `{node_name}` exists of kind {kind_msg}.",
             ),
-        ) from no_result_exc
-    return match.current if match and current else match
+        )
+    return match.current if current else match
 
 
 async def try_get_dj_node(
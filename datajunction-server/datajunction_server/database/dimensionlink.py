@@ -83,6 +83,31 @@ class DimensionLink(Base):  # pylint: disable=too-few-public-methods
                 return value
         return JoinType.LEFT  # pragma: no cover
 
+    def join_query(self) -> str:
+        """
+        The SQL of a query that joins the node to the dimension with this link
+        """
+        return self.build_join_query(
+            self.node_revision.name,
+            self.dimension.name,
+            self.join_type,
+            self.join_sql,
+        )
+
+    @staticmethod
+    def build_join_query(
+        node_name: str,
+        dimension_name: str,
+        join_type: Optional[JoinType],
+        join_sql: str,
+    ) -> str:
+        """
+        The SQL of a query that joins the node to the dimension on the join SQL
+        """
+        return (
+            f"select 1 from {node_name} {join_type} join {dimension_name} on {join_sql}"
+        )
+
     def join_sql_ast(self) -> "ast.Query":
         """
         The join query AST for this dimension link
@@ -90,10 +115,7 @@ class DimensionLink(Base):  # pylint: disable=too-few-public-methods
         # pylint: disable=import-outside-toplevel
         from datajunction_server.sql.parsing.backends.antlr4 import parse
 
-        return parse(
-            f"select 1 from {self.node_revision.name} "
-            f"{self.join_type} join {self.dimension.name} on {self.join_sql}",
-        )
+        return parse(self.join_query())
 
     def joins(self) -> List["ast.Join"]:
         """
@@ -109,13 +131,24 @@ class DimensionLink(Base):  # pylint: disable=too-few-public-methods
         returns a mapping between the foreign keys on the node and the primary keys of
         the dimension based on the join SQL.
         """
+        return self.join_foreign_key_mapping(self.joins()[0], self.node_revision.name)
+
+    @staticmethod
+    def join_foreign_key_mapping(
+        join: "ast.Join",
+        node_name: str,
+    ) -> Dict["ast.Column", "ast.Column"]:
+        """
+        The mapping between the foreign keys on the node and the primary keys of the
+        dimension, based on the equality comparisons in the join criteria
+        """
         # pylint: disable=import-outside-toplevel
         from datajunction_server.sql.parsing.backends.antlr4 import ast
 
         # Find equality comparions (i.e., fact.order_id = dim.order_id)
         equality_comparisons = [
             expr
-            for expr in self.joins()[0].criteria.on.find_all(ast.BinaryOp)  # type: ignore
+            for expr in join.criteria.on.find_all(ast.BinaryOp)  # type: ignore
             if expr.op == ast.BinaryOpKind.Eq
         ]
         mapping = {}
@@ -126,9 +159,9 @@ class DimensionLink(Base):  # pylint: disable=too-few-public-methods
             ):  # pragma: no cover
                 node_left = comp.left.name.namespace.identifier()  # type: ignore
                 node_right = comp.right.name.namespace.identifier()  # type: ignore
-                if node_left == self.node_revision.name:  # pragma: no cover
+                if node_left == node_name:  # pragma: no cover
                     mapping[comp.right] = comp.left
-                if node_right == self.node_revision.name:  # pragma: no cover
+                if node_right == node_name:  # pragma: no cover
                     mapping[comp.left] = comp.right  # pragma: no cover
         return mapping
 
@@ -1,4 +1,5 @@
 """Node database schema."""
+import hashlib
 from datetime import datetime, timezone
 from functools import partial
 from http import HTTPStatus
@@ -532,6 +533,7 @@ class NodeRevision(
         secondary="noderelationship",
         primaryjoin="NodeRevision.id==NodeRelationship.child_id",
         secondaryjoin="Node.id==NodeRelationship.parent_id",
+        order_by="Node.id",
     )
 
     missing_parents: Mapped[List[MissingParent]] = relationship(
@@ -577,9 +579,39 @@ class NodeRevision(
         default=[],
     )
 
+    # A fingerprint of the names and types of the output columns, which is all that
+    # downstream nodes see of this node revision
+    column_fingerprint: Mapped[Optional[str]] = mapped_column(String, default=None)
+
+    # The query service's fingerprint of a source node's table as of the last refresh,
+    # which lets refreshes skip tables that haven't changed
+    table_fingerprint: Mapped[Optional[str]] = mapped_column(String, default=None)
+
     def __hash__(self) -> int:
         return hash(self.id)
 
+    @staticmethod
+    def fingerprint_columns(columns: List[Column]) -> str:
+        """
+        Fingerprint the names and types of a list of columns
+        """
+        signature = "\n".join(f"{column.name} {column.type}" for column in columns)
+        return hashlib.sha256(signature.encode()).hexdigest()
+
+    def update_column_fingerprint(self) -> str:
+        """
+        Recompute the column fingerprint from this node revision's columns
+        """
+        self.column_fingerprint = self.fingerprint_columns(self.columns)
+        return self.column_fingerprint
+
+    def get_column_fingerprint(self) -> str:
+        """
+        The column fingerprint of this node revision. It is computed from the columns for
+        revisions saved before column fingerprints were tracked.
+        """
+        return self.column_fingerprint or self.fingerprint_columns(self.columns)
+
     def primary_key(self) -> List[Column]:
         """
         Returns the primary key columns of this node.
@@ -1,9 +1,13 @@
 """Query request schema."""
+import hashlib
+import json
 from datetime import datetime, timezone
-from functools import partial
+from functools import lru_cache, partial
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from cachelib.base import BaseCache
+from cachetools import LRUCache, TTLCache
 from sqlalchemy import (
     JSON,
     BigInteger,
@@ -28,9 +32,16 @@ from datajunction_server.sql.dag import (
     get_shared_dimensions,
     get_upstream_nodes,
 )
+from datajunction_server.sql.graph_index import GraphIndex
 from datajunction_server.sql.parsing import ast
 from datajunction_server.sql.parsing.backends.antlr4 import parse
 from datajunction_server.typing import UTCDatetime
+from datajunction_server.utils import get_settings
+
+# Versioned request keys, keyed by the raw request and the graph fingerprint at the
+# time they were built. Any change to the graph changes the fingerprint, so stale
+# entries are never hit and simply age out.
+_VERSIONED_REQUESTS: "LRUCache[Tuple, Dict[str, List[str]]]" = LRUCache(maxsize=4096)
 
 
 class QueryBuildType(StrEnum):
@@ -48,6 +59,132 @@ class QueryBuildType(StrEnum):
     NODE = "node"
 
 
+class QueryRequestCache:
+    """
+    Maps versioned query request keys to saved ``queryrequest`` row ids, so that a
+    repeated request is answered with a primary key lookup instead of a JSONB match
+    across the whole request key. Since the key holds the versions of the requested
+    nodes and all of their parents, a new version of any of them is always a miss.
+
+    The in-process tier is a TTL-bounded LRU. If a shared cache (Redis) is configured,
+    it is consulted on local misses and written through on saves.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: int,
+        shared: Optional[BaseCache] = None,
+    ):
+        self.local: TTLCache[str, int] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.shared = shared
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(  # pylint: disable=too-many-arguments
+        query_type: QueryBuildType,
+        versioned_request: Dict[str, List[str]],
+        engine_name: Optional[str],
+        engine_version: Optional[str],
+        limit: Optional[int],
+        other_args: Optional[Dict[str, Any]],
+    ) -> str:
+        """
+        A stable key for a versioned query request.
+        """
+        serialized = json.dumps(
+            [
+                query_type,
+                versioned_request,
+                engine_name,
+                engine_version,
+                limit,
+                other_args or {},
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return "queryrequest:" + hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[int]:
+        """
+        The saved row id for the key, if known to either tier.
+        """
+        row_id = self.local.get(key)
+        if row_id is None and self.shared is not None:
+            row_id = self.shared.get(key)
+            if row_id is not None:
+                self.local[key] = row_id
+        return row_id
+
+    def set(self, key: str, row_id: int) -> None:
+        """
+        Record the saved row id for the key in both tiers.
+        """
+        self.local[key] = row_id
+        if self.shared is not None:
+            self.shared.set(key, row_id, timeout=self.ttl)
+
+    async def lookup(
+        self,
+        session: AsyncSession,
+        key: str,
+    ) -> Optional["QueryRequest"]:
+        """
+        The saved query request for the key, if its row id is cached and the row still
+        has the same key, counting the lookup as a hit or a miss.
+        """
+        row_id = self.get(key)
+        if row_id is not None:
+            query_request = await session.get(QueryRequest, row_id)
+            if query_request and query_request.cache_key() == key:
+                self.hits += 1
+                return query_request
+            self.evict(key)
+        self.misses += 1
+        return None
+
+    def remember(self, query_request: "QueryRequest") -> None:
+        """
+        Record a saved query request under its own key.
+        """
+        self.set(query_request.cache_key(), query_request.id)
+
+    def evict(self, key: str) -> None:
+        """
+        Drop the key from both tiers.
+        """
+        self.local.pop(key, None)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Hit/miss counters for the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.local),
+            "maxsize": int(self.local.maxsize),
+        }
+
+
+@lru_cache(maxsize=None)
+def get_query_request_cache() -> QueryRequestCache:
+    """
+    The process-wide query request cache.
+    """
+    settings = get_settings()
+    return QueryRequestCache(
+        maxsize=settings.query_request_cache_size,
+        ttl=settings.query_request_cache_ttl,
+        shared=settings.cache,
+    )
+
+
 class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-methods
     """
     A query request represents a request for DJ to build a query.
@@ -160,7 +297,28 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
         default=partial(datetime.now, timezone.utc),
     )
     # External identifier for the query
-    query_id: Mapped[Optional[str]]
+    query_id: Mapped[Optional[str]] = mapped_column(index=True)
+
+    def cache_key(self) -> str:
+        """
+        The query request cache key for this saved request. A cached row id is only
+        trusted if the row it points to still has the same key, since ids can be
+        reused after rows are deleted or the table is recreated.
+        """
+        return QueryRequestCache.key(
+            self.query_type,  # type: ignore
+            {
+                "nodes": self.nodes,
+                "parents": self.parents,
+                "dimensions": self.dimensions,
+                "filters": self.filters,
+                "orderby": self.orderby,
+            },
+            self.engine_name,
+            self.engine_version,
+            self.limit,
+            self.other_args,  # type: ignore
+        )
 
     @classmethod
     async def get_query_request(
@@ -179,7 +337,7 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
         """
         Retrieves saved query for a node SQL request
         """
-        versioned_request = await cls.to_versioned_query_request(
+        versioned_request = await cls.get_versioned_query_request(
             session,
             nodes,
             dimensions,
@@ -187,6 +345,21 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
             orderby,
             query_type,
         )
+        cache = get_query_request_cache()
+        query_request = await cache.lookup(
+            session,
+            cache.key(
+                query_type,
+                versioned_request,
+                engine_name,
+                engine_version,
+                limit,
+                other_args,
+            ),
+        )
+        if query_request:
+            return query_request
+
         statement = select(cls).where(
             and_(
                 cls.query_type == query_type,
@@ -204,9 +377,28 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
         )
         query_request = (await session.execute(statement)).scalar_one_or_none()
         if query_request:
+            cache.remember(query_request)
             return query_request
         return None
 
+    @classmethod
+    async def get_by_query_id(
+        cls,
+        session: AsyncSession,
+        query_id: str,
+    ) -> Optional["QueryRequest"]:
+        """
+        Retrieves the most recent query request that was submitted to the query
+        service under the given external query id
+        """
+        statement = (
+            select(cls)
+            .where(cls.query_id == query_id)
+            .order_by(cls.updated_at.desc())
+            .limit(1)
+        )
+        return (await session.execute(statement)).scalars().first()
+
     @classmethod
     async def save_query_request(
         cls,
@@ -244,7 +436,7 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
             session.add(query_request)
             await session.commit()
         else:
-            versioned_request = await cls.to_versioned_query_request(
+            versioned_request = await cls.get_versioned_query_request(
                 session,
                 nodes,
                 dimensions,
@@ -264,12 +456,49 @@ class QueryRequest(Base):  # type: ignore  # pylint: disable=too-few-public-meth
                 orderby=versioned_request["orderby"],
                 query=query,
                 columns=columns,
-                other_args=other_args or text("'{}'::jsonb"),
+                other_args=other_args or {},
             )
             session.add(query_request)
             await session.commit()
+            get_query_request_cache().remember(query_request)
         return query_request
 
+    @classmethod
+    async def get_versioned_query_request(
+        cls,
+        session: AsyncSession,
+        nodes: List[str],
+        dimensions: List[str],
+        filters: List[str],
+        orderby: List[str],
+        query_type: QueryBuildType,
+    ) -> Dict[str, List[str]]:
+        """
+        Cheap path to the versioned request key. The key only changes when the graph
+        does, so it is cached by the raw request plus the graph fingerprint and only
+        rebuilt with `to_versioned_query_request` when either one changes.
+        """
+        cache_key = (
+            await GraphIndex.fingerprint(session),
+            query_type,
+            tuple(nodes),
+            tuple(dimensions),
+            tuple(filters),
+            tuple(orderby),
+        )
+        versioned_request = _VERSIONED_REQUESTS.get(cache_key)
+        if versioned_request is None:
+            versioned_request = await cls.to_versioned_query_request(
+                session,
+                nodes,
+                dimensions,
+                filters,
+                orderby,
+                query_type,
+            )
+            _VERSIONED_REQUESTS[cache_key] = versioned_request
+        return {key: list(value) for key, value in versioned_request.items()}
+
     @classmethod
     async def to_versioned_query_request(  # pylint: disable=too-many-locals
         cls,
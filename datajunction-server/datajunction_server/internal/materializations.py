@@ -299,11 +299,12 @@ async def schedule_materialization_jobs(
     for materialization in materializations:
         clazz = materialization_jobs.get(materialization.job)
         if clazz and materialization.name:  # pragma: no cover
-            materialization_to_output[materialization.name] = clazz().schedule(  # type: ignore
+            materialization_info = await clazz().schedule(  # type: ignore
                 materialization,
                 query_service_client,
                 request_headers=request_headers,
             )
+            materialization_to_output[materialization.name] = materialization_info
     return materialization_to_output
 
 
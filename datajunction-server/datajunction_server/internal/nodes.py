@@ -1,15 +1,16 @@
 # pylint: disable=too-many-lines,too-many-arguments
 """Nodes endpoint helper functions"""
+import asyncio
 import logging
 from collections import defaultdict
 from datetime import datetime
 from http import HTTPStatus
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from fastapi import BackgroundTasks
 from fastapi.responses import JSONResponse
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import joinedload, selectinload
 
 from datajunction_server.api.catalogs import UNKNOWN_CATALOG_ID
@@ -23,6 +24,7 @@ from datajunction_server.api.helpers import (
 from datajunction_server.database.attributetype import AttributeType, ColumnAttribute
 from datajunction_server.database.column import Column
 from datajunction_server.database.dimensionlink import DimensionLink
+from datajunction_server.database.engine import Engine
 from datajunction_server.database.history import ActivityType, EntityType, History
 from datajunction_server.database.materialization import Materialization
 from datajunction_server.database.metricmetadata import MetricMetadata
@@ -35,6 +37,7 @@ from datajunction_server.errors import (
     DJException,
     DJInvalidInputException,
     DJNodeNotFound,
+    DJQueryServiceClientException,
     ErrorCode,
 )
 from datajunction_server.internal.materializations import (
@@ -69,21 +72,26 @@ from datajunction_server.models.node import (
     LineageColumn,
     NodeMode,
     NodeStatus,
+    RefreshedSourceNodes,
     UpdateNode,
 )
 from datajunction_server.models.node_type import NodeType
 from datajunction_server.naming import amenable_name, from_amenable_name
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import (
+    AsyncQueryServiceClient,
+    QueryServiceClient,
+)
 from datajunction_server.sql.dag import (
     get_downstream_nodes,
     get_nodes_with_dimension,
-    topological_sort,
+    topological_levels,
 )
 from datajunction_server.sql.parsing import ast
 from datajunction_server.sql.parsing.ast import CompileContext
 from datajunction_server.sql.parsing.backends.antlr4 import parse
+from datajunction_server.sql.parsing.types import parse_column_type
 from datajunction_server.typing import UTCDatetime
-from datajunction_server.utils import SEPARATOR, Version, VersionUpgrade
+from datajunction_server.utils import SEPARATOR, Version, VersionUpgrade, get_settings
 
 _logger = logging.getLogger(__name__)
 
@@ -264,12 +272,14 @@ async def create_node_revision(
     parent_refs = (
         (
             await session.execute(
-                select(Node).where(
+                select(Node)
+                .where(
                     # pylint: disable=no-member
                     Node.name.in_(  # type: ignore
                         new_parents,
                     ),
-                ),
+                )
+                .order_by(Node.id),
             )
         )
         .unique()
@@ -383,6 +393,7 @@ async def save_node(
     )
     node.current_version = node_revision.version
     node_revision.extra_validation()
+    node_revision.update_column_fingerprint()
 
     session.add(node)
     session.add(
@@ -466,6 +477,8 @@ async def copy_to_new_node(
             for missing_parent in old_revision.missing_parents
         ],
         columns=[col.copy() for col in old_revision.columns],
+        column_fingerprint=old_revision.column_fingerprint,
+        table_fingerprint=old_revision.table_fingerprint,
         # TODO: availability and materializations are missing here  # pylint: disable=fixme
         lineage=old_revision.lineage,
         created_by_id=current_user.id,
@@ -580,7 +593,7 @@ async def update_any_node(
     )
 
 
-async def update_node_with_query(
+async def update_node_with_query(  # pylint: disable=too-many-locals
     name: str,
     data: UpdateNode,
     session: AsyncSession,
@@ -622,10 +635,12 @@ async def update_node_with_query(
     node.current_version = new_revision.version  # type: ignore
 
     new_revision.extra_validation()
+    new_revision.update_column_fingerprint()
 
+    update_event = node_update_history_event(new_revision, current_user)
     session.add(new_revision)
     session.add(node)
-    session.add(node_update_history_event(new_revision, current_user))
+    session.add(update_event)
 
     if new_revision.status != old_revision.status:  # type: ignore
         session.add(
@@ -708,6 +723,8 @@ async def update_node_with_query(
         session,
         node,
         current_user=current_user,
+        previous_revision=old_revision,
+        history_event=update_event,
     )
     await session.refresh(node, ["current"])
     await session.refresh(node.current, ["materializations"])  # type: ignore
@@ -882,6 +899,8 @@ async def propagate_update_downstream(  # pylint: disable=too-many-locals
     node: Node,
     *,
     current_user: User,
+    previous_revision: Optional[NodeRevision] = None,
+    history_event: Optional[History] = None,
 ):
     """
     Propagate the updated node's changes to all of its downstream children.
@@ -889,6 +908,13 @@ async def propagate_update_downstream(  # pylint: disable=too-many-locals
     - altered column names: may invalidate downstream nodes
     - altered column types: may invalidate downstream nodes
     - new columns: won't affect downstream nodes
+
+    The downstreams are revalidated one topological level at a time, with the nodes in
+    a level validated concurrently and a single commit per level. A downstream is only
+    revalidated if one of its parents changed, i.e., its status or column fingerprint
+    is different from before. The updated node is compared against `previous_revision`
+    if given, and the number of revalidated and skipped downstreams is recorded on
+    `history_event`.
     """
     _logger.info("Propagating update of node %s downstream", node.name)
     downstreams = await get_downstream_nodes(
@@ -897,58 +923,360 @@ async def propagate_update_downstream(  # pylint: disable=too-many-locals
         include_deactivated=False,
         include_cubes=False,
     )
-    downstreams = topological_sort(downstreams)
+    # The downstreams need to be grouped topologically in order for the updates to be
+    # done in the right order. Otherwise it is possible for a leaf node like a metric to
+    # be updated before its upstreams are updated.
+    levels = topological_levels(downstreams)
     _logger.info(
         "Revalidating the following downstreams %s",
-        [downstream.name for downstream in downstreams],
+        [[downstream.name for downstream in level] for level in levels],
     )
 
-    # The downstreams need to be sorted topologically in order for the updates to be done
-    # in the right order. Otherwise it is possible for a leaf node like a metric to be updated
-    # before its upstreams are updated.
-    for downstream in downstreams:
-        original_node_revision = downstream.current
-        previous_status = original_node_revision.status
-        node_validator = await revalidate_node(
-            downstream.name,
+    changed = set()
+    if (
+        not previous_revision
+        or previous_revision.status != node.current.status
+        or previous_revision.get_column_fingerprint()
+        != node.current.get_column_fingerprint()
+    ):
+        changed.add(node.name)
+
+    revalidated = 0
+    for level in levels:
+        level = [
+            downstream
+            for downstream in level
+            if any(parent.name in changed for parent in downstream.current.parents)
+        ]
+        if not level:
+            continue
+        revalidated += len(level)
+        validators = await validate_nodes_concurrently(
             session,
-            current_user=current_user,
+            [downstream.name for downstream in level],
         )
-
-        # Record history event
-        if (
-            original_node_revision.version != downstream.current_version
-            or previous_status != node_validator.status
+        for downstream in await Node.get_by_names(
+            session,
+            [downstream.name for downstream in level],
         ):
-            event = History(
-                entity_type=EntityType.NODE,
-                entity_name=downstream.name,
-                node=downstream.name,
-                activity_type=ActivityType.UPDATE,
-                details={
-                    "changes": {
-                        "updated_columns": sorted(list(node_validator.updated_columns)),
+            original_node_revision = downstream.current
+            previous_status = original_node_revision.status
+            previous_fingerprint = original_node_revision.get_column_fingerprint()
+            node_validator = validators[downstream.name]
+            node_validator.columns = rebuild_validated_columns(
+                original_node_revision,
+                node_validator.columns,
+            )
+            await update_validated_node(
+                session,
+                downstream,
+                node_validator,
+                current_user=current_user,
+                commit=False,
+            )
+            if (
+                previous_status != node_validator.status
+                or previous_fingerprint != downstream.current.get_column_fingerprint()
+            ):
+                changed.add(downstream.name)
+
+            # Record history event
+            if (
+                original_node_revision.version != downstream.current_version
+                or previous_status != node_validator.status
+            ):
+                event = History(
+                    entity_type=EntityType.NODE,
+                    entity_name=downstream.name,
+                    node=downstream.name,
+                    activity_type=ActivityType.UPDATE,
+                    details={
+                        "changes": {
+                            "updated_columns": sorted(
+                                list(node_validator.updated_columns),
+                            ),
+                        },
+                        "upstream": {
+                            "node": node.name,
+                            "version": node.current_version,
+                        },
+                        "reason": f"Caused by update of `{node.name}` to "
+                        f"{node.current_version}",
                     },
-                    "upstream": {
-                        "node": node.name,
-                        "version": node.current_version,
+                    pre={
+                        "status": previous_status,
+                        "version": original_node_revision.version,
                     },
-                    "reason": f"Caused by update of `{node.name}` to "
-                    f"{node.current_version}",
-                },
-                pre={
-                    "status": previous_status,
-                    "version": original_node_revision.version,
-                },
-                post={
-                    "status": node_validator.status,
-                    "version": downstream.current_version,
-                },
-                user=current_user.username,
-            )
-            session.add(event)
+                    post={
+                        "status": node_validator.status,
+                        "version": downstream.current_version,
+                    },
+                    user=current_user.username,
+                )
+                session.add(event)
         await session.commit()
 
+    _logger.info(
+        "Revalidated %s and skipped %s downstreams of node %s",
+        revalidated,
+        len(downstreams) - revalidated,
+        node.name,
+    )
+    if history_event:
+        history_event.details = {
+            **history_event.details,
+            "downstreams": {
+                "revalidated": revalidated,
+                "skipped": len(downstreams) - revalidated,
+            },
+        }
+        session.add(history_event)
+        await session.commit()
+
+
+def source_table_unchanged(source_node: Node, table_fingerprint: Optional[str]) -> bool:
+    """
+    Whether the query service's fingerprint shows that a source node's table is the
+    same as at its last refresh, in which case its columns don't need to be fetched
+    """
+    return (
+        table_fingerprint is not None
+        and table_fingerprint == source_node.current.table_fingerprint
+        and not source_node.missing_table
+    )
+
+
+async def get_changed_table_columns(  # pylint: disable=too-many-arguments
+    query_service_client: AsyncQueryServiceClient,
+    catalog: str,
+    schema: str,
+    source_nodes: List[Node],
+    request_headers: Optional[Dict[str, str]] = None,
+    engine: Optional[Engine] = None,
+) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+    """
+    Fingerprint the tables of source nodes in one schema, along with the columns of the
+    tables that changed since their nodes were last refreshed. The query service returns
+    the columns of changed tables together with their fingerprints, so that each table
+    is only introspected once. The columns are only fetched separately from query
+    services that leave them out.
+    """
+    fingerprints, columns = await query_service_client.get_table_fingerprints(
+        catalog,
+        schema,
+        [node.current.table for node in source_nodes],  # type: ignore
+        request_headers,
+        engine,
+        fingerprints={
+            node.current.table: node.current.table_fingerprint  # type: ignore
+            for node in source_nodes
+            if node.current.table_fingerprint and not node.missing_table
+        },
+    )
+    changed = [
+        node.current.table
+        for node in source_nodes
+        if node.current.table in fingerprints
+        and node.current.table not in columns
+        and not source_table_unchanged(
+            node,
+            fingerprints[node.current.table],  # type: ignore
+        )
+    ]
+    if changed:
+        columns.update(
+            await query_service_client.get_columns_for_tables(
+                catalog,
+                schema,
+                changed,  # type: ignore
+                request_headers,
+                engine,
+            ),
+        )
+    return fingerprints, columns
+
+
+def group_source_nodes_by_schema(
+    source_nodes: List[Node],
+) -> Dict[Tuple[str, str], List[Node]]:
+    """
+    Group source nodes by the catalog and schema of their tables, ordered by name
+    """
+    schemas: Dict[Tuple[str, str], List[Node]] = defaultdict(list)
+    for node in sorted(source_nodes, key=lambda node: node.name):
+        schemas[(node.current.catalog.name, node.current.schema_)].append(  # type: ignore
+            node,
+        )
+    return schemas
+
+
+async def get_schema_changed_table_columns(
+    query_service_client: AsyncQueryServiceClient,
+    source_nodes: List[Node],
+    request_headers: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+    """
+    Fingerprint the tables of source nodes that share a catalog and schema, along with
+    the columns of the tables that changed. A schema that doesn't exist has no tables.
+    """
+    catalog = source_nodes[0].current.catalog
+    engine = catalog.engines[0] if catalog.engines else None
+    try:
+        return await get_changed_table_columns(
+            query_service_client,
+            catalog.name,
+            source_nodes[0].current.schema_,  # type: ignore
+            source_nodes,
+            request_headers,
+            engine,
+        )
+    except DJDoesNotExistException:
+        # continue with the update, as the schema doesn't exist
+        return {}, {}
+
+
+def refresh_schema_source_nodes(
+    session: AsyncSession,
+    schemas: Dict[Tuple[str, str], List[Node]],
+    schema_tables: List[
+        Union[Tuple[Dict[str, str], Dict[str, List[Column]]], BaseException]
+    ],
+    current_user: User,
+    result: RefreshedSourceNodes,
+) -> None:
+    """
+    Refresh the source nodes of each schema from the schema's tables, recording the
+    outcome for each node on `result`. A schema that the query service failed to
+    introspect only fails its own nodes, but anything else, like the query service
+    not supporting schema introspection at all, fails the whole refresh.
+    """
+    for tables in schema_tables:
+        if isinstance(tables, BaseException) and not isinstance(
+            tables,
+            DJQueryServiceClientException,
+        ):
+            raise tables
+    for nodes, tables in zip(schemas.values(), schema_tables):
+        if isinstance(tables, DJQueryServiceClientException):
+            result.failed.update({node.name: tables.message for node in nodes})
+            continue
+        fingerprints, columns = tables  # type: ignore
+        for node in nodes:
+            table_fingerprint = fingerprints.get(node.current.table)  # type: ignore
+            if not source_table_unchanged(
+                node,
+                table_fingerprint,
+            ) and refresh_source_node_revision(
+                session,
+                node,
+                columns.get(node.current.table, []),  # type: ignore
+                current_user,
+                table_fingerprint,
+            ):
+                result.refreshed.append(node.name)
+            else:
+                result.unchanged.append(node.name)
+
+
+def refresh_source_node_revision(
+    session: AsyncSession,
+    source_node: Node,
+    new_columns: List[Column],
+    current_user: User,
+    table_fingerprint: Optional[str] = None,
+) -> Optional[NodeRevision]:
+    """
+    Bring a source node in line with the latest columns of its table, where no columns
+    means the table is gone. A new major revision is only added when the columns or
+    the missing table state changed. The query service's fingerprint of the table is
+    recorded either way. Returns the new revision, if any, without committing.
+    """
+    current_revision = source_node.current
+    refresh_details = {}
+    if new_columns:
+        # check if any of the columns have changed (only continue with update if they have)
+        column_changes = {col.identifier() for col in current_revision.columns} != {
+            (col.name, str(parse_column_type(str(col.type)))) for col in new_columns
+        }
+
+        # if the columns haven't changed and the node has a table, we can skip the update
+        if not column_changes:
+            if not source_node.missing_table:
+                if current_revision.table_fingerprint != table_fingerprint:
+                    current_revision.table_fingerprint = table_fingerprint
+                    session.add(current_revision)
+                return None
+            # if the columns haven't changed but the node has a missing table, we should fix it
+            source_node.missing_table = False
+            refresh_details["missing_table"] = "False"
+    else:
+        # since we don't see any columns, we'll assume the table is gone
+        source_node.missing_table = True
+        new_columns = current_revision.columns
+        refresh_details["missing_table"] = "True"
+
+    # Create a new node revision with the updated columns and bump the version
+    old_version = Version.parse(source_node.current_version)
+    new_revision = NodeRevision(
+        name=current_revision.name,
+        type=current_revision.type,
+        node_id=current_revision.node_id,
+        display_name=current_revision.display_name,
+        description=current_revision.description,
+        mode=current_revision.mode,
+        catalog_id=current_revision.catalog_id,
+        schema_=current_revision.schema_,
+        table=current_revision.table,
+        status=current_revision.status,
+        dimension_links=[
+            DimensionLink(
+                dimension_id=link.dimension_id,
+                join_sql=link.join_sql,
+                join_type=link.join_type,
+                join_cardinality=link.join_cardinality,
+                materialization_conf=link.materialization_conf,
+            )
+            for link in current_revision.dimension_links
+        ],
+        created_by_id=current_user.id,
+    )
+    new_revision.version = str(old_version.next_major_version())
+    new_revision.table_fingerprint = table_fingerprint
+    new_revision.columns = [
+        Column(
+            name=column.name,
+            type=column.type,
+            node_revisions=[new_revision],
+            order=idx,
+        )
+        for idx, column in enumerate(new_columns)
+    ]
+
+    # Keep the dimension links and attributes on the columns from the node's
+    # last revision if any existed
+    new_revision.copy_dimension_links_from_revision(current_revision)
+
+    # Point the source node to the new revision
+    source_node.current_version = new_revision.version
+    new_revision.extra_validation()
+    new_revision.update_column_fingerprint()
+
+    session.add(new_revision)
+    session.add(source_node)
+
+    refresh_details["version"] = new_revision.version
+    session.add(
+        History(
+            entity_type=EntityType.NODE,
+            entity_name=source_node.name,
+            node=source_node.name,
+            activity_type=ActivityType.REFRESH,
+            details=refresh_details,
+            user=current_user.username,
+        ),
+    )
+    return new_revision
+
 
 def copy_existing_node_revision(old_revision: NodeRevision, current_user: User):
     """
@@ -962,6 +1290,8 @@ def copy_existing_node_revision(old_revision: NodeRevision, current_user: User):
         query=old_revision.query,
         type=old_revision.type,
         columns=old_revision.columns,
+        column_fingerprint=old_revision.column_fingerprint,
+        table_fingerprint=old_revision.table_fingerprint,
         catalog=old_revision.catalog,
         schema_=old_revision.schema_,
         table=old_revision.table,
@@ -1062,7 +1392,16 @@ async def create_node_from_inactive(  # pylint: disable=too-many-arguments
                 session=session,
                 current_user=current_user,
             )
-            return await get_node_by_name(session, data.name, with_current=True)
+            return await Node.get_by_name(
+                session,
+                data.name,
+                options=[
+                    joinedload(Node.current).options(
+                        *NodeRevision.default_load_options()
+                    ),
+                    joinedload(Node.tags),
+                ],
+            )
         except Exception as exc:  # pragma: no cover
             raise DJException(
                 f"Restoring node `{data.name}` failed: {exc}",
@@ -1209,7 +1548,8 @@ async def create_new_revision_from_existing(  # pylint: disable=too-many-locals,
                             new_parents,
                         ),
                     )
-                    .options(joinedload(Node.current)),
+                    .options(joinedload(Node.current))
+                    .order_by(Node.id),
                 )
             )
             .unique()
@@ -1302,12 +1642,9 @@ async def get_column_level_lineage(
         NodeType.SOURCE,
         NodeType.CUBE,
     ):
+        resolver = ColumnLineageResolver(session)
         return [
-            await column_lineage(
-                session,
-                node_revision,
-                col.name,
-            )
+            await resolver.column_lineage(node_revision, col.name)
             for col in node_revision.columns
         ]
     return []
@@ -1321,86 +1658,124 @@ async def column_lineage(
     """
     Helper function to determine the lineage for a column on a node.
     """
-    if node_rev.type == NodeType.SOURCE:
-        return LineageColumn(
+    return await ColumnLineageResolver(session).column_lineage(node_rev, column_name)
+
+
+class ColumnLineageResolver:
+    """
+    Resolves column-level lineage across the node graph. Each node's query is parsed
+    and compiled at most once, no matter how many of its columns are looked up, and
+    the lineage of every node column is memoized, so shared upstream columns are only
+    resolved once across all of the requested columns.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.expressions: Dict[int, Dict[str, Optional[ast.Expression]]] = {}
+        self.lineage: Dict[Tuple[int, str], LineageColumn] = {}
+
+    async def column_expressions(
+        self,
+        node_rev: NodeRevision,
+    ) -> Dict[str, Optional[ast.Expression]]:
+        """
+        The expression behind each output column of the node's compiled query
+        """
+        if node_rev.id in self.expressions:
+            return self.expressions[node_rev.id]
+
+        ctx = CompileContext(self.session, DJException())
+        query = (
+            NodeRevision.format_metric_alias(
+                node_rev.query,  # type: ignore
+                node_rev.name,
+            )
+            if node_rev.type == NodeType.METRIC
+            else node_rev.query
+        )
+        query_ast = parse(query)
+        await query_ast.compile(ctx)
+        query_ast.select.add_aliases_to_unnamed_columns()
+
+        expressions: Dict[str, Optional[ast.Expression]] = {}
+        for column in query_ast.select.projection:
+            if column == ast.Null():  # pragma: no cover
+                continue
+            column_name = column.alias_or_name.name  # type: ignore
+            if column_name in expressions:  # pragma: no cover
+                continue
+            column_or_child = (
+                column.child if isinstance(column, ast.Alias) else column  # type: ignore
+            )
+            expressions[column_name] = (
+                column_or_child.expression  # type: ignore
+                if hasattr(column_or_child, "expression")
+                else column_or_child
+            )
+        self.expressions[node_rev.id] = expressions
+        return expressions
+
+    async def column_lineage(
+        self,
+        node_rev: NodeRevision,
+        column_name: str,
+    ) -> LineageColumn:
+        """
+        Determine the lineage for a column on a node.
+        """
+        key = (node_rev.id, column_name)
+        if key in self.lineage:
+            return self.lineage[key]
+
+        lineage_column = LineageColumn(
+            column_name=column_name,
             node_name=node_rev.name,
             node_type=node_rev.type,
             display_name=node_rev.display_name,
-            column_name=column_name,
             lineage=[],
         )
-
-    ctx = CompileContext(session, DJException())
-    query = (
-        NodeRevision.format_metric_alias(
-            node_rev.query,  # type: ignore
-            node_rev.name,
-        )
-        if node_rev.type == NodeType.METRIC
-        else node_rev.query
-    )
-    query_ast = parse(query)
-    await query_ast.compile(ctx)
-    query_ast.select.add_aliases_to_unnamed_columns()
-
-    lineage_column = LineageColumn(
-        column_name=column_name,
-        node_name=node_rev.name,
-        node_type=node_rev.type,
-        display_name=node_rev.display_name,
-        lineage=[],
-    )
-
-    # Find the expression AST for the column on the node
-    column = [
-        col
-        for col in query_ast.select.projection
-        if (  # pragma: no cover
-            col != ast.Null() and col.alias_or_name.name == column_name  # type: ignore
-        )
-    ][0]
-    column_or_child = column.child if isinstance(column, ast.Alias) else column  # type: ignore
-    column_expr = (
-        column_or_child.expression  # type: ignore
-        if hasattr(column_or_child, "expression")
-        else column_or_child
-    )
-
-    # At every layer, expand the lineage search tree with all columns referenced
-    # by the current column's expression. If we reach an actual table with a DJ
-    # node attached, save this to the lineage record. Otherwise, continue the search
-    processed = list(column_expr.find_all(ast.Column)) if column_expr else []
-    seen = set()
-    while processed:
-        current = processed.pop()
-        if current in seen:
-            continue
-        if (
-            hasattr(current, "table")
-            and isinstance(current.table, ast.Table)
-            and current.table.dj_node
-        ):
-            lineage_column.lineage.append(  # type: ignore
-                await column_lineage(
-                    session,
-                    current.table.dj_node,
-                    current.name.name
-                    if not current.is_struct_ref
-                    else current.struct_column_name,
-                ),
-            )
-        else:
-            expr_column_deps = (
-                list(
-                    current.expression.find_all(ast.Column),
+        if node_rev.type == NodeType.SOURCE:
+            self.lineage[key] = lineage_column
+            return lineage_column
+
+        # Find the expression AST for the column on the node
+        column_expr = (await self.column_expressions(node_rev))[column_name]
+
+        # At every layer, expand the lineage search tree with all columns referenced
+        # by the current column's expression. If we reach an actual table with a DJ
+        # node attached, save this to the lineage record. Otherwise, continue the search
+        processed = list(column_expr.find_all(ast.Column)) if column_expr else []
+        seen = set()
+        while processed:
+            current = processed.pop()
+            if current in seen:
+                continue
+            if (
+                hasattr(current, "table")
+                and isinstance(current.table, ast.Table)
+                and current.table.dj_node
+            ):
+                lineage_column.lineage.append(  # type: ignore
+                    await self.column_lineage(
+                        current.table.dj_node,
+                        current.name.name
+                        if not current.is_struct_ref
+                        else current.struct_column_name,
+                    ),
                 )
-                if current.expression
-                else []
-            )
-            for col_dep in expr_column_deps:
-                processed.append(col_dep)
-        seen.update({current})
-    return lineage_column
+            else:
+                expr_column_deps = (
+                    list(
+                        current.expression.find_all(ast.Column),
+                    )
+                    if current.expression
+                    else []
+                )
+                for col_dep in expr_column_deps:
+                    processed.append(col_dep)
+            seen.update({current})
+        self.lineage[key] = lineage_column
+        return lineage_column
 
 
 async def derive_sql_column(
@@ -1701,44 +2076,66 @@ async def propagate_valid_status(
     current_user: User,
 ) -> None:
     """
-    Propagate a valid status by revalidating all downstream nodes
+    Propagate a valid status by revalidating all downstream nodes. The downstreams of all
+    the valid nodes are revalidated together, one topological level at a time, so that
+    each node is validated once and after all of its parents. The nodes in a level are
+    validated concurrently.
     """
-    while valid_nodes:
-        resolved_nodes = []
-        for node_revision in valid_nodes:
-            if node_revision.status != NodeStatus.VALID:
-                raise DJException(
-                    f"Cannot propagate valid status: Node `{node_revision.name}` is not valid",
-                )
-            downstream_nodes = await get_downstream_nodes(
-                session=session,
-                node_name=node_revision.name,
+    for node_revision in valid_nodes:
+        if node_revision.status != NodeStatus.VALID:
+            raise DJException(
+                f"Cannot propagate valid status: Node `{node_revision.name}` is not valid",
             )
-            newly_valid_nodes = []
-            for node in downstream_nodes:
-                node_validator = await validate_node_data(
-                    data=node.current,
-                    session=session,
+    downstreams: Dict[str, Node] = {}
+    for node_revision in valid_nodes:
+        for node in await get_downstream_nodes(
+            session=session,
+            node_name=node_revision.name,
+        ):
+            downstreams[node.name] = node
+
+    changed = {node_revision.name for node_revision in valid_nodes}
+    for level in topological_levels(list(downstreams.values())):
+        level = [
+            node
+            for node in level
+            if any(parent.name in changed for parent in node.current.parents)
+        ]
+        if not level:
+            continue
+        validators = await validate_nodes_concurrently(
+            session,
+            [node.name for node in level],
+        )
+        for node in await Node.get_by_names(session, [node.name for node in level]):
+            previous_status = node.current.status
+            previous_fingerprint = node.current.get_column_fingerprint()
+            node_validator = validators[node.name]
+            node.current.status = node_validator.status
+            if node_validator.status == NodeStatus.VALID:
+                node.current.columns = rebuild_validated_columns(
+                    node.current,
+                    node_validator.columns,
                 )
-                node.current.status = node_validator.status
-                if node_validator.status == NodeStatus.VALID:
-                    node.current.columns = node_validator.columns or []
-                    node.current.status = NodeStatus.VALID
-                    node.current.catalog_id = catalog_id
-                    session.add(
-                        status_change_history(
-                            node.current,
-                            NodeStatus.INVALID,
-                            NodeStatus.VALID,
-                            current_user=current_user,
-                        ),
-                    )
-                    newly_valid_nodes.append(node.current)
-                session.add(node.current)
-                await session.commit()
-                await session.refresh(node.current)
-            resolved_nodes.extend(newly_valid_nodes)
-        valid_nodes = resolved_nodes
+                node.current.update_column_fingerprint()
+                node.current.catalog_id = catalog_id
+                session.add(
+                    status_change_history(
+                        node.current,
+                        NodeStatus.INVALID,
+                        NodeStatus.VALID,
+                        current_user=current_user,
+                    ),
+                )
+            if (
+                previous_status != node.current.status
+                or previous_fingerprint != node.current.get_column_fingerprint()
+            ):
+                changed.add(node.name)
+            session.add(node.current)
+            await session.flush()
+            await session.refresh(node.current)
+        await session.commit()
 
 
 async def deactivate_node(
@@ -1828,6 +2225,7 @@ async def activate_node(
         else:
             # We should not fail node restoration just because of some nodes
             # that have been invalid already and stay that way.
+            await session.refresh(downstream.current, ["required_dimensions"])
             node_validator = await validate_node_data(downstream.current, session)
             downstream.current.status = node_validator.status
             if node_validator.errors:
@@ -1858,13 +2256,25 @@ async def activate_node(
     await session.commit()
 
 
+async def _commit_or_flush(session: AsyncSession, commit: bool):
+    """
+    Commit the session, or just flush the pending changes if the caller will commit
+    """
+    if commit:
+        await session.commit()
+    else:
+        await session.flush()
+
+
 async def revalidate_node(  # pylint: disable=too-many-locals,too-many-statements
     name: str,
     session: AsyncSession,
     current_user: User,
+    commit: bool = True,
 ) -> NodeValidator:
     """
-    Revalidate a single existing node and update its status appropriately
+    Revalidate a single existing node and update its status appropriately. With
+    `commit=False` the changes are only flushed, leaving it to the caller to commit.
     """
     node = await Node.get_by_name(
         session,
@@ -1890,7 +2300,7 @@ async def revalidate_node(  # pylint: disable=too-many-locals,too-many-statement
                 ),
             )
             session.add(current_node_revision)
-            await session.commit()
+            await _commit_or_flush(session, commit)
             await session.refresh(current_node_revision)
         return NodeValidator(
             status=node.current.status,  # type: ignore
@@ -1921,7 +2331,7 @@ async def revalidate_node(  # pylint: disable=too-many-locals,too-many-statement
                     DJError(code=ErrorCode.INVALID_DIMENSION, message=exc.message),
                 )
         session.add(current_node_revision)
-        await session.commit()
+        await _commit_or_flush(session, commit)
         return NodeValidator(
             status=current_node_revision.status,
             columns=current_node_revision.columns,
@@ -1930,7 +2340,88 @@ async def revalidate_node(  # pylint: disable=too-many-locals,too-many-statement
 
     # Revalidate all other node types
     node_validator = await validate_node_data(current_node_revision, session)
+    return await update_validated_node(
+        session,
+        node,  # type: ignore
+        node_validator,
+        current_user=current_user,
+        commit=commit,
+    )
+
 
+async def validate_nodes_concurrently(
+    session: AsyncSession,
+    names: List[str],
+) -> Dict[str, NodeValidator]:
+    """
+    Validate the current revisions of nodes that don't depend on each other. Each node is
+    validated with its own session, so that the nodes can be compiled concurrently, and
+    nothing is written. The validators' columns still reference the rows loaded by those
+    sessions, so they should be passed through `rebuild_validated_columns` before being
+    saved with the caller's session.
+    """
+    session_factory = async_sessionmaker(
+        bind=session.bind,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+    semaphore = asyncio.Semaphore(get_settings().node_validation_concurrency)
+
+    async def validate(name: str) -> NodeValidator:
+        async with semaphore, session_factory() as node_session:
+            node = await Node.get_by_name(
+                node_session,
+                name,
+                options=[
+                    joinedload(Node.current).options(
+                        *NodeRevision.default_load_options(),
+                    ),
+                ],
+                raise_if_not_exists=True,
+            )
+            with node_session.no_autoflush:
+                return await validate_node_data(node.current, node_session)  # type: ignore
+
+    validators = await asyncio.gather(*(validate(name) for name in names))
+    return dict(zip(names, validators))
+
+
+def rebuild_validated_columns(
+    node_revision: NodeRevision,
+    columns: List[Column],
+) -> List[Column]:
+    """
+    Rebuild a node revision's validated columns on top of its existing columns, carrying
+    over their attributes and dimension links
+    """
+    existing_columns = {col.name: col for col in node_revision.columns}
+    rebuilt_columns = []
+    for idx, col in enumerate(columns):
+        existing_column = existing_columns.get(col.name)
+        rebuilt_columns.append(
+            Column(
+                name=col.name,
+                display_name=labelize(col.name),
+                type=col.type,
+                attributes=existing_column.attributes if existing_column else [],
+                dimension=existing_column.dimension if existing_column else None,
+                order=idx,
+            ),
+        )
+    return rebuilt_columns
+
+
+async def update_validated_node(
+    session: AsyncSession,
+    node: Node,
+    node_validator: NodeValidator,
+    current_user: User,
+    commit: bool = True,
+) -> NodeValidator:
+    """
+    Update a node's status from its validation, creating a new revision if any of its
+    columns have changed
+    """
     # Update the status
     node.current.status = node_validator.status  # type: ignore
 
@@ -1964,13 +2455,16 @@ async def revalidate_node(  # pylint: disable=too-many-locals,too-many-statement
             new_revision,  # type: ignore
         )
         new_revision.columns = node_validator.columns
+        new_revision.update_column_fingerprint()
 
         # Save the new revision of the child
         node.current_version = new_revision.version  # type: ignore
         new_revision.node_id = node.id  # type: ignore
         session.add(node)
         session.add(new_revision)
-    await session.commit()
+    else:
+        node.current.update_column_fingerprint()  # type: ignore
+    await _commit_or_flush(session, commit)
     await session.refresh(node.current)  # type: ignore
     await session.refresh(node, ["current"])
     return node_validator
@@ -3,6 +3,8 @@ Cube materialization jobs
 """
 from typing import Dict, Optional
 
+from fastapi.concurrency import run_in_threadpool
+
 from datajunction_server.database.materialization import Materialization
 from datajunction_server.database.node import NodeRevision
 from datajunction_server.errors import DJInvalidInputException
@@ -31,7 +33,7 @@ class DefaultCubeMaterialization(
     settings needed for to materialize a generic cube.
     """
 
-    def schedule(
+    async def schedule(
         self,
         materialization: Materialization,
         query_service_client: QueryServiceClient,
@@ -49,7 +51,7 @@ class DruidMaterializationJob(MaterializationJob):
 
     config_class = None
 
-    def schedule(
+    async def schedule(
         self,
         materialization: Materialization,
         query_service_client: QueryServiceClient,
@@ -77,7 +79,8 @@ class DruidMaterializationJob(MaterializationJob):
             materialization,
             materialization.node_revision,
         )
-        return query_service_client.materialize(
+        return await run_in_threadpool(
+            query_service_client.materialize,
             DruidMaterializationInput(
                 name=materialization.name,
                 node_name=materialization.node_revision.name,
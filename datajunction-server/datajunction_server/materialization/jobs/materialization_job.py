@@ -4,6 +4,8 @@ Available materialization jobs.
 import abc
 from typing import Dict, List, Optional
 
+from fastapi.concurrency import run_in_threadpool
+
 from datajunction_server.database.materialization import Materialization
 from datajunction_server.models.engine import Dialect
 from datajunction_server.models.materialization import (
@@ -32,7 +34,7 @@ class MaterializationJob(abc.ABC):  # pylint: disable=too-few-public-methods
     def __init__(self):
         ...
 
-    def run_backfill(
+    async def run_backfill(
         self,
         materialization: Materialization,
         partitions: List[PartitionBackfill],
@@ -42,7 +44,8 @@ class MaterializationJob(abc.ABC):  # pylint: disable=too-few-public-methods
         """
         Kicks off a backfill based on the spec using the query service
         """
-        return query_service_client.run_backfill(
+        return await run_in_threadpool(
+            query_service_client.run_backfill,
             materialization.node_revision.name,
             materialization.name,  # type: ignore
             partitions,
@@ -50,7 +53,7 @@ class MaterializationJob(abc.ABC):  # pylint: disable=too-few-public-methods
         )
 
     @abc.abstractmethod
-    def schedule(
+    async def schedule(
         self,
         materialization: Materialization,
         query_service_client: QueryServiceClient,
@@ -70,7 +73,7 @@ class SparkSqlMaterializationJob(  # pylint: disable=too-few-public-methods # pr
 
     dialect = Dialect.SPARK
 
-    def schedule(
+    async def schedule(
         self,
         materialization: Materialization,
         query_service_client: QueryServiceClient,
@@ -157,7 +160,8 @@ class SparkSqlMaterializationJob(  # pylint: disable=too-few-public-methods # pr
                     op=ast.BinaryOpKind.And,
                 )
 
-        result = query_service_client.materialize(
+        result = await run_in_threadpool(
+            query_service_client.materialize,
             GenericMaterializationInput(
                 name=materialization.name,  # type: ignore
                 node_name=materialization.node_revision.name,
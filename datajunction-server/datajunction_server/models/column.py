@@ -8,7 +8,7 @@ from sqlalchemy import TypeDecorator
 from sqlalchemy.types import Text
 
 from datajunction_server.enum import StrEnum
-from datajunction_server.sql.parsing.types import ColumnType
+from datajunction_server.sql.parsing.types import ColumnType, parse_column_type
 
 
 class ColumnYAML(TypedDict, total=False):
@@ -34,13 +34,9 @@ class ColumnTypeDecorator(
         return str(value)
 
     def process_result_value(self, value, dialect):
-        from datajunction_server.sql.parsing.backends.antlr4 import (  # pylint: disable=import-outside-toplevel
-            parse_rule,
-        )
-
         if not value:
             return value
-        return parse_rule(value, "dataType")
+        return parse_column_type(value)
 
 
 class ColumnAttributeInput(BaseModel):
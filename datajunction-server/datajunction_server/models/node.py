@@ -510,6 +510,20 @@ class NodeNameList(BaseModel):
     __root__: List[str]
 
 
+class RefreshedSourceNodes(BaseModel):
+    """
+    Outcome of refreshing many source nodes at once
+    """
+
+    refreshed: List[str] = []
+    unchanged: List[str] = []
+    not_found: List[str] = []
+
+    # Nodes that couldn't be refreshed because the query service failed to introspect
+    # their schema, with the error for each
+    failed: Dict[str, str] = {}
+
+
 class NodeIndexItem(BaseModel):
     """
     Node details used for indexing purposes
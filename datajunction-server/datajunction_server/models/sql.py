@@ -1,7 +1,7 @@
 """
 Models for generated SQL
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from pydantic.class_validators import root_validator
 from pydantic.main import BaseModel
@@ -56,3 +56,25 @@ class GeneratedSQL(BaseModel):
                 output_dialect=values["dialect"],
             )
         return values
+
+
+class MeasuresSQLRequest(BaseModel):
+    """
+    A request for the measures SQL of a set of metrics with dimensions and filters
+    """
+
+    metrics: List[str]
+    dimensions: List[str] = []
+    filters: List[str] = []
+    include_all_columns: bool = False
+
+    def key(self) -> Tuple:
+        """
+        Identifies requests that would produce the same measures SQL
+        """
+        return (
+            tuple(self.metrics),
+            tuple(self.dimensions),
+            tuple(self.filters),
+            self.include_all_columns,
+        )
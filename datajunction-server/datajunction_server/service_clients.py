@@ -1,8 +1,10 @@
 """Clients for various configurable services."""
+import asyncio
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 from urllib.parse import urljoin
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
@@ -11,6 +13,7 @@ from datajunction_server.database.column import Column
 from datajunction_server.errors import (
     DJDoesNotExistException,
     DJError,
+    DJNotImplementedException,
     DJQueryServiceClientException,
     ErrorCode,
 )
@@ -22,6 +25,7 @@ from datajunction_server.models.materialization import (
 from datajunction_server.models.partition import PartitionBackfill
 from datajunction_server.models.query import QueryCreate, QueryWithResults
 from datajunction_server.sql.parsing.types import ColumnType
+from datajunction_server.typing import END_JOB_STATES
 
 if TYPE_CHECKING:
     from datajunction_server.database.engine import Engine
@@ -121,6 +125,78 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
             if request_headers
             else self.requests_session.headers,
         )
+        return QueryServiceClient.columns_from_response(response)
+
+    def get_columns_for_tables(  # pylint: disable=too-many-arguments
+        self,
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        request_headers: Optional[Dict[str, str]] = None,
+        engine: Optional["Engine"] = None,
+    ) -> Dict[str, List[Column]]:
+        """
+        Retrieves columns for many tables in a schema with one request. Tables that
+        don't exist are left out.
+        """
+        response = self.requests_session.post(
+            f"/schema/{catalog}.{schema}/columns/",
+            json={"tables": tables},
+            params={
+                "engine": engine.name,
+                "engine_version": engine.version,
+            }
+            if engine
+            else {},
+            headers={
+                **self.requests_session.headers,
+                **QueryServiceClient.filtered_headers(request_headers),
+            }
+            if request_headers
+            else self.requests_session.headers,
+        )
+        return QueryServiceClient.schema_columns_from_response(response)
+
+    def get_table_fingerprints(  # pylint: disable=too-many-arguments
+        self,
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        request_headers: Optional[Dict[str, str]] = None,
+        engine: Optional["Engine"] = None,
+        fingerprints: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+        """
+        Retrieves fingerprints for many tables in a schema with one request, which
+        change whenever a table's columns change, along with the columns of the tables
+        whose fingerprints differ from the given `fingerprints`. Tables that don't exist
+        are left out.
+        """
+        response = self.requests_session.post(
+            f"/schema/{catalog}.{schema}/fingerprints/",
+            json={"tables": tables, "fingerprints": fingerprints or {}},
+            params={
+                "engine": engine.name,
+                "engine_version": engine.version,
+            }
+            if engine
+            else {},
+            headers={
+                **self.requests_session.headers,
+                **QueryServiceClient.filtered_headers(request_headers),
+            }
+            if request_headers
+            else self.requests_session.headers,
+        )
+        return QueryServiceClient.table_fingerprints_from_response(response)
+
+    @staticmethod
+    def columns_from_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> List[Column]:
+        """
+        The table columns from a query service response.
+        """
         if response.status_code not in (200, 201):
             if response.status_code == HTTPStatus.NOT_FOUND:
                 raise DJDoesNotExistException(
@@ -139,6 +215,64 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
             for idx, column in enumerate(table_columns)
         ]
 
+    @staticmethod
+    def raise_for_schema_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> None:
+        """
+        Raise for an error response from one of the query service's schema endpoints.
+        A 404 only means that the schema doesn't exist if it comes from the query
+        service itself, which flags its errors with the `X-DJ-Error` header. Any other
+        404 means the query service doesn't have the endpoint, e.g. an older or custom
+        query service.
+        """
+        if response.status_code in (200, 201):
+            return
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            if response.headers.get("X-DJ-Error"):
+                raise DJDoesNotExistException(
+                    message=f"Schema not found: {response.text}",
+                )
+            raise DJNotImplementedException(
+                message=f"Query service endpoint not found: {response.url}",
+            )
+        raise DJQueryServiceClientException(
+            message=f"Error response from query service: {response.text}",
+        )
+
+    @staticmethod
+    def schema_columns_from_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> Dict[str, List[Column]]:
+        """
+        The columns of each table found in a schema from a query service response.
+        """
+        QueryServiceClient.raise_for_schema_response(response)
+        return {
+            table["name"].rsplit(".", 1)[-1]: [
+                Column(name=column["name"], type=ColumnType(column["type"]), order=idx)
+                for idx, column in enumerate(table["columns"])
+            ]
+            for table in response.json().get("tables", [])
+        }
+
+    @staticmethod
+    def table_fingerprints_from_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+        """
+        The fingerprint of each table found in a schema, and the columns of the changed
+        tables, from a query service response.
+        """
+        QueryServiceClient.raise_for_schema_response(response)
+        return (
+            {
+                table.rsplit(".", 1)[-1]: fingerprint
+                for table, fingerprint in response.json()["fingerprints"].items()
+            },
+            QueryServiceClient.schema_columns_from_response(response),
+        )
+
     def submit_query(  # pylint: disable=too-many-arguments
         self,
         query_create: QueryCreate,
@@ -157,6 +291,15 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
             else self.requests_session.headers,
             json=query_create.dict(),
         )
+        return QueryServiceClient.submitted_query_from_response(response)
+
+    @staticmethod
+    def submitted_query_from_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> QueryWithResults:
+        """
+        The submitted query from a query service response.
+        """
         response_data = response.json()
         if response.status_code not in (200, 201):
             raise DJQueryServiceClientException(
@@ -167,8 +310,7 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
                 ],
                 http_status_code=response.status_code,
             )
-        query_info = response.json()
-        return QueryWithResults(**query_info)
+        return QueryWithResults(**response_data)
 
     def get_query(
         self,
@@ -184,12 +326,20 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
             if request_headers
             else self.requests_session.headers,
         )
+        return QueryServiceClient.query_from_response(response)
+
+    @staticmethod
+    def query_from_response(
+        response: Union[requests.Response, httpx.Response],
+    ) -> QueryWithResults:
+        """
+        A previously submitted query from a query service response.
+        """
         if response.status_code not in (200, 201):
             raise DJQueryServiceClientException(
                 message=f"Error response from query service: {response.text}",
             )
-        query_info = response.json()
-        return QueryWithResults(**query_info)
+        return QueryWithResults(**response.json())
 
     def materialize(
         self,
@@ -288,3 +438,335 @@ class QueryServiceClient:  # pylint: disable=too-few-public-methods
         if response.status_code not in (200, 201):
             return MaterializationInfo(output_tables=[], urls=[])  # pragma: no cover
         return MaterializationInfo(**response.json())
+
+
+class AsyncQueryServiceClient:
+    """
+    Asyncio-native client for the query service, for use from async endpoints so that
+    waiting on the query service doesn't block the event loop.
+
+    All requests share one ``httpx.AsyncClient``, which pools and keeps alive its
+    connections. Requests that never reached the query service (connection failures)
+    are retried with exponential backoff. Retryable statuses are only retried for
+    idempotent requests, since the query service may have already acted on anything
+    else, e.g. accepted a submitted query. At most ``max_concurrency`` requests are in
+    flight at once.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        uri: str,
+        retries: int = 0,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrency: int = 50,
+        backoff_factor: float = 1.5,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.uri = uri
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.client = httpx.AsyncClient(
+            base_url=uri,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            transport=transport,
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.watcher = QueryWatcher(self)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        request_headers: Optional[Dict[str, str]] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Make a request to the query service, retrying transient failures. Requests are
+        treated as idempotent based on their method unless `idempotent` is set, e.g.
+        for read-only POST lookups.
+        """
+        headers = (
+            QueryServiceClient.filtered_headers(request_headers)
+            if request_headers
+            else None
+        )
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                async with self.semaphore:
+                    response = await self.client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        **kwargs,
+                    )
+                if (
+                    not idempotent
+                    or response.status_code not in self.RETRY_STATUSES
+                    or attempt >= self.retries
+                ):
+                    return response
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as exc:
+                if attempt >= self.retries:
+                    raise DJQueryServiceClientException(
+                        message=f"Unable to reach query service: {exc}",
+                    ) from exc
+            except httpx.HTTPError as exc:
+                raise DJQueryServiceClientException(
+                    message=f"Error requesting query service: {exc}",
+                ) from exc
+            await asyncio.sleep(self.backoff_factor * 2**attempt)
+            attempt += 1
+
+    async def get_columns_for_table(
+        self,
+        catalog: str,
+        schema: str,
+        table: str,
+        request_headers: Optional[Dict[str, str]] = None,
+        engine: Optional["Engine"] = None,
+    ) -> List[Column]:
+        """
+        Retrieves columns for a table.
+        """
+        response = await self.request(
+            "GET",
+            f"/table/{catalog}.{schema}.{table}/columns/",
+            request_headers,
+            params={"engine": engine.name, "engine_version": engine.version}
+            if engine
+            else {},
+        )
+        return QueryServiceClient.columns_from_response(response)
+
+    async def get_columns_for_tables(  # pylint: disable=too-many-arguments
+        self,
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        request_headers: Optional[Dict[str, str]] = None,
+        engine: Optional["Engine"] = None,
+    ) -> Dict[str, List[Column]]:
+        """
+        Retrieves columns for many tables in a schema with one request. Tables that
+        don't exist are left out.
+        """
+        response = await self.request(
+            "POST",
+            f"/schema/{catalog}.{schema}/columns/",
+            request_headers,
+            idempotent=True,
+            json={"tables": tables},
+            params={"engine": engine.name, "engine_version": engine.version}
+            if engine
+            else {},
+        )
+        return QueryServiceClient.schema_columns_from_response(response)
+
+    async def get_table_fingerprints(  # pylint: disable=too-many-arguments
+        self,
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        request_headers: Optional[Dict[str, str]] = None,
+        engine: Optional["Engine"] = None,
+        fingerprints: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+        """
+        Retrieves fingerprints for many tables in a schema with one request, which
+        change whenever a table's columns change, along with the columns of the tables
+        whose fingerprints differ from the given `fingerprints`. Tables that don't exist
+        are left out.
+        """
+        response = await self.request(
+            "POST",
+            f"/schema/{catalog}.{schema}/fingerprints/",
+            request_headers,
+            idempotent=True,
+            json={"tables": tables, "fingerprints": fingerprints or {}},
+            params={"engine": engine.name, "engine_version": engine.version}
+            if engine
+            else {},
+        )
+        return QueryServiceClient.table_fingerprints_from_response(response)
+
+    async def submit_query(
+        self,
+        query_create: QueryCreate,
+        request_headers: Optional[Dict[str, str]] = None,
+    ) -> QueryWithResults:
+        """
+        Submit a query to the query service
+        """
+        response = await self.request(
+            "POST",
+            "/queries/",
+            request_headers,
+            json=query_create.dict(),
+        )
+        return QueryServiceClient.submitted_query_from_response(response)
+
+    async def get_query(
+        self,
+        query_id: str,
+        request_headers: Optional[Dict[str, str]] = None,
+    ) -> QueryWithResults:
+        """
+        Get a previously submitted query
+        """
+        response = await self.request(
+            "GET",
+            f"/queries/{query_id}/",
+            request_headers,
+        )
+        return QueryServiceClient.query_from_response(response)
+
+    async def close(self) -> None:
+        """
+        Close the pooled connections.
+        """
+        await self.client.aclose()
+
+
+class QueryWatcher:
+    """
+    Watches submitted queries on behalf of any number of subscribers, such as the
+    server-sent event streams of several clients looking at the same query.
+
+    Each query is polled by a single task per set of credentials no matter how many
+    subscribers share them, and every change to it is pushed to all of them. Polls are
+    keyed by the query id and the subscriber's credential headers, so a subscriber is
+    never served results fetched with another user's credentials and the query
+    service's access checks still apply to each of them. The poll interval backs off
+    while the query is unchanged and resets whenever it changes. Polling stops once
+    the query reaches an end state or its last subscriber leaves.
+    """
+
+    CREDENTIAL_HEADERS = ("authorization", "proxy-authorization", "cookie")
+
+    def __init__(
+        self,
+        query_service_client: AsyncQueryServiceClient,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 5.0,
+        backoff_factor: float = 1.5,
+    ):
+        self.query_service_client = query_service_client
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.subscribers: Dict[Tuple, Set[asyncio.Queue]] = {}
+        self.latest: Dict[Tuple, QueryWithResults] = {}
+        self.tasks: Dict[Tuple, asyncio.Task] = {}
+
+    @classmethod
+    def watch_key(
+        cls,
+        query_id: str,
+        request_headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple:
+        """
+        The key that a subscriber's poll is shared under: the query id and the
+        subscriber's credential headers.
+        """
+        credentials = sorted(
+            (key.lower(), value)
+            for key, value in (request_headers or {}).items()
+            if key.lower() in cls.CREDENTIAL_HEADERS
+        )
+        return (query_id, tuple(credentials))
+
+    async def subscribe(
+        self,
+        query_id: str,
+        request_headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[QueryWithResults]:
+        """
+        Yield the query every time it changes, until it reaches an end state.
+        """
+        key = self.watch_key(query_id, request_headers)
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.setdefault(key, set()).add(queue)
+        if key in self.latest:
+            queue.put_nowait(self.latest[key])
+        if key not in self.tasks:
+            self.tasks[key] = asyncio.create_task(
+                self.poll(key, request_headers),
+            )
+        try:
+            while True:
+                update = await queue.get()
+                if isinstance(update, Exception):
+                    raise update
+                yield update
+                if update.state in END_JOB_STATES:
+                    return
+        finally:
+            subscribers = self.subscribers.get(key, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self.subscribers.pop(key, None)
+                self.latest.pop(key, None)
+                if task := self.tasks.pop(key, None):
+                    task.cancel()
+
+    async def poll(
+        self,
+        key: Tuple,
+        request_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Poll the query service for a query and publish its changes to all subscribers
+        watching it under the key.
+        """
+        query_id, _ = key
+        interval = self.poll_interval
+        try:
+            while True:
+                try:
+                    query = await self.query_service_client.get_query(
+                        query_id=query_id,
+                        request_headers=request_headers,
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    self.publish(key, exc)
+                    return
+                if query != self.latest.get(key):
+                    self.latest[key] = query
+                    self.publish(key, query)
+                    interval = self.poll_interval
+                else:
+                    interval = min(
+                        interval * self.backoff_factor,
+                        self.max_poll_interval,
+                    )
+                if query.state in END_JOB_STATES:
+                    return
+                await asyncio.sleep(interval)
+        finally:
+            if self.tasks.get(key) is asyncio.current_task():
+                del self.tasks[key]
+                self.latest.pop(key, None)
+
+    def publish(
+        self,
+        key: Tuple,
+        update: Union[QueryWithResults, Exception],
+    ) -> None:
+        """
+        Push an update for a query to all subscribers watching it under the key.
+        """
+        for queue in self.subscribers.get(key, set()):
+            queue.put_nowait(update)
@@ -4,23 +4,23 @@ DAG related functions.
 import itertools
 from typing import Dict, List, Optional, Set, Union
 
-from sqlalchemy import and_, func, join, literal, or_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.sql.operators import is_
 
-from datajunction_server.database.attributetype import AttributeType, ColumnAttribute
+from datajunction_server.database.attributetype import ColumnAttribute
 from datajunction_server.database.column import Column
 from datajunction_server.database.dimensionlink import DimensionLink
-from datajunction_server.database.node import (
-    Node,
-    NodeColumns,
-    NodeRelationship,
-    NodeRevision,
-)
+from datajunction_server.database.node import Node, NodeRevision
 from datajunction_server.errors import DJDoesNotExistException, DJException
 from datajunction_server.models.node import DimensionAttributeOutput
 from datajunction_server.models.node_type import NodeType
+from datajunction_server.sql.graph_index import (
+    GraphSnapshot,
+    Reachability,
+    get_graph_index,
+)
 from datajunction_server.utils import SEPARATOR, get_settings
 
 settings = get_settings()
@@ -61,75 +61,41 @@ async def get_downstream_nodes(
 ) -> List[Node]:
     """
     Gets all downstream children of the given node, filterable by node type.
-    Uses a recursive CTE query to build out all descendants from the node.
+    Uses the in-memory graph index to build out all descendants from the node.
     """
-    node = await Node.get_by_name(
-        session,
-        node_name,
-        options=_node_output_options(),
-    )
-    if not node:
-        return []
-    initial_dag = (
-        select(
-            NodeRelationship.parent_id,
-            NodeRevision.node_id,
-            literal(0).label("depth"),
-        )
-        .where(NodeRelationship.parent_id == node.id)
-        .join(NodeRevision, NodeRelationship.child_id == NodeRevision.id)
-        .join(
-            Node,
-            (Node.id == NodeRevision.node_id)
-            & (Node.current_version == NodeRevision.version),
-        )
-    )
-    if not include_cubes:
-        initial_dag = initial_dag.where((NodeRevision.type != NodeType.CUBE))
-    dag = initial_dag.cte("downstreams", recursive=True)
-
-    next_layer = (
-        select(
-            dag.c.parent_id,
-            NodeRevision.node_id,
-            (dag.c.depth + literal(1)).label("depth"),
+    node_id = (
+        await session.execute(
+            select(Node.id).where(
+                (Node.name == node_name) & (is_(Node.deactivated_at, None)),
+            ),
         )
-        .join(NodeRelationship, dag.c.node_id == NodeRelationship.parent_id)
-        .join(NodeRevision, NodeRelationship.child_id == NodeRevision.id)
-        .join(Node, Node.id == NodeRevision.node_id)
-    )
-    if not include_cubes:
-        next_layer = next_layer.where(NodeRevision.type != NodeType.CUBE)
-
-    paths = dag.union_all(next_layer)
-
-    # Calculate the maximum depth for each node
-    max_depths = (
-        select(paths.c.node_id, func.max(paths.c.depth).label("max_depth"))
-        .group_by(paths.c.node_id)
-        .cte("max_depths")
-    )
-
-    # Select nodes with the maximum depth
-    final_select = select(Node, max_depths.c.max_depth).join(
-        max_depths,
-        max_depths.c.node_id == Node.id,
-    )
-
-    if not include_deactivated:
-        final_select = final_select.where(is_(Node.deactivated_at, None))
-
-    # Add depth filter
+    ).scalar_one_or_none()
+    if not node_id:
+        return []
+    graph = await get_graph_index().get(session)
+    max_depths = graph.downstream_depths(node_id, include_cubes=include_cubes)
     if depth > -1:
-        final_select = final_select.where(max_depths.c.max_depth < depth)
+        max_depths = {
+            downstream_id: max_depth
+            for downstream_id, max_depth in max_depths.items()
+            if max_depth < depth
+        }
 
-    statement = final_select.order_by(max_depths.c.max_depth, Node.id).options(
-        *_node_output_options()
+    statement = select(Node).where(Node.id.in_(max_depths.keys()))
+    if not include_deactivated:
+        statement = statement.where(is_(Node.deactivated_at, None))
+    results = (
+        (await session.execute(statement.options(*_node_output_options())))
+        .unique()
+        .scalars()
+        .all()
     )
-    results = (await session.execute(statement)).unique().scalars().all()
     return [
         downstream
-        for downstream in results
+        for downstream in sorted(
+            results,
+            key=lambda downstream: (max_depths[downstream.id], downstream.id),
+        )
         if downstream.type == node_type or node_type is None
     ]
 
@@ -142,7 +108,7 @@ async def get_upstream_nodes(
 ) -> List[Node]:
     """
     Gets all upstreams of the given node, filterable by node type.
-    Uses a recursive CTE query to build out all parents of the node.
+    Uses the in-memory graph index to build out all parents of the node.
     """
     node = (
         (
@@ -162,50 +128,16 @@ async def get_upstream_nodes(
             message=f"Node with name {node_name} does not exist",
         )
 
-    dag = (
-        select(
-            NodeRelationship.child_id,
-            NodeRevision.id,
-            NodeRevision.node_id,
-        )
-        .where(NodeRelationship.child_id == node.current.id)
-        .join(Node, NodeRelationship.parent_id == Node.id)
-        .join(
-            NodeRevision,
-            (Node.id == NodeRevision.node_id)
-            & (Node.current_version == NodeRevision.version),
-        )
-    ).cte("upstreams", recursive=True)
-
-    paths = dag.union_all(
-        select(
-            dag.c.child_id,
-            NodeRevision.id,
-            NodeRevision.node_id,
-        )
-        .join(NodeRelationship, dag.c.id == NodeRelationship.child_id)
-        .join(Node, NodeRelationship.parent_id == Node.id)
-        .join(
-            NodeRevision,
-            (Node.id == NodeRevision.node_id)
-            & (Node.current_version == NodeRevision.version),
-        ),
-    )
-
-    node_selector = select(Node)
+    graph = await get_graph_index().get(session)
+    statement = select(Node).where(Node.id.in_(graph.upstream_ids(node.current.id)))
     if not include_deactivated:
-        node_selector = node_selector.where(is_(Node.deactivated_at, None))
-    statement = (
-        node_selector.join(paths, paths.c.node_id == Node.id)
-        .join(
-            NodeRevision,
-            (Node.current_version == NodeRevision.version)
-            & (Node.id == NodeRevision.node_id),
-        )
-        .options(*_node_output_options())
+        statement = statement.where(is_(Node.deactivated_at, None))
+    results = (
+        (await session.execute(statement.options(*_node_output_options())))
+        .unique()
+        .scalars()
+        .all()
     )
-
-    results = (await session.execute(statement)).unique().scalars().all()
     return [
         upstream
         for upstream in results
@@ -213,145 +145,28 @@ async def get_upstream_nodes(
     ]
 
 
-async def get_dimensions_dag(  # pylint: disable=too-many-locals
+async def get_dimensions_dag(
     session: AsyncSession,
     node_revision: NodeRevision,
     with_attributes: bool = True,
 ) -> List[Union[DimensionAttributeOutput, Node]]:
     """
-    Gets the dimensions graph of the given node revision with a single recursive CTE query.
+    Gets the dimensions graph of the given node revision from the in-memory graph index.
     This graph is split out into dimension attributes or dimension nodes depending on the
     `with_attributes` flag.
     """
+    if node_revision.id is None:
+        return []  # pragma: no cover
+    graph_index = get_graph_index()
+    graph = await graph_index.get(session)
 
-    initial_node = aliased(NodeRevision, name="initial_node")
-    dimension_node = aliased(Node, name="dimension_node")
-    dimension_rev = aliased(NodeRevision, name="dimension_rev")
-    current_node = aliased(Node, name="current_node")
-    current_rev = aliased(NodeRevision, name="current_rev")
-    next_node = aliased(Node, name="next_node")
-    next_rev = aliased(NodeRevision, name="next_rev")
-    column = aliased(Column, name="c")
-
-    # Merge both branching points of the dimensions graph (the column -> dimension
-    # branch and the node -> dimension branch) into a single CTE. We do this merge because
-    # subqueries with UNION are not allowed in the recursive CTE.
-    graph_branches = (
-        (
-            select(
-                NodeColumns.node_id.label("node_revision_id"),
-                Column.dimension_id,
-                Column.name,
-            )
-            .select_from(NodeColumns)
-            .join(Column, NodeColumns.column_id == Column.id)
-        )
-        .union_all(
-            select(
-                DimensionLink.node_revision_id,
-                DimensionLink.dimension_id,
-                (
-                    literal("[")
-                    + func.coalesce(  # pylint: disable=not-callable
-                        DimensionLink.role,
-                        literal(""),
-                    )
-                    + literal("]")
-                ).label("name"),
-            ).select_from(DimensionLink),
-        )
-        .cte("graph_branches")
-    )
-
-    # Recursive CTE
-    dimensions_graph = (
-        select(
-            initial_node.id.label("path_start"),
-            graph_branches.c.name.label("col_name"),
-            dimension_node.id.label("path_end"),
-            (
-                initial_node.name
-                + "."
-                + graph_branches.c.name
-                + ","
-                + dimension_node.name
-            ).label(
-                "join_path",
-            ),
-            dimension_node.name.label("node_name"),
-            dimension_rev.id.label("node_revision_id"),
-            dimension_rev.display_name.label("node_display_name"),
-        )
-        .select_from(initial_node)
-        .join(graph_branches, node_revision.id == graph_branches.c.node_revision_id)
-        .join(
-            dimension_node,
-            (dimension_node.id == graph_branches.c.dimension_id)
-            & (is_(dimension_node.deactivated_at, None)),
-        )
-        .join(
-            dimension_rev,
-            and_(
-                dimension_rev.version == dimension_node.current_version,
-                dimension_rev.node_id == dimension_node.id,
-            ),
-        )
-        .where(initial_node.id == node_revision.id)
-    ).cte("dimensions_graph", recursive=True)
-
-    paths = dimensions_graph.union_all(
-        select(
-            dimensions_graph.c.path_start,
-            graph_branches.c.name.label("col_name"),
-            next_node.id.label("path_end"),
-            (
-                dimensions_graph.c.join_path
-                + "."
-                + graph_branches.c.name
-                + ","
-                + next_node.name
-            ).label(
-                "join_path",
-            ),
-            next_node.name.label("node_name"),
-            next_rev.id.label("node_revision_id"),
-            next_rev.display_name.label("node_display_name"),
-        ).select_from(
-            dimensions_graph.join(
-                current_node,
-                dimensions_graph.c.path_end == current_node.id,
-            )
-            .join(
-                current_rev,
-                and_(
-                    current_rev.version == current_node.current_version,
-                    current_rev.node_id == current_node.id,
-                ),
-            )
-            .join(graph_branches, current_rev.id == graph_branches.c.node_revision_id)
-            .join(
-                next_node,
-                (next_node.id == graph_branches.c.dimension_id)
-                & (is_(next_node.deactivated_at, None)),
-            )
-            .join(
-                next_rev,
-                and_(
-                    next_rev.version == next_node.current_version,
-                    next_rev.node_id == next_node.id,
-                ),
-            ),
-        ),
-    )
-
-    # Final SELECT statements
-    # ----
     # If attributes was set to False, we only need to return the dimension nodes
     if not with_attributes:
+        await graph_index.branches(session, graph, node_revision.id)
+        paths = graph.dimension_paths(node_revision.id, node_revision.name)
         result = await session.execute(
             select(Node)
-            .select_from(paths)
-            .join(Node, paths.c.node_name == Node.name)
+            .where(Node.id.in_({dimension_id for dimension_id, _ in paths}))
             .options(*_node_output_options()),
         )
         return result.unique().scalars().all()
@@ -359,71 +174,68 @@ async def get_dimensions_dag(  # pylint: disable=too-many-locals
     # Otherwise return the dimension attributes, which include both the dimension
     # attributes on the dimension nodes in the DAG as well as the local dimension
     # attributes on the initial node
-    group_concat = (
-        func.group_concat
-        if session.bind.dialect.name in ("sqlite",)
-        else func.string_agg
+    return await _get_dimension_attributes(
+        session,
+        graph,
+        node_revision.id,
+        node_revision.name,
+        node_revision.type,
     )
-    final_query = (
-        select(
-            paths.c.node_name,
-            paths.c.node_display_name,
-            column.name,
-            column.type,
-            group_concat(AttributeType.name, ",").label(
-                "column_attribute_type_name",
-            ),
-            paths.c.join_path,
-        )
-        .select_from(paths)
-        .join(NodeColumns, NodeColumns.node_id == paths.c.node_revision_id)
-        .join(column, NodeColumns.column_id == column.id)
-        .join(ColumnAttribute, column.id == ColumnAttribute.column_id, isouter=True)
-        .join(
-            AttributeType,
-            ColumnAttribute.attribute_type_id == AttributeType.id,
-            isouter=True,
-        )
-        .group_by(
-            paths.c.node_name,
-            paths.c.node_display_name,
-            column.name,
-            column.type,
-            paths.c.join_path,
-        )
-        .union_all(
-            select(
-                NodeRevision.name,
-                NodeRevision.display_name,
-                Column.name,
-                Column.type,
-                group_concat(AttributeType.name, ",").label(
-                    "column_attribute_type_name",
-                ),
-                literal("").label("join_path"),
-            )
-            .select_from(NodeRevision)
-            .join(NodeColumns, NodeColumns.node_id == NodeRevision.id)
-            .join(Column, NodeColumns.column_id == Column.id)
-            .join(
-                ColumnAttribute,
-                Column.id == ColumnAttribute.column_id,
-                isouter=True,
-            )
-            .join(
-                AttributeType,
-                ColumnAttribute.attribute_type_id == AttributeType.id,
-                isouter=True,
-            )
-            .group_by(
-                NodeRevision.name,
-                NodeRevision.display_name,
-                Column.name,
-                Column.type,
-                "join_path",
-            )
-            .where(NodeRevision.id == node_revision.id),
-        )
+
+
+async def _get_dimension_attributes(  # pylint: disable=too-many-locals
+    session: AsyncSession,
+    graph: GraphSnapshot,
+    revision_id: int,
+    revision_name: str,
+    revision_type: NodeType,
+) -> List[DimensionAttributeOutput]:
+    """
+    The dimension attributes reachable from a node revision. Results are kept in the
+    graph snapshot's reachability table and reused for as long as the dimension paths,
+    the revisions along them, and their columns stay unchanged.
+    """
+    graph_index = get_graph_index()
+    await graph_index.branches(session, graph, revision_id)
+    paths = graph.dimension_paths(revision_id, revision_name)
+    reachability_key = graph.reachability_key(paths)
+    cached = graph.reachability.get(revision_id)
+    if cached and cached.key == reachability_key:
+        return list(cached.attributes)
+
+    columns = await graph_index.columns(
+        session,
+        graph,
+        [revision_id]
+        + [graph.nodes[dimension_id].current_revision_id for dimension_id, _ in paths],
+    )
+    _, revision_display_name = graph.labels[revision_id]
+    dimension_attributes = {
+        (
+            graph.nodes[dimension_id].name,
+            graph.nodes[dimension_id].display_name,
+            column_name,
+            column_type,
+            attribute_types,
+            join_path,
+        ): None
+        for dimension_id, join_path in paths
+        for column_name, column_type, attribute_types in columns[
+            graph.nodes[dimension_id].current_revision_id  # type: ignore
+        ]
+    }
+    dimension_attributes.update(
+        {
+            (
+                revision_name,
+                revision_display_name,
+                column_name,
+                column_type,
+                attribute_types,
+                "",
+            ): None
+            for column_name, column_type, attribute_types in columns[revision_id]
+        },
     )
 
     def _extract_roles_from_path(join_path) -> str:
@@ -438,8 +250,7 @@ async def get_dimensions_dag(  # pylint: disable=too-many-locals
 
     # Only include a given column it's an attribute on a dimension node or
     # if the column is tagged with the attribute type 'dimension'
-    dimension_attributes = (await session.execute(final_query)).all()
-    return sorted(
+    attributes = sorted(
         [
             DimensionAttributeOutput(
                 name=f"{node_name}.{column_name}{_extract_roles_from_path(join_path)}",
@@ -448,7 +259,7 @@ async def get_dimensions_dag(  # pylint: disable=too-many-locals
                 is_primary_key=(
                     attribute_types is not None and "primary_key" in attribute_types
                 ),
-                type=str(column_type),
+                type=column_type,
                 path=[
                     (path.replace("[", "").replace("]", "")[:-1])
                     if path.replace("[", "").replace("]", "").endswith(".")
@@ -473,14 +284,18 @@ async def get_dimensions_dag(  # pylint: disable=too-many-locals
             )
             or (  # column is on dimension node
                 join_path != ""
-                or (
-                    node_name == node_revision.name
-                    and node_revision.type == NodeType.DIMENSION
-                )
+                or (node_name == revision_name and revision_type == NodeType.DIMENSION)
             )
         ],
         key=lambda x: (x.name, ",".join(x.path)),
     )
+    graph.reachability[revision_id] = Reachability(
+        key=reachability_key,
+        node_names={revision_name}
+        | {graph.nodes[dimension_id].name for dimension_id, _ in paths},
+        attributes=attributes,
+    )
+    return list(attributes)
 
 
 async def get_dimensions(
@@ -564,47 +379,86 @@ async def get_shared_dimensions(
     metric_nodes: List[Node],
 ) -> List[DimensionAttributeOutput]:
     """
-    Return a list of dimensions that are common between the nodes.
+    Return a list of dimensions that are common between the nodes. The dimensions
+    reachable from each parent are read from the graph snapshot's reachability table,
+    so this reduces to intersecting sets of dimension attribute names.
     """
-    find_latest_node_revisions = [
-        and_(
-            NodeRevision.name == metric_node.name,
-            NodeRevision.version == metric_node.current_version,
-        )
-        for metric_node in metric_nodes
-    ]
-    statement = (
-        select(Node)
-        .where(or_(*find_latest_node_revisions))
-        .select_from(
-            join(
-                join(
-                    NodeRevision,
-                    NodeRelationship,
-                ),
-                Node,
-                NodeRelationship.parent_id == Node.id,
-            ),
-        )
+    graph = await get_graph_index().get(session)
+    parent_ids = sorted(
+        {
+            parent_id
+            for metric_node in metric_nodes
+            for parent_id in graph.parents.get(
+                graph.nodes[metric_node.id].current_revision_id,  # type: ignore
+                set(),
+            )
+        },
     )
-    parents = list(set((await session.execute(statement)).scalars().all()))
-    common = await group_dimensions_by_name(session, parents[0])
-    for node in parents[1:]:
-        node_dimensions = await group_dimensions_by_name(session, node)
+    if not parent_ids:
+        return []  # pragma: no cover
+
+    common: Dict[str, List[DimensionAttributeOutput]] = {}
+    for idx, parent_id in enumerate(parent_ids):
+        parent = graph.nodes[parent_id]
+        if parent.type == NodeType.METRIC:
+            # Derived metrics take their dimensions from their first parent
+            revision = await session.get(
+                NodeRevision,
+                parent.current_revision_id,
+                options=[selectinload(NodeRevision.parents)],
+            )
+            if not revision or not revision.parents:
+                return []
+            parent = graph.nodes[revision.parents[0].id]
+        node_dimensions: Dict[str, List[DimensionAttributeOutput]] = {}
+        for dim in await _get_dimension_attributes(
+            session,
+            graph,
+            parent.current_revision_id,  # type: ignore
+            parent.name,
+            parent.type,
+        ):
+            node_dimensions.setdefault(dim.name, []).append(dim)
 
         # Merge each set of dimensions based on the name and path
-        to_delete = set(common.keys() - node_dimensions.keys())
-        common_dim_keys = common.keys() & list(node_dimensions.keys())
+        if idx == 0:
+            common = node_dimensions
+            continue
+        common_dim_keys = common.keys() & node_dimensions.keys()
         if not common_dim_keys:
             return []
-        for dim_key in to_delete:
-            del common[dim_key]  # pragma: no cover
+        common = {dim_key: common[dim_key] for dim_key in common_dim_keys}
     return sorted(
         [y for x in common.values() for y in x],
         key=lambda x: (x.name, x.path),
     )
 
 
+async def _get_current_revisions(
+    session: AsyncSession,
+    node_ids: Set[int],
+    node_types: Optional[List[NodeType]] = None,
+) -> List[NodeRevision]:
+    """
+    Load the current revisions of the given nodes, optionally limited by node type
+    """
+    statement = (
+        select(NodeRevision)
+        .join(
+            Node,
+            onclause=(
+                (NodeRevision.node_id == Node.id)
+                & (Node.current_version == NodeRevision.version)
+            ),  # pylint: disable=superfluous-parens
+        )
+        .where(Node.id.in_(node_ids))
+        .options(*NodeRevision.default_load_options())
+    )
+    if node_types:
+        statement = statement.where(NodeRevision.type.in_(node_types))
+    return (await session.execute(statement)).unique().scalars().all()
+
+
 async def get_nodes_with_dimension(
     session: AsyncSession,
     dimension_node: Node,
@@ -613,105 +467,12 @@ async def get_nodes_with_dimension(
     """
     Find all nodes that can be joined to a given dimension
     """
-    to_process = [dimension_node]
-    processed: Set[str] = set()
-    final_set: Set[NodeRevision] = set()
-    while to_process:
-        current_node = to_process.pop()
-        processed.add(current_node.name)
-
-        # Dimension nodes are used to expand the searchable graph by finding
-        # the next layer of nodes that are linked to this dimension
-        if current_node.type == NodeType.DIMENSION:
-            statement = (
-                select(NodeRevision)
-                .join(
-                    Node,
-                    onclause=(
-                        (NodeRevision.node_id == Node.id)
-                        & (Node.current_version == NodeRevision.version)
-                    ),  # pylint: disable=superfluous-parens
-                )
-                .join(
-                    NodeColumns,
-                    onclause=(
-                        NodeRevision.id == NodeColumns.node_id
-                    ),  # pylint: disable=superfluous-parens
-                )
-                .join(
-                    Column,
-                    onclause=(
-                        NodeColumns.column_id == Column.id
-                    ),  # pylint: disable=superfluous-parens
-                )
-                .where(
-                    Column.dimension_id.in_(  # type: ignore  # pylint: disable=no-member
-                        [current_node.id],
-                    ),
-                )
-            )
-            node_revisions = (
-                (
-                    await session.execute(
-                        statement.options(contains_eager(NodeRevision.node)),
-                    )
-                )
-                .unique()
-                .scalars()
-                .all()
-            )
-
-            dim_link_statement = (
-                select(NodeRevision)
-                .select_from(DimensionLink)
-                .join(
-                    NodeRevision,
-                    onclause=(DimensionLink.node_revision_id == NodeRevision.id),
-                )
-                .join(
-                    Node,
-                    onclause=(
-                        (NodeRevision.node_id == Node.id)
-                        & (Node.current_version == NodeRevision.version)
-                    ),  # pylint: disable=superfluous-parens
-                )
-                .where(DimensionLink.dimension_id.in_([current_node.id]))
-            )
-            nodes_via_dimension_link = (
-                (
-                    await session.execute(
-                        dim_link_statement.options(contains_eager(NodeRevision.node)),
-                    )
-                )
-                .unique()
-                .scalars()
-                .all()
-            )
-            for node_rev in node_revisions + nodes_via_dimension_link:
-                if node_rev.name not in processed:  # pragma: no cover
-                    to_process.append(node_rev.node)
-        else:
-            # All other nodes are added to the result set
-            current_node = await Node.get_by_name(  # type: ignore
-                session,
-                current_node.name,
-                options=[
-                    joinedload(Node.current).options(
-                        *NodeRevision.default_load_options(),
-                    ),
-                    selectinload(Node.children).options(
-                        selectinload(NodeRevision.node),
-                    ),
-                ],
-            )
-            if current_node:
-                final_set.add(current_node.current)
-                for child in current_node.children:
-                    if child.name not in processed:
-                        to_process.append(child.node)
-    if node_types:
-        return [node for node in final_set if node.type in node_types]
-    return list(final_set)
+    graph = await get_graph_index().get(session)
+    return await _get_current_revisions(
+        session,
+        graph.nodes_with_dimension(dimension_node.id),
+        node_types,
+    )
 
 
 async def get_nodes_with_common_dimensions(
@@ -720,22 +481,17 @@ async def get_nodes_with_common_dimensions(
     node_types: Optional[List[NodeType]] = None,
 ) -> List[NodeRevision]:
     """
-    Find all nodes that share a list of common dimensions
+    Find all nodes that share a list of common dimensions. All dimensions are
+    resolved in a single sweep of the graph index and the shared nodes are loaded
+    with one query.
     """
-    nodes_that_share_dimensions = set()
-    first = True
-    for dimension in common_dimensions:
-        new_nodes = await get_nodes_with_dimension(session, dimension, node_types)
-        if first:
-            nodes_that_share_dimensions = set(new_nodes)
-            first = False
-        else:
-            nodes_that_share_dimensions = nodes_that_share_dimensions.intersection(
-                set(new_nodes),
-            )
-            if not nodes_that_share_dimensions:
-                break
-    return list(nodes_that_share_dimensions)
+    graph = await get_graph_index().get(session)
+    node_ids = graph.nodes_with_common_dimensions(
+        [dimension.id for dimension in common_dimensions],
+    )
+    if not node_ids:
+        return []
+    return await _get_current_revisions(session, node_ids, node_types)
 
 
 def topological_sort(nodes: List[Node]) -> List[Node]:
@@ -779,6 +535,30 @@ def topological_sort(nodes: List[Node]) -> List[Node]:
     return sorted_nodes[::-1]
 
 
+def topological_levels(nodes: List[Node]) -> List[List[Node]]:
+    """
+    Group a list of nodes into topological levels. Each node is placed one level after
+    the deepest of its parents in the list, so the nodes within a level never depend on
+    each other and a level only depends on the levels before it.
+    """
+    levels: Dict[str, int] = {}
+    grouped: List[List[Node]] = []
+    for node in topological_sort(nodes):
+        level = max(
+            (
+                levels[parent.name] + 1
+                for parent in node.current.parents
+                if parent.name in levels
+            ),
+            default=0,
+        )
+        levels[node.name] = level
+        if level == len(grouped):
+            grouped.append([])
+        grouped[level].append(node)
+    return grouped
+
+
 async def get_dimension_dag_indegree(session, node_names: List[str]) -> Dict[str, int]:
     """
     For a given node, calculate the indegrees for its dimensions graph by finding the number
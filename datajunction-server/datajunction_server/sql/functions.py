@@ -93,9 +93,17 @@ class Dispatch(metaclass=DispatchMeta):
 
     registry: ClassVar[Dict[str, Dict[Tuple[Tuple[int, Type]], Callable]]] = {}
 
+    # Resolved dispatches by (class, function name, argument types), including
+    # the ones that only match a registered signature through subclasses or varargs.
+    # Types with no matching signature are cached as None.
+    resolved: ClassVar[
+        Dict[Tuple[Type, str, Tuple[Tuple[int, Type], ...]], Optional[Callable]]
+    ] = {}
+
     @classmethod
     def register(cls, func):  # pylint: disable=redefined-outer-name
         func_name = func.__name__
+        cls.resolved.clear()
         params = inspect.signature(func).parameters
         spread_types = [[]]
         cls.registry[cls] = cls.registry.get(cls) or {}
@@ -132,32 +140,47 @@ class Dispatch(metaclass=DispatchMeta):
     def dispatch(  # pylint: disable=redefined-outer-name
         cls, func_name, *args: "Expression"
     ):
+        types = tuple(
+            (i, type(arg.type) if hasattr(arg, "type") else type(arg))
+            for i, arg in enumerate(args)
+        )
+        resolved = cls.resolved
+        key = (cls, func_name, types)
+        try:
+            func = resolved[key]
+        except KeyError:
+            func = resolved[key] = cls.resolve(func_name, types)
+        if func:
+            return func
+        raise TypeError(
+            f"`{cls.__name__}.{func_name}` got an invalid "
+            "combination of types: "
+            f'{", ".join(str(t[1].__name__) for t in types)}',
+        )
+
+    @classmethod
+    def resolve(  # pylint: disable=redefined-outer-name
+        cls,
+        func_name: str,
+        types: Tuple[Tuple[int, Type], ...],
+    ) -> Optional[Callable]:
+        """
+        Find the function registered for the argument types, either by an exact match
+        or by the first registered signature that the types are compatible with
+        """
         type_registry = cls.registry[cls].get(func_name)  # type: ignore
         if not type_registry:
             raise ValueError(
                 f"No function registered on {cls.__name__}`{func_name}`.",
             )  # pragma: no cover
 
-        type_list = []
-        for i, arg in enumerate(args):
-            type_list.append(
-                (i, type(arg.type) if hasattr(arg, "type") else type(arg)),
-            )
-
-        types = tuple(type_list)
-
         if types in type_registry:  # type: ignore
             return type_registry[types]  # type: ignore
 
         for register, func in type_registry.items():  # type: ignore
             if compare_registers(types, register):
                 return func
-
-        raise TypeError(
-            f"`{cls.__name__}.{func_name}` got an invalid "
-            "combination of types: "
-            f'{", ".join(str(t[1].__name__) for t in types)}',
-        )
+        return None
 
 
 class Function(Dispatch):  # pylint: disable=too-few-public-methods
@@ -0,0 +1,579 @@
+"""
+In-process index of the node graph.
+
+The index holds the lightweight skeleton of the DJ graph (nodes, parent relationships,
+column -> dimension references and dimension links) so that DAG traversals can be
+answered from memory instead of recursive CTEs. The index is rebuilt whenever the
+graph fingerprint in the metadata database changes.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from datajunction_server.database.attributetype import AttributeType, ColumnAttribute
+from datajunction_server.database.column import Column
+from datajunction_server.database.dimensionlink import DimensionLink
+from datajunction_server.database.history import History
+from datajunction_server.database.node import (
+    Node,
+    NodeColumns,
+    NodeRelationship,
+    NodeRevision,
+)
+from datajunction_server.models.node import DimensionAttributeOutput
+from datajunction_server.models.node_type import NodeType
+
+# (column name, column type, comma-separated attribute type names)
+IndexedColumn = Tuple[str, str, Optional[str]]
+
+
+@dataclass
+class IndexedNode:
+    """
+    A node in the graph index along with its current revision
+    """
+
+    id: int
+    name: str
+    type: NodeType
+    active: bool
+    current_revision_id: Optional[int]
+    display_name: Optional[str]
+
+
+@dataclass
+class Reachability:
+    """
+    The dimension attributes reachable from a node revision, keyed by the dimension
+    paths (and the revisions along them) that they were computed from.
+    """
+
+    key: Tuple
+    node_names: Set[str]
+    attributes: List[DimensionAttributeOutput]
+
+
+@dataclass
+class GraphSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    A point-in-time copy of the node graph
+    """
+
+    fingerprint: Tuple = ()
+    nodes: Dict[int, IndexedNode] = field(default_factory=dict)
+
+    # Current node revision id -> ids of its parent nodes
+    parents: Dict[int, Set[int]] = field(default_factory=dict)
+
+    # Parent node id -> (child node id, is current revision, child revision type)
+    children: Dict[int, Set[Tuple[int, bool, NodeType]]] = field(default_factory=dict)
+
+    # Node revision id -> (column name or [role], dimension node id)
+    branches: Dict[int, List[Tuple[str, int]]] = field(default_factory=dict)
+
+    # Dimension node id -> ids of nodes whose current revision references it
+    referencing: Dict[int, Set[int]] = field(default_factory=dict)
+
+    # Node revision id -> columns, loaded lazily
+    columns: Dict[int, List[IndexedColumn]] = field(default_factory=dict)
+
+    # Node revision id -> (name, display name), loaded lazily
+    labels: Dict[int, Tuple[str, Optional[str]]] = field(default_factory=dict)
+
+    # Node revision id -> reachable dimension attributes, computed lazily
+    reachability: Dict[int, Reachability] = field(default_factory=dict)
+
+    def is_current(self, node_id: int, revision_id: int) -> bool:
+        """
+        Whether the node revision is the current revision of the node
+        """
+        node = self.nodes.get(node_id)
+        return node is not None and node.current_revision_id == revision_id
+
+    def downstream_depths(
+        self, node_id: int, include_cubes: bool = True
+    ) -> Dict[int, int]:
+        """
+        Finds all downstream nodes of the given node along with the length of the
+        longest path to each of them. The first layer of children only considers
+        current node revisions.
+        """
+        edges: Dict[int, Set[int]] = {}
+        first_layer = {
+            child_id
+            for child_id, is_current, child_type in self.children.get(node_id, set())
+            if is_current and (include_cubes or child_type != NodeType.CUBE)
+        }
+        to_process = list(first_layer)
+        reachable: Set[int] = set(first_layer)
+        while to_process:
+            current = to_process.pop()
+            next_layer = {
+                child_id
+                for child_id, _, child_type in self.children.get(current, set())
+                if include_cubes or child_type != NodeType.CUBE
+            }
+            edges[current] = next_layer
+            for child_id in next_layer - reachable:
+                reachable.add(child_id)
+                to_process.append(child_id)
+
+        # Longest path lengths via a topological walk of the reachable subgraph
+        indegrees = {child_id: 0 for child_id in reachable}
+        for targets in edges.values():
+            for target in targets:
+                indegrees[target] += 1
+        depths = {child_id: 0 for child_id in reachable}
+        queue = [child_id for child_id, degree in indegrees.items() if degree == 0]
+        while queue:
+            current = queue.pop()
+            for target in edges.get(current, set()):
+                depths[target] = max(depths[target], depths[current] + 1)
+                indegrees[target] -= 1
+                if indegrees[target] == 0:
+                    queue.append(target)
+        return depths
+
+    def upstream_ids(self, revision_id: int) -> Set[int]:
+        """
+        Finds the ids of all upstream nodes of the given node revision by following
+        the current revisions of each parent.
+        """
+        upstreams: Set[int] = set()
+        to_process = [revision_id]
+        while to_process:
+            current = to_process.pop()
+            for parent_id in self.parents.get(current, set()):
+                parent = self.nodes.get(parent_id)
+                if (
+                    parent is None
+                    or parent.current_revision_id is None
+                    or parent_id in upstreams
+                ):
+                    continue
+                upstreams.add(parent_id)
+                to_process.append(parent.current_revision_id)
+        return upstreams
+
+    def dimension_paths(
+        self,
+        revision_id: int,
+        revision_name: str,
+    ) -> List[Tuple[int, str]]:
+        """
+        Walks the dimensions graph of the node revision, returning each reachable
+        dimension node id together with the join path used to reach it. Join paths
+        are formatted as `<node>.<column or [role]>,<dimension>` segments.
+        """
+        paths: List[Tuple[int, str]] = []
+        to_process: List[Tuple[int, str, str, Set[int]]] = [
+            (revision_id, revision_name, "", set()),
+        ]
+        while to_process:
+            current_rev, prefix, join_path, visited = to_process.pop()
+            for branch_name, dimension_id in self.branches.get(current_rev, []):
+                dimension = self.nodes.get(dimension_id)
+                if (
+                    dimension is None
+                    or not dimension.active
+                    or dimension.current_revision_id is None
+                    or dimension_id in visited
+                ):
+                    continue
+                path = f"{join_path or prefix}.{branch_name},{dimension.name}"
+                paths.append((dimension_id, path))
+                to_process.append(
+                    (
+                        dimension.current_revision_id,
+                        dimension.name,
+                        path,
+                        visited | {dimension_id},
+                    ),
+                )
+        return paths
+
+    def reachability_key(self, paths: List[Tuple[int, str]]) -> Tuple:
+        """
+        Identifies a set of dimension paths along with the current revisions of the
+        dimension nodes on them.
+        """
+        return tuple(
+            (dimension_id, self.nodes[dimension_id].current_revision_id, join_path)
+            for dimension_id, join_path in paths
+        )
+
+    def nodes_with_dimension(self, dimension_id: int) -> Set[int]:
+        """
+        Finds the ids of all non-dimension nodes that can be joined to the dimension,
+        either directly or through other dimensions or upstream nodes.
+        """
+        return self.nodes_with_common_dimensions([dimension_id])
+
+    def nodes_with_common_dimensions(self, dimension_ids: List[int]) -> Set[int]:
+        """
+        Finds the ids of all non-dimension nodes that can be joined to every one of
+        the dimensions. All dimensions are swept in a single pass by tracking, per node,
+        a bitmask of the dimensions that can reach it.
+        """
+        if not dimension_ids:
+            return set()
+        reached: Dict[int, int] = {}
+        to_process = [
+            (dimension_id, 1 << idx) for idx, dimension_id in enumerate(dimension_ids)
+        ]
+        while to_process:
+            current_id, mask = to_process.pop()
+            new_mask = mask & ~reached.get(current_id, 0)
+            current = self.nodes.get(current_id)
+            if not new_mask or current is None:
+                continue
+            reached[current_id] = reached.get(current_id, 0) | new_mask
+            if current.type == NodeType.DIMENSION:
+                next_ids: Iterable[int] = self.referencing.get(current_id, set())
+            elif current.active and current.current_revision_id is not None:
+                next_ids = {
+                    child_id for child_id, _, _ in self.children.get(current_id, set())
+                }
+            else:
+                continue
+            to_process.extend((node_id, new_mask) for node_id in next_ids)
+
+        all_dimensions = (1 << len(dimension_ids)) - 1
+        return {
+            node_id
+            for node_id, mask in reached.items()
+            if mask == all_dimensions
+            and self.nodes[node_id].type != NodeType.DIMENSION
+            and self.nodes[node_id].active
+            and self.nodes[node_id].current_revision_id is not None
+        }
+
+
+def _branch_name(column_name: Optional[str], role: Optional[str]) -> str:
+    """
+    Column branches are named after the column, dimension link branches by role
+    """
+    return column_name if column_name is not None else f"[{role or ''}]"
+
+
+class GraphIndex:
+    """
+    Process-wide cache of the node graph, refreshed whenever nodes, node revisions,
+    dimension links or history events change in the metadata database.
+    """
+
+    def __init__(self):
+        self.snapshot = GraphSnapshot()
+
+    @staticmethod
+    async def fingerprint(session: AsyncSession) -> Tuple:
+        """
+        A cheap summary of the graph state. Every change to the graph either creates
+        a node revision, records a history event, or (de)activates a node or link.
+        The time of the earliest history event tells apart databases that have been
+        recreated, whose ids can refer to different nodes than before.
+        """
+        statement = select(
+            select(func.max(History.id)).scalar_subquery(),
+            select(func.max(History.created_at)).scalar_subquery(),
+            select(func.max(NodeRevision.id)).scalar_subquery(),
+            select(func.max(NodeRevision.updated_at)).scalar_subquery(),
+            select(
+                func.count(Node.id),  # pylint: disable=not-callable
+            ).scalar_subquery(),
+            select(
+                func.count(Node.deactivated_at),  # pylint: disable=not-callable
+            ).scalar_subquery(),
+            select(
+                func.count(DimensionLink.id),  # pylint: disable=not-callable
+            ).scalar_subquery(),
+            select(func.min(History.created_at)).scalar_subquery(),
+        )
+        return tuple((await session.execute(statement)).one())
+
+    async def get(self, session: AsyncSession) -> GraphSnapshot:
+        """
+        Returns an up-to-date snapshot of the graph, rebuilding it if stale.
+        """
+        fingerprint = await self.fingerprint(session)
+        if self.snapshot.fingerprint != fingerprint:
+            snapshot = await self.build(session, fingerprint)
+            await self.carry_over(session, self.snapshot, snapshot)
+            self.snapshot = snapshot
+        return self.snapshot
+
+    @staticmethod
+    async def carry_over(
+        session: AsyncSession,
+        previous: GraphSnapshot,
+        snapshot: GraphSnapshot,
+    ) -> None:
+        """
+        Incrementally refreshes a new snapshot from the previous one. Lazily loaded
+        columns, branches and reachability entries are kept unless a history event
+        recorded since the previous snapshot touched one of the nodes involved, and
+        nothing is kept if the history doesn't start at the same time as before.
+        """
+        if not previous.fingerprint or snapshot.fingerprint[0] is None:
+            return
+        if snapshot.fingerprint[-1] != previous.fingerprint[-1]:
+            return
+        previous_history_id = previous.fingerprint[0] or 0
+        if snapshot.fingerprint[0] < previous_history_id:
+            return  # pragma: no cover
+        changed = set()
+        for node_name, entity_name in await session.execute(
+            select(History.node, History.entity_name).where(
+                History.id > previous_history_id,
+            ),
+        ):
+            changed.update({node_name, entity_name})
+
+        for revision_id, (name, display_name) in previous.labels.items():
+            if name not in changed:
+                snapshot.labels[revision_id] = (name, display_name)
+                snapshot.columns[revision_id] = previous.columns[revision_id]
+        for revision_id, branches in previous.branches.items():
+            if revision_id not in snapshot.branches and revision_id in snapshot.labels:
+                snapshot.branches[revision_id] = branches
+        for revision_id, reachability in previous.reachability.items():
+            if not reachability.node_names & changed:
+                snapshot.reachability[revision_id] = reachability
+
+    def invalidate(self):
+        """
+        Drops the cached snapshot
+        """
+        self.snapshot = GraphSnapshot()
+
+    @classmethod
+    async def build(cls, session: AsyncSession, fingerprint: Tuple) -> GraphSnapshot:
+        """
+        Loads the graph skeleton for the current revisions of all nodes.
+        """
+        snapshot = GraphSnapshot(fingerprint=fingerprint)
+        await cls._load_nodes(session, snapshot)
+        await cls._load_relationships(session, snapshot)
+        current_revision_ids = [
+            node.current_revision_id
+            for node in snapshot.nodes.values()
+            if node.current_revision_id is not None
+        ]
+        await cls._load_branches(session, snapshot, current_revision_ids, bulk=True)
+        return snapshot
+
+    @staticmethod
+    async def _load_nodes(session: AsyncSession, snapshot: GraphSnapshot) -> None:
+        """
+        Loads every node along with its current revision's id and display name.
+        """
+        nodes = await session.execute(
+            select(
+                Node.id,
+                Node.name,
+                Node.type,
+                Node.deactivated_at,
+                NodeRevision.id,
+                NodeRevision.display_name,
+            ).outerjoin(
+                NodeRevision,
+                and_(
+                    NodeRevision.node_id == Node.id,
+                    NodeRevision.version == Node.current_version,
+                ),
+            ),
+        )
+        for node_id, name, type_, deactivated_at, revision_id, display_name in nodes:
+            snapshot.nodes[node_id] = IndexedNode(
+                id=node_id,
+                name=name,
+                type=type_,
+                active=deactivated_at is None,
+                current_revision_id=revision_id,
+                display_name=display_name,
+            )
+
+    @staticmethod
+    async def _load_relationships(
+        session: AsyncSession,
+        snapshot: GraphSnapshot,
+    ) -> None:
+        """
+        Loads the parent -> child edges of all node revisions. Children are kept for
+        every revision, while parents are only kept for current revisions.
+        """
+        relationships = await session.execute(
+            select(
+                NodeRelationship.parent_id,
+                NodeRevision.id,
+                NodeRevision.node_id,
+                NodeRevision.type,
+            ).join(NodeRevision, NodeRelationship.child_id == NodeRevision.id),
+        )
+        for parent_id, revision_id, child_id, child_type in relationships:
+            is_current = snapshot.is_current(child_id, revision_id)
+            snapshot.children.setdefault(parent_id, set()).add(
+                (child_id, is_current, child_type),
+            )
+            if is_current:
+                snapshot.parents.setdefault(revision_id, set()).add(parent_id)
+
+    @staticmethod
+    async def _load_branches(
+        session: AsyncSession,
+        snapshot: GraphSnapshot,
+        revision_ids: List[int],
+        bulk: bool = False,
+    ) -> None:
+        """
+        Loads the column -> dimension and dimension link branches for node revisions.
+        When `bulk` is set, the branches of all current revisions are loaded instead
+        of filtering by the revision ids.
+        """
+        current_revision = and_(
+            Node.id == NodeRevision.node_id,
+            Node.current_version == NodeRevision.version,
+        )
+        column_branches = (
+            select(NodeColumns.node_id, Column.name, Column.dimension_id)
+            .select_from(NodeColumns)
+            .join(Column, NodeColumns.column_id == Column.id)
+            .where(Column.dimension_id.is_not(None))
+        )
+        link_branches = select(
+            DimensionLink.node_revision_id,
+            DimensionLink.role,
+            DimensionLink.dimension_id,
+        ).select_from(DimensionLink)
+        if bulk:
+            column_branches = column_branches.join(
+                NodeRevision,
+                NodeColumns.node_id == NodeRevision.id,
+            ).join(Node, current_revision)
+            link_branches = link_branches.join(
+                NodeRevision,
+                DimensionLink.node_revision_id == NodeRevision.id,
+            ).join(Node, current_revision)
+        else:
+            column_branches = column_branches.where(
+                NodeColumns.node_id.in_(revision_ids),
+            )
+            link_branches = link_branches.where(
+                DimensionLink.node_revision_id.in_(revision_ids),
+            )
+
+        for revision_id in revision_ids:
+            snapshot.branches.setdefault(revision_id, [])
+        for revision_id, column_name, dimension_id in await session.execute(
+            column_branches,
+        ):
+            snapshot.branches[revision_id].append(
+                (_branch_name(column_name, None), dimension_id),
+            )
+        for revision_id, role, dimension_id in await session.execute(link_branches):
+            snapshot.branches[revision_id].append(
+                (_branch_name(None, role), dimension_id),
+            )
+        if bulk:
+            for node in snapshot.nodes.values():
+                for _, dimension_id in snapshot.branches.get(
+                    node.current_revision_id,  # type: ignore
+                    [],
+                ):
+                    snapshot.referencing.setdefault(dimension_id, set()).add(node.id)
+
+    async def branches(
+        self,
+        session: AsyncSession,
+        snapshot: GraphSnapshot,
+        revision_id: int,
+    ) -> List[Tuple[str, int]]:
+        """
+        Dimension branches for a node revision, loading them if the revision is not
+        a current revision.
+        """
+        if revision_id not in snapshot.branches:
+            await self._load_branches(session, snapshot, [revision_id])
+        return snapshot.branches[revision_id]
+
+    @staticmethod
+    async def columns(
+        session: AsyncSession,
+        snapshot: GraphSnapshot,
+        revision_ids: Iterable[int],
+    ) -> Dict[int, List[IndexedColumn]]:
+        """
+        Columns (with their attribute types) for the node revisions, loaded in a
+        single query for any revisions that haven't been seen yet.
+        """
+        revision_ids = set(revision_ids)
+        missing = [
+            revision_id
+            for revision_id in revision_ids
+            if revision_id not in snapshot.columns
+        ]
+        if missing:
+            attributes: Dict[Tuple[int, str], List[str]] = {}
+            column_types: Dict[Tuple[int, str], str] = {}
+            statement = (
+                select(
+                    NodeColumns.node_id,
+                    Column.name,
+                    Column.type,
+                    AttributeType.name,
+                )
+                .select_from(NodeColumns)
+                .join(Column, NodeColumns.column_id == Column.id)
+                .join(
+                    ColumnAttribute,
+                    Column.id == ColumnAttribute.column_id,
+                    isouter=True,
+                )
+                .join(
+                    AttributeType,
+                    ColumnAttribute.attribute_type_id == AttributeType.id,
+                    isouter=True,
+                )
+                .where(NodeColumns.node_id.in_(missing))
+            )
+            for revision_id, name, type_, attribute in await session.execute(
+                statement,
+            ):
+                key = (revision_id, name)
+                column_types.setdefault(key, str(type_))
+                attributes.setdefault(key, [])
+                if attribute is not None:
+                    attributes[key].append(attribute)
+            for revision_id in missing:
+                snapshot.columns[revision_id] = []
+            for (revision_id, name), type_ in column_types.items():
+                snapshot.columns[revision_id].append(
+                    (
+                        name,
+                        type_,
+                        ",".join(attributes[(revision_id, name)]) or None,
+                    ),
+                )
+            labels = await session.execute(
+                select(
+                    NodeRevision.id,
+                    NodeRevision.name,
+                    NodeRevision.display_name,
+                ).where(NodeRevision.id.in_(missing)),
+            )
+            for revision_id, name, display_name in labels:
+                snapshot.labels[revision_id] = (name, display_name)
+        return {
+            revision_id: snapshot.columns[revision_id] for revision_id in revision_ids
+        }
+
+
+@lru_cache(maxsize=None)
+def get_graph_index() -> GraphIndex:
+    """
+    Return the process-wide graph index.
+    """
+    return GraphIndex()
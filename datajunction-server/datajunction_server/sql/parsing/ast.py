@@ -29,7 +29,11 @@ from typing import (
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
-from datajunction_server.construction.utils import get_dj_node, to_namespaced_name
+from datajunction_server.construction.utils import (
+    get_dj_node,
+    prefetch_dj_nodes,
+    to_namespaced_name,
+)
 from datajunction_server.database.dimensionlink import DimensionLink
 from datajunction_server.database.node import Node as DJNodeRef
 from datajunction_server.database.node import NodeRevision
@@ -79,6 +83,120 @@ def flatten(maybe_iterables: Any) -> Iterator:
     )
 
 
+def clone(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    A faster equivalent of `deepcopy` for asts. Produces the same copy that `deepcopy`
+    would, but knows how ast nodes are laid out: nodes are rebuilt straight from their
+    `__dict__` and atoms are returned as-is, skipping the generic `__reduce_ex__`
+    machinery. Anything else (including types with their own `__deepcopy__`, like
+    `Function` and `ColumnType`) is handed to `deepcopy` with the shared memo.
+    """
+    if memo is None:
+        memo = {}
+    copier = _COPIERS.get(type(value))
+    if copier is None:
+        copier = _COPIERS[type(value)] = _copier_for(type(value))
+    return copier(value, memo)
+
+
+def _clone_atom(value: Any, memo: Dict[int, Any]) -> Any:
+    return value
+
+
+def _clone_node(node: "Node", memo: Dict[int, Any]) -> "Node":
+    key = id(node)
+    if key in memo:
+        return memo[key]
+    new = object.__new__(type(node))
+    memo[key] = new
+    new_dict = new.__dict__
+    for name, value in node.__dict__.items():
+        copier = _COPIERS.get(type(value))
+        new_dict[name] = (
+            copier(value, memo) if copier is not None else clone(value, memo)
+        )
+    return new
+
+
+def _clone_list(values: list, memo: Dict[int, Any]) -> list:
+    key = id(values)
+    if key in memo:
+        return memo[key]
+    new: list = []
+    memo[key] = new
+    new.extend(clone(value, memo) for value in values)
+    return new
+
+
+def _clone_tuple(values: tuple, memo: Dict[int, Any]) -> tuple:
+    key = id(values)
+    if key in memo:
+        return memo[key]
+    new = tuple(clone(value, memo) for value in values)
+    if all(old is copied for old, copied in zip(values, new)):
+        new = values
+    memo[key] = new
+    return new
+
+
+def _clone_set(values: set, memo: Dict[int, Any]) -> set:
+    key = id(values)
+    if key in memo:
+        return memo[key]
+    new = {clone(value, memo) for value in values}
+    memo[key] = new
+    return new
+
+
+def _clone_dict(values: dict, memo: Dict[int, Any]) -> dict:
+    key = id(values)
+    if key in memo:
+        return memo[key]
+    new: dict = {}
+    memo[key] = new
+    for name, value in values.items():
+        new[clone(name, memo)] = clone(value, memo)
+    return new
+
+
+def _copier_for(type_: type) -> Callable[[Any, Dict[int, Any]], Any]:
+    """
+    Picks the copy function for values of a given type
+    """
+    if issubclass(type_, Node) and type_.__deepcopy__ is Node.__deepcopy__:
+        return _clone_node
+    if type_ in PRIMITIVES or issubclass(type_, Enum):
+        return _clone_atom
+    return {
+        list: _clone_list,
+        tuple: _clone_tuple,
+        set: _clone_set,
+        dict: _clone_dict,
+    }.get(type_, deepcopy)
+
+
+_COPIERS: Dict[type, Callable[[Any, Dict[int, Any]], Any]] = {}
+
+
+def _field_names(type_: type, obfuscated: bool) -> Tuple[str, ...]:
+    """
+    The dataclass field names of an ast node type, optionally including the
+    obfuscated ones (with a leading `_`). Computed once per type, so that traversals
+    don't have to go through dataclass reflection for every node.
+    """
+    names = _FIELD_NAMES.get((type_, obfuscated))
+    if names is None:
+        names = _FIELD_NAMES[(type_, obfuscated)] = tuple(
+            field_.name
+            for field_ in fields(type_)
+            if obfuscated or not field_.name.startswith("_")
+        )
+    return names
+
+
+_FIELD_NAMES: Dict[Tuple[type, bool], Tuple[str, ...]] = {}
+
+
 @dataclass
 class CompileContext:
     session: AsyncSession
@@ -113,9 +231,12 @@ class Node(ABC):
 
     @property
     def depth(self) -> int:
-        if self.parent is None:
-            return 0
-        return self.parent.depth + 1
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
 
     def clear_parent(self: TNode) -> TNode:
         """
@@ -155,8 +276,13 @@ class Node(ABC):
             return
 
         object.__setattr__(self, key, value)
+        if key.startswith("_") or type(value) in PRIMITIVES:
+            return
+        if isinstance(value, Node):
+            value.set_parent(self, key)
+            return
         for child in flatten(value):
-            if isinstance(child, Node) and not key.startswith("_"):
+            if isinstance(child, Node):
                 child.set_parent(self, key)
 
     def swap(self: TNode, other: "Node") -> TNode:
@@ -188,7 +314,10 @@ class Node(ABC):
         """
         Create a deep copy of the `self`
         """
-        return deepcopy(self)
+        return clone(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        return _clone_node(self, memo)
 
     def get_nearest_parent_of_type(
         self: "Node",
@@ -253,17 +382,15 @@ class Node(ABC):
             Makes a generator enclosing self to return
             not obfuscated fields (fields without starting `_`)
             """
-            for self_field in fields(self):
-                if (
-                    not self_field.name.startswith("_") if not obfuscated else True
-                ) and (self_field.name in self.__dict__):
-                    value = self.__dict__[self_field.name]
+            for name in _field_names(type(self), obfuscated):
+                if name in self.__dict__:
+                    value = self.__dict__[name]
                     values = [value]
                     if flat:
                         values = flatten(value)
                     for value in values:
                         if named:
-                            yield (self_field.name, value)
+                            yield (name, value)
                         else:
                             yield value
 
@@ -298,13 +425,15 @@ class Node(ABC):
         Returns an iterator of all nodes that are one
         step from the current node down including through iterables
         """
-        return self.fields(
-            flat=True,
-            nodes_only=True,
-            obfuscated=False,
-            nones=False,
-            named=False,
-        )
+        values = self.__dict__
+        for name in _field_names(type(self), False):
+            value = values.get(name)
+            if isinstance(value, Node):
+                yield value
+            elif isinstance(value, (list, tuple, set, Iterator)):
+                for child in flatten(value):
+                    if isinstance(child, Node):
+                        yield child
 
     def replace(  # pylint: disable=invalid-name
         self,
@@ -336,11 +465,12 @@ class Node(ABC):
         """
         Find all nodes that `func` returns `True` for
         """
-        if func(self):
-            yield self
-
-        for node in chain(*[child.filter(func) for child in self.children]):
-            yield node
+        stack: List["Node"] = [self]
+        while stack:
+            node = stack.pop()
+            if func(node):
+                yield node
+            stack.extend(reversed(list(node.children)))
 
     def contains(self, other: "Node") -> bool:
         """
@@ -2632,6 +2762,25 @@ class Query(TableExpression, UnNamed):
         if self._is_compiled:
             return
 
+        if self.parent is None:
+            # Load all the nodes referenced anywhere in the query at once, rather than
+            # one at a time as each of the tables is compiled. References to CTEs are
+            # left out, as they are never nodes.
+            cte_names = {
+                cte.alias_or_name.identifier(quotes=False)
+                for query in self.find_all(Query)
+                for cte in query.ctes
+            }
+            await prefetch_dj_nodes(
+                ctx.session,
+                {
+                    table.identifier(quotes=False)
+                    for table in self.find_all(Table)
+                    if not table.dj_node
+                }
+                - cte_names,
+            )
+
         for child in self.children:
             if child is not self and not child.is_compiled():
                 await child.compile(ctx)
@@ -2,13 +2,14 @@
 # mypy: ignore-errors
 import inspect
 import logging
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union, cast
 
 import antlr4
 from antlr4 import InputStream, RecognitionException
 from antlr4.error.ErrorListener import ErrorListener
 from antlr4.error.Errors import ParseCancellationException
 from antlr4.error.ErrorStrategy import BailErrorStrategy
+from cachetools import LRUCache
 
 import datajunction_server.sql.parsing.types as ct
 from datajunction_server.sql.parsing import ast
@@ -179,13 +180,75 @@ def parse_rule(sql: str, rule: str) -> Union[ast.Node, "ColumnType"]:
     return ast_tree
 
 
+# Estimated memory held by a cached parse tree per SQL token, covering its rule
+# contexts and token objects. Measured at roughly 0.7-1.1 KiB per token on typical
+# node queries.
+PARSE_TREE_BYTES_PER_TOKEN = 1024
+
+
+class ParseCache(LRUCache):
+    """
+    Content-addressed cache of ANTLR parse trees for SQL statements, bounded by the
+    estimated memory held by the cached trees (see `PARSE_TREE_BYTES_PER_TOKEN`).
+    ANTLR parsing is by far the most expensive part of building a DJ ast, while the
+    parse trees are never mutated, so each hit only has to re-run the visitor to
+    produce a fresh, independent ast.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize, getsizeof=lambda entry: entry[0])
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def popitem(self):
+        self.evictions += 1
+        return super().popitem()
+
+    @staticmethod
+    def estimate_size(tree) -> int:
+        """
+        Estimated memory held by a parse tree, in bytes
+        """
+        tokens = tree.stop.tokenIndex - tree.start.tokenIndex + 1
+        return tokens * PARSE_TREE_BYTES_PER_TOKEN
+
+    def parse(self, sql: str):
+        """
+        The ANTLR parse tree for a SQL statement, parsing it on a miss
+        """
+        entry = self.get(sql)
+        if entry is not None:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        tree = parse_sql(sql, "singleStatement")
+        size = self.estimate_size(tree)
+        if size <= self.maxsize:
+            self[sql] = (size, tree)
+        return tree
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": int(self.currsize),
+            "maxsize": int(self.maxsize),
+        }
+
+
+# Up to ~128 MiB worth of parse trees
+parse_cache = ParseCache(maxsize=128 * 1024 * 1024)
+
+
 def parse(sql: Optional[str]) -> ast.Query:
     """
     Parse a string sql query into a DJ ast Query
     """
     if not sql:
         raise DJParseException("Empty query provided!")
-    return cast(ast.Query, parse_rule(sql, "singleStatement"))
+    return cast(ast.Query, visit(parse_cache.parse(sql)))
 
 
 TERMINAL_NODE = antlr4.tree.Tree.TerminalNodeImpl
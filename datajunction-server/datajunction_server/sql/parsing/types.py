@@ -13,6 +13,7 @@ field_type=IntegerType(), is_optional=True, doc='an optional field'))
 """
 
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generator, Optional, Tuple, cast
 
 from pydantic import BaseModel, Extra
@@ -92,11 +93,7 @@ class ColumnType(BaseModel):
         """
         Parses the column type
         """
-        from datajunction_server.sql.parsing.backends.antlr4 import (  # pylint: disable=import-outside-toplevel
-            parse_rule,
-        )
-
-        return cast(ColumnType, parse_rule(str(v), "dataType"))
+        return parse_column_type(str(v))
 
     def __eq__(self, other: "ColumnType"):  # type: ignore
         """
@@ -940,3 +937,23 @@ PRIMITIVE_TYPES: Dict[str, PrimitiveType] = {
     "null": NullType(),
     "wildcard": WildcardType(),
 }
+
+
+@lru_cache(maxsize=4096)
+def parse_column_type(type_string: str) -> ColumnType:
+    """
+    Parses a column type string like ``map<string, array<int>>`` into a column type.
+
+    Column types are immutable (they are never copied, see ``ColumnType.__deepcopy__``)
+    and the set of distinct type strings is small, so parsed types are interned and
+    shared between callers. Plain primitive types skip the ANTLR parser altogether.
+    """
+    primitive_type = PRIMITIVE_TYPES.get(type_string.strip().lower())
+    if primitive_type is not None:
+        return primitive_type
+
+    from datajunction_server.sql.parsing.backends.antlr4 import (  # pylint: disable=import-outside-toplevel
+        parse_rule,
+    )
+
+    return cast(ColumnType, parse_rule(type_string, "dataType"))
@@ -30,7 +30,10 @@ from datajunction_server.config import Settings
 from datajunction_server.database.user import User
 from datajunction_server.enum import StrEnum
 from datajunction_server.errors import DJException
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import (
+    AsyncQueryServiceClient,
+    QueryServiceClient,
+)
 
 
 def setup_logging(loglevel: str) -> None:
@@ -171,6 +174,25 @@ def get_query_service_client() -> Optional[QueryServiceClient]:
     return QueryServiceClient(settings.query_service)
 
 
+@lru_cache
+def get_async_query_service_client() -> Optional[AsyncQueryServiceClient]:
+    """
+    Return the async query service client, which is shared so that its connection
+    pool is reused across requests
+    """
+    settings = get_settings()
+    if not settings.query_service:  # pragma: no cover
+        return None
+    return AsyncQueryServiceClient(
+        settings.query_service,
+        retries=settings.query_service_retries,
+        timeout=settings.query_service_timeout,
+        max_connections=settings.query_service_max_connections,
+        max_keepalive_connections=settings.query_service_max_keepalive_connections,
+        max_concurrency=settings.query_service_max_concurrency,
+    )
+
+
 def get_issue_url(
     baseurl: URL = URL("https://github.com/DataJunction/dj/issues/new"),
     title: Optional[str] = None,
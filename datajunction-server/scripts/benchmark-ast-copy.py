@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# pylint: skip-file
+
+import argparse
+import glob
+import timeit
+from contextlib import contextmanager
+from copy import deepcopy
+
+from datajunction_server.api.main import app  # noqa: F401  (resolves import order)
+from datajunction_server.sql.parsing import ast
+from datajunction_server.sql.parsing.backends.antlr4 import parse
+
+
+@contextmanager
+def generic_deepcopy():
+    """
+    Temporarily drop the ast-aware `__deepcopy__` so that `deepcopy` goes through
+    the generic `__reduce_ex__` path, as `Node.copy` used to.
+    """
+    node_deepcopy = ast.Node.__dict__["__deepcopy__"]
+    del ast.Node.__deepcopy__
+    try:
+        yield
+    finally:
+        ast.Node.__deepcopy__ = node_deepcopy
+
+
+def benchmark(pattern: str, number: int):
+    queries = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as infile:
+            try:
+                queries.append(parse(infile.read()))
+            except Exception:
+                continue
+
+    # Copy whole queries as well as expressions inside them, which drags the rest of
+    # the tree along with it
+    targets = []
+    for query in queries:
+        targets.append(query)
+        targets.extend(list(query.find_all(ast.BinaryOp))[:3])
+
+    with generic_deepcopy():
+        deepcopy_time = timeit.timeit(
+            lambda: [deepcopy(target) for target in targets],
+            number=number,
+        )
+    copy_time = timeit.timeit(
+        lambda: [target.copy() for target in targets],
+        number=number,
+    )
+    print(f"{len(queries)} queries, {len(targets)} copies x {number}")
+    print(f"deepcopy:  {deepcopy_time:.3f}s")
+    print(f"Node.copy: {copy_time:.3f}s ({deepcopy_time / copy_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare Node.copy against deepcopy on a set of SQL queries",
+    )
+    parser.add_argument(
+        "-q",
+        "--queries",
+        dest="pattern",
+        default="tests/sql/parsing/queries/tpcds/sparksql/*.sql",
+        metavar="GLOB",
+    )
+    parser.add_argument("-n", "--number", type=int, default=3)
+    args = vars(parser.parse_args())
+    benchmark(**args)
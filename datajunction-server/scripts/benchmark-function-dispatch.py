@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# pylint: skip-file
+
+import argparse
+import timeit
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from datajunction_server.api.main import app  # noqa: F401  (resolves import order)
+from datajunction_server.sql.functions import Dispatch
+
+
+def leaf(type_):
+    """
+    The most derived class of a type, so that dispatching it has to go through the
+    subclass checks rather than an exact match
+    """
+    while type_.__subclasses__():
+        type_ = type_.__subclasses__()[0]
+    return type_
+
+
+def argument(type_):
+    instance = type_.__new__(type_)
+    return SimpleNamespace(type=instance)
+
+
+def calls():
+    """
+    One dispatch per registered signature, with arguments of the exact registered
+    types as well as of subclasses of them. Varargs are passed three times.
+    """
+    for cls, functions in Dispatch.registry.items():
+        for func_name, signatures in functions.items():
+            for signature in signatures:
+                for convert in (lambda type_: type_, leaf):
+                    try:
+                        args = []
+                        for position, type_ in signature:
+                            repeat = 3 if position == -1 else 1
+                            args.extend(argument(convert(type_)) for _ in range(repeat))
+                    except TypeError:
+                        continue
+                    yield cls, func_name, tuple(args)
+
+
+class Uncached(dict):
+    def __setitem__(self, key, value):
+        pass
+
+
+@contextmanager
+def uncached():
+    """
+    Temporarily stop caching resolved dispatches, so that every dispatch resolves the
+    argument types against the registered signatures as it used to
+    """
+    resolved = Dispatch.resolved
+    Dispatch.resolved = Uncached()
+    try:
+        yield
+    finally:
+        Dispatch.resolved = resolved
+
+
+def benchmark(number: int):
+    dispatches = list(calls())
+
+    def dispatch():
+        for cls, func_name, args in dispatches:
+            try:
+                cls.dispatch(func_name, *args)
+            except TypeError:
+                pass
+
+    with uncached():
+        resolve_time = timeit.timeit(dispatch, number=number)
+    dispatch()  # warm the resolution cache
+    dispatch_time = timeit.timeit(dispatch, number=number)
+    print(
+        f"{len(Dispatch.registry)} functions, {len(dispatches)} dispatches x {number}",
+    )
+    print(f"uncached: {resolve_time:.3f}s")
+    print(f"cached:   {dispatch_time:.3f}s ({resolve_time / dispatch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare cached and uncached function dispatch over all registered "
+        "function signatures",
+    )
+    parser.add_argument("-n", "--number", type=int, default=100)
+    args = vars(parser.parse_args())
+    benchmark(**args)
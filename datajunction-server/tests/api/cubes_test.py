@@ -9,8 +9,10 @@ import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 
+from datajunction_server.api.helpers import is_additive_combiner
 from datajunction_server.internal.nodes import derive_sql_column
 from datajunction_server.models.cube import CubeElementMetadata
+from datajunction_server.models.materialization import MetricMeasures
 from datajunction_server.models.node import ColumnOutput
 from datajunction_server.models.query import ColumnMetadata
 from datajunction_server.service_clients import QueryServiceClient
@@ -906,6 +908,23 @@ SELECT  default_DOT_repair_orders_fact.default_DOT_repair_orders_fact_DOT_repair
         data["materializations"][0]["config"]["measures"] == repair_orders_cube_measures
     )
 
+    # Only metrics with additive aggregations can be rolled up to a coarser grain
+    materialization = data["materializations"][0]
+    assert {
+        metric: is_additive_combiner(
+            MetricMeasures.parse_obj(metric_measures),
+            materialization["name"],
+        )
+        for metric, metric_measures in materialization["config"]["measures"].items()
+    } == {
+        "default.avg_repair_price": False,
+        "default.discounted_orders_rate": False,
+        "default.double_total_repair_cost": True,
+        "default.num_repair_orders": False,
+        "default.total_repair_cost": True,
+        "default.total_repair_order_discounts": True,
+    }
+
 
 @pytest.mark.asyncio
 async def test_druid_cube_agg_materialization(
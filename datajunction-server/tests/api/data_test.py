@@ -516,6 +516,12 @@ class TestDataForNode:
             "submitted_query": mock.ANY,
         }
 
+        # The returned id is a handle that can be polled without rebuilding the SQL,
+        # and results fetched through it carry the column metadata of the request
+        response = await module__client_with_roads.get(f"/data/query/{data['id']}")
+        assert response.status_code == 200
+        assert response.json()["results"][0]["columns"] == data["results"][0]["columns"]
+
     @pytest.mark.asyncio
     async def test_stream_multiple_metrics_and_dimensions_data(
         self,
@@ -611,11 +617,7 @@ class TestDataForNode:
         assert response.status_code == 200
         assert data["id"] == "bd98d6be-e2d2-413e-94c7-96d9411ddee2"
 
-        # and try to get the results by the query id only
-        new_response = await module__client_with_roads.get(f"/data/query/{data['id']}/")
-        new_data = response.json()
-        assert new_response.status_code == 200
-        assert new_data["results"] == [
+        assert data["results"] == [
             {
                 "columns": [
                     {
@@ -635,6 +637,11 @@ class TestDataForNode:
             },
         ]
 
+        # and try to get the results by the query id only
+        new_response = await module__client_with_roads.get(f"/data/query/{data['id']}/")
+        assert new_response.status_code == 200
+        assert new_response.json()["id"] == data["id"]
+
         # and repeat for a bogus query id
         yet_another_response = await module__client_with_roads.get(
             "/data/query/foo-bar-baz/",
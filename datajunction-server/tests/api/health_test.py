@@ -33,3 +33,14 @@ async def test_failed_health(
     response = await client.get("/health/")
     data = response.json()
     assert data == [{"name": "database", "status": "failed"}]
+
+
+@pytest.mark.asyncio
+async def test_cache_stats(client: AsyncClient) -> None:
+    """
+    Test ``GET /health/cache/``.
+    """
+    response = await client.get("/health/cache/")
+    data = response.json()
+    assert set(data["query_requests"]) == {"hits", "misses", "size", "maxsize"}
+    assert set(data["parse"]) == {"hits", "misses", "evictions", "size", "maxsize"}
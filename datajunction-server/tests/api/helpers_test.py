@@ -2,6 +2,8 @@
 Tests for API helpers.
 """
 
+import asyncio
+from typing import Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,7 +14,10 @@ from datajunction_server.database.node import Node, NodeRevision
 from datajunction_server.database.user import OAuthProvider, User
 from datajunction_server.errors import DJDoesNotExistException, DJException
 from datajunction_server.internal.nodes import propagate_valid_status
+from datajunction_server.models.materialization import Measure, MetricMeasures
 from datajunction_server.models.node import NodeStatus
+from datajunction_server.models.node_type import NodeType
+from datajunction_server.models.query import QueryWithResults
 
 
 @pytest.mark.asyncio
@@ -94,17 +99,198 @@ async def test_get_node_namespace():
     assert "node namespace `foo` does not exist" in str(exc_info.value)
 
 
+def _column(node_name: str, name: str, type_: NodeType = NodeType.DIMENSION):
+    """
+    A mock column on a node
+    """
+    node_revision = MagicMock(type=type_)
+    node_revision.name = node_name
+    column = MagicMock(node_revision=MagicMock(return_value=node_revision))
+    column.name = name
+    return column
+
+
+def _cube(name: str, elements: List[MagicMock], measures: Optional[Dict] = None):
+    """
+    A mock cube with the given elements, materialized if there are measures
+    """
+    cube = MagicMock(
+        cube_elements=elements,
+        cube_elements_with_nodes=MagicMock(
+            return_value=[(element, element.node_revision()) for element in elements],
+        ),
+        materializations=[
+            MagicMock(config={"measures": measures}),
+        ]
+        if measures is not None
+        else [],
+    )
+    cube.name = name
+    return cube
+
+
+def test_is_additive_combiner():
+    """
+    Test checking whether metrics can be re-aggregated from their measures
+    """
+    measures = [
+        Measure(name="a", field_name="a", agg="sum", type="int"),
+        Measure(name="b", field_name="b", agg="sum", type="int"),
+    ]
+    for combiner, additive in [
+        ("SUM(a) / SUM(b)", True),
+        ("AVG(a)", False),
+        ("COUNT(a)", False),
+        ("SUM(DISTINCT a)", False),
+        ("MAX(a) - SUM(b)", False),
+        ("a + SUM(b)", False),
+    ]:
+        metric_measures = MetricMeasures(
+            metric="m",
+            measures=measures,
+            combiner=combiner,
+        )
+        assert helpers.is_additive_combiner(metric_measures) == additive
+
+    metric_measures = MetricMeasures(
+        metric="m",
+        measures=[
+            Measure(name="a", field_name="a", agg="max", type="int"),
+            Measure(name="b", field_name="b", agg="min", type="int"),
+        ],
+        combiner="COALESCE(MAX(a), 0) - MIN(b)",
+    )
+    assert helpers.is_additive_combiner(metric_measures)
+    metric_measures.combiner = "COALESCE(MIN(a), 0) - MAX(b)"
+    assert not helpers.is_additive_combiner(metric_measures)
+
+    metric_measures = MetricMeasures(
+        metric="m",
+        measures=[Measure(name="a", field_name="a", agg="count", type="int")],
+        combiner="SUM(a)",
+    )
+    assert not helpers.is_additive_combiner(metric_measures)
+
+    # Other materializations reference measures by field name and use the metric's
+    # aggregation of them, whatever aggregation the measure lists
+    metric_measures = MetricMeasures(
+        metric="m",
+        measures=[
+            Measure(name="default.orders.a", field_name="a", agg="sum", type="int"),
+        ],
+        combiner="MAX(a)",
+    )
+    assert not helpers.is_additive_combiner(metric_measures)
+    assert helpers.is_additive_combiner(metric_measures, "measures")
+    metric_measures.combiner = "SUM(b)"
+    assert not helpers.is_additive_combiner(metric_measures, "measures")
+
+
+def test_can_answer_from_cube():
+    """
+    Test checking whether a query can be answered from a cube
+    """
+    num_orders = _column(
+        "default.num_orders", "default_DOT_num_orders", NodeType.METRIC
+    )
+    avg_price = _column("default.avg_price", "default_DOT_avg_price", NodeType.METRIC)
+    city = _column("default.hard_hat", "city")
+    state = _column("default.hard_hat", "state")
+    cube = _cube(
+        "default.cube",
+        [num_orders, avg_price, city, state],
+        measures={
+            "default.num_orders": {
+                "metric": "default.num_orders",
+                "measures": [
+                    {"name": "id", "field_name": "id", "agg": "sum", "type": "int"},
+                ],
+                "combiner": "SUM(id)",
+            },
+            "default.avg_price": {
+                "metric": "default.avg_price",
+                "measures": [
+                    {"name": "p", "field_name": "p", "agg": "sum", "type": "int"},
+                ],
+                "combiner": "AVG(p)",
+            },
+        },
+    )
+
+    # Exact match
+    assert helpers.can_answer_from_cube(
+        cube,
+        [num_orders, avg_price],
+        [city, state],
+        [],
+        True,
+    )
+    # A superset of dimensions can be re-aggregated for additive metrics only
+    assert helpers.can_answer_from_cube(cube, [num_orders], [city], [], True)
+    assert not helpers.can_answer_from_cube(cube, [avg_price], [city], [], True)
+    # Filters need to be on cube dimensions, but don't count toward the query's grain
+    assert helpers.can_answer_from_cube(
+        cube,
+        [num_orders],
+        [city],
+        ["default.hard_hat.state = 'NY'"],
+        True,
+    )
+    assert not helpers.can_answer_from_cube(
+        cube,
+        [avg_price],
+        [city],
+        ["default.hard_hat.state = 'NY'"],
+        True,
+    )
+    assert helpers.can_answer_from_cube(
+        cube,
+        [avg_price],
+        [city, state],
+        ["default.hard_hat.state = 'NY'"],
+        True,
+    )
+    assert not helpers.can_answer_from_cube(
+        cube,
+        [num_orders],
+        [city],
+        ["default.hard_hat.country = 'US'"],
+        True,
+    )
+    # Same column name on another node
+    assert not helpers.can_answer_from_cube(
+        cube,
+        [num_orders],
+        [_column("default.dispatcher", "city")],
+        [],
+        False,
+    )
+    # Not materialized
+    cube.availability = None
+    assert not helpers.can_answer_from_cube(cube, [num_orders], [city], [], True)
+    assert helpers.can_answer_from_cube(cube, [num_orders], [city], [], False)
+
+
 @pytest.mark.asyncio
 async def test_find_existing_cube():
     """
-    Test finding an existing cube
+    Test finding the cheapest existing cube
     """
-    mock_cube = MagicMock(current="foo-cube")
+    num_orders = _column(
+        "default.num_orders", "default_DOT_num_orders", NodeType.METRIC
+    )
+    city = _column("default.hard_hat", "city")
+    state = _column("default.hard_hat", "state")
+    cubes = [
+        MagicMock(current=_cube("default.fine_cube", [num_orders, city, state])),
+        MagicMock(current=_cube("default.coarse_cube", [num_orders, city])),
+        MagicMock(current=_cube("default.other_cube", [num_orders, state])),
+    ]
     mock_execute = AsyncMock(
         unique=MagicMock(
             return_value=MagicMock(
                 scalars=MagicMock(
-                    return_value=MagicMock(all=MagicMock(return_value=[mock_cube])),
+                    return_value=MagicMock(all=MagicMock(return_value=cubes)),
                 ),
             ),
         ),
@@ -112,11 +298,28 @@ async def test_find_existing_cube():
     mock_session = AsyncMock(execute=AsyncMock(return_value=mock_execute))
     node = await helpers.find_existing_cube(
         session=mock_session,
-        metric_columns=[],
-        dimension_columns=[],
+        metric_columns=[num_orders],
+        dimension_columns=[city],
         materialized=False,
     )
-    assert node == "foo-cube"
+    assert node.name == "default.coarse_cube"
+
+    node = await helpers.find_existing_cube(
+        session=mock_session,
+        metric_columns=[num_orders],
+        dimension_columns=[city],
+        materialized=False,
+        filters=["default.hard_hat.state = 'NY'"],
+    )
+    assert node.name == "default.fine_cube"
+
+    node = await helpers.find_existing_cube(
+        session=mock_session,
+        metric_columns=[num_orders],
+        dimension_columns=[city],
+        materialized=True,
+    )
+    assert node is None
 
 
 @pytest.mark.asyncio
@@ -166,3 +369,58 @@ async def test_build_sql_for_multiple_metrics(
         dimensions=[],
     )
     assert sql is not None
+
+
+@pytest.mark.asyncio
+async def test_query_event_stream_stalled_query():
+    """
+    Test that an event stream on a query that never changes still times out, and that
+    it ends as soon as the client disconnects.
+    """
+    query = QueryWithResults(
+        id="ef209eef",
+        submitted_query="SELECT 1",
+        state="RUNNING",
+        results=[],
+        errors=[],
+    )
+    stalled = asyncio.Event()
+
+    async def subscribe(*_):
+        await stalled.wait()
+        yield query  # pragma: no cover
+
+    query_service_client = MagicMock()
+    query_service_client.watcher.subscribe = subscribe
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+
+    events = [
+        event
+        async for event in helpers.query_event_stream(
+            query,
+            None,
+            query_service_client,
+            [],
+            request,
+            timeout=0.05,
+            check_interval=0.01,
+        )
+    ]
+    assert len(events) == 1
+    assert request.is_disconnected.call_count > 1
+
+    request.is_disconnected = AsyncMock(side_effect=[False, True])
+    events = [
+        event
+        async for event in helpers.query_event_stream(
+            query,
+            None,
+            query_service_client,
+            [],
+            request,
+            check_interval=0.01,
+        )
+    ]
+    assert len(events) == 1
+    assert request.is_disconnected.call_count == 2
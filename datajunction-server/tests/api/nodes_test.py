@@ -19,12 +19,17 @@ from datajunction_server.database.column import Column
 from datajunction_server.database.node import Node, NodeRelationship, NodeRevision
 from datajunction_server.database.queryrequest import QueryBuildType, QueryRequest
 from datajunction_server.database.user import OAuthProvider, User
-from datajunction_server.errors import DJDoesNotExistException
+from datajunction_server.errors import (
+    DJDoesNotExistException,
+    DJNotImplementedException,
+    DJQueryServiceClientException,
+)
+from datajunction_server.internal import nodes as internal_nodes
 from datajunction_server.internal.materializations import decompose_expression
 from datajunction_server.models.node import NodeStatus
 from datajunction_server.models.node_type import NodeType
 from datajunction_server.service_clients import QueryServiceClient
-from datajunction_server.sql.dag import get_upstream_nodes
+from datajunction_server.sql.dag import get_downstream_nodes, get_upstream_nodes
 from datajunction_server.sql.parsing import ast, types
 from datajunction_server.sql.parsing.types import IntegerType, StringType, TimestampType
 from tests.sql.utils import assert_query_strings_equal, compare_query_strings
@@ -561,7 +566,10 @@ class TestNodeCRUD:  # pylint: disable=too-many-public-methods
                 "user": "dj",
                 "pre": {},
                 "post": {},
-                "details": {"version": "v2.0"},
+                "details": {
+                    "version": "v2.0",
+                    "downstreams": {"revalidated": 0, "skipped": 4},
+                },
                 "created_at": mock.ANY,
             },
             {
@@ -1626,6 +1634,8 @@ class TestNodeCRUD:  # pylint: disable=too-many-public-methods
     async def test_refresh_source_node(
         self,
         client_with_query_service_example_loader,
+        query_service_client: QueryServiceClient,
+        mocker: MockerFixture,
     ):
         """
         Refresh a source node with a query service
@@ -1721,10 +1731,19 @@ class TestNodeCRUD:  # pylint: disable=too-many-public-methods
         ]
 
         # Refresh it again, but this time no columns will have changed so
-        # verify that the node revision stays the same
+        # verify that the node revision stays the same. The table's fingerprint
+        # is unchanged, so its columns aren't fetched at all
+        get_columns_for_table = mocker.spy(
+            query_service_client,
+            "get_columns_for_table",
+        )
         response = await custom_client.post(
             "/nodes/default.repair_orders/refresh/",
         )
+        # (the one call is made by the mocked fingerprints)
+        assert [call.args[2] for call in get_columns_for_table.call_args_list] == [
+            "repair_orders",
+        ]
         data_second = response.json()
         assert data_second["version"] == "v2.0"
         assert data_second["node_revision_id"] == data["node_revision_id"]
@@ -1848,6 +1867,141 @@ class TestNodeCRUD:  # pylint: disable=too-many-public-methods
         assert data_fourth["status"] == "valid"
         assert data_fourth["missing_table"] is False
 
+    @pytest.mark.asyncio
+    async def test_refresh_source_nodes(
+        self,
+        client_with_query_service_example_loader,
+        query_service_client: QueryServiceClient,
+        mocker: MockerFixture,
+    ):
+        """
+        Refresh many source nodes at once, with one query service request per schema
+        """
+        custom_client = await client_with_query_service_example_loader(["ROADS"])
+        get_columns_for_tables = mocker.spy(
+            query_service_client,
+            "get_columns_for_tables",
+        )
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=[
+                "default.repair_orders",
+                "default.hard_hats",
+                "default.repair_order",
+                "default.nonexistent",
+            ],
+        )
+        assert response.status_code == 201
+        assert response.json() == {
+            "refreshed": ["default.hard_hats", "default.repair_orders"],
+            "unchanged": [],
+            "not_found": ["default.nonexistent", "default.repair_order"],
+            "failed": {},
+        }
+        # The columns of changed tables come back along with their fingerprints
+        assert get_columns_for_tables.call_count == 0
+        response = await custom_client.get("/nodes/default.repair_orders/")
+        assert response.json()["version"] == "v2.0"
+        assert len(response.json()["columns"]) == 8
+
+        # The query service doesn't know about the hard hats table
+        response = await custom_client.get("/nodes/default.hard_hats/")
+        assert response.json()["version"] == "v2.0"
+        assert response.json()["missing_table"] is True
+
+        # Nothing has changed the second time around
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=["default.repair_orders"],
+        )
+        assert response.json() == {
+            "refreshed": [],
+            "unchanged": ["default.repair_orders"],
+            "not_found": [],
+            "failed": {},
+        }
+
+        # Unchanged tables are skipped without fetching their columns
+        assert get_columns_for_tables.call_count == 0
+
+        # Tables missing from the schema mark their source nodes as missing tables
+        the_good_columns = query_service_client.get_columns_for_table(
+            "default",
+            "roads",
+            "repair_orders",
+        )
+        mocker.patch.object(
+            query_service_client,
+            "get_columns_for_table",
+            lambda *args: [],
+        )
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=["default.repair_orders"],
+        )
+        assert response.json()["refreshed"] == ["default.repair_orders"]
+        response = await custom_client.get("/nodes/default.repair_orders/")
+        assert response.json()["version"] == "v3.0"
+        assert response.json()["missing_table"] is True
+
+        # Columns are fetched separately from query services that only fingerprint
+        mocker.patch.object(
+            query_service_client,
+            "get_columns_for_table",
+            lambda *args: the_good_columns,
+        )
+        get_table_fingerprints = query_service_client.get_table_fingerprints
+        mocker.patch.object(
+            query_service_client,
+            "get_table_fingerprints",
+            lambda *args, **kwargs: (get_table_fingerprints(*args, **kwargs)[0], {}),
+        )
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=["default.repair_orders"],
+        )
+        assert response.json()["refreshed"] == ["default.repair_orders"]
+        assert get_columns_for_tables.call_count == 1
+        response = await custom_client.get("/nodes/default.repair_orders/")
+        assert response.json()["version"] == "v4.0"
+        assert response.json()["missing_table"] is False
+
+        # A schema that can't be introspected fails only its own nodes
+        def fail_schema(catalog, schema, *args, **kwargs):
+            raise DJQueryServiceClientException(
+                message=f"Error response from query service: {catalog}.{schema}",
+            )
+
+        mocker.patch.object(query_service_client, "get_table_fingerprints", fail_schema)
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=["default.repair_orders", "default.nonexistent"],
+        )
+        assert response.status_code == 201
+        assert response.json() == {
+            "refreshed": [],
+            "unchanged": [],
+            "not_found": ["default.nonexistent"],
+            "failed": {
+                "default.repair_orders": "Error response from query service: "
+                "default.roads",
+            },
+        }
+
+        # A query service without schema introspection fails the whole refresh
+        def unsupported(*args, **kwargs):
+            raise DJNotImplementedException(
+                message="Query service endpoint not found",
+            )
+
+        mocker.patch.object(query_service_client, "get_table_fingerprints", unsupported)
+        response = await custom_client.post(
+            "/nodes/refresh/",
+            json=["default.repair_orders"],
+        )
+        assert response.status_code == 500
+        assert response.json()["message"] == "Query service endpoint not found"
+
     @pytest.mark.asyncio
     async def test_create_update_source_node(
         self,
@@ -4083,6 +4237,87 @@ class TestValidateNodes:  # pylint: disable=too-many-public-methods
         )
         assert data["status"] == "invalid"
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("client_with_roads")
+    async def test_propagate_update_downstream_skips_unchanged(
+        self,
+        session: AsyncSession,
+        current_user: User,
+        mocker: MockerFixture,
+    ):
+        """
+        Tests that propagating an update stops at downstream nodes whose status and
+        output columns did not change
+        """
+        node = await Node.get_by_name(session, "default.repair_orders")
+        downstreams = await get_downstream_nodes(
+            session,
+            "default.repair_orders",
+            include_cubes=False,
+        )
+        children = {
+            downstream.name
+            for downstream in downstreams
+            if "default.repair_orders"
+            in {parent.name for parent in downstream.current.parents}
+        }
+        assert len(children) < len(downstreams)
+
+        validate_spy = mocker.spy(internal_nodes, "validate_node_data")
+        await internal_nodes.propagate_update_downstream(
+            session,
+            node,  # type: ignore
+            current_user=current_user,
+        )
+        assert {call.args[0].name for call in validate_spy.call_args_list} == children
+
+    @pytest.mark.asyncio
+    async def test_propagate_update_downstream_fingerprints(
+        self,
+        client_with_roads: AsyncClient,
+    ):
+        """
+        Tests that updates which don't change a node's output columns are not propagated
+        downstream, and that the update's history event reports the propagation
+        """
+        response = await client_with_roads.get(
+            "/nodes/default.repair_order_details/downstream/",
+        )
+        downstreams = [
+            node["name"] for node in response.json() if node["type"] != "cube"
+        ]
+
+        response = await client_with_roads.patch(
+            "/nodes/default.repair_order_details",
+            json={"description": "Details on repair orders (updated)"},
+        )
+        assert response.status_code == 200
+        response = await client_with_roads.get(
+            "/history?node=default.repair_order_details",
+        )
+        assert response.json()[0]["details"] == {
+            "version": "v1.1",
+            "downstreams": {"revalidated": 0, "skipped": len(downstreams)},
+        }
+
+        response = await client_with_roads.patch(
+            "/nodes/default.repair_order_details",
+            json={
+                "columns": [
+                    {"name": "repair_order_id", "type": "int"},
+                    {"name": "repair_type_id", "type": "int"},
+                    {"name": "discount", "type": "float"},
+                ],
+            },
+        )
+        assert response.status_code == 200
+        response = await client_with_roads.get(
+            "/history?node=default.repair_order_details",
+        )
+        propagation = response.json()[0]["details"]["downstreams"]
+        assert propagation["revalidated"] > 0
+        assert propagation["revalidated"] + propagation["skipped"] == len(downstreams)
+
     @pytest.mark.asyncio
     async def test_update_dimension_remove_pk_column(
         self,
@@ -4581,6 +4816,38 @@ class TestValidateNodes:  # pylint: disable=too-many-public-methods
             },
         ]
 
+    @pytest.mark.asyncio
+    async def test_lineage_compiles_each_node_once(
+        self,
+        client_with_roads: AsyncClient,
+        session: AsyncSession,
+        mocker: MockerFixture,
+    ):
+        """
+        Test that computing the lineage of all columns of a node only parses and
+        compiles each node in its upstream graph once
+        """
+        response = await client_with_roads.get(
+            "/nodes/default.regional_level_agg/lineage/",
+        )
+        expected = response.json()
+
+        parse_spy = mocker.spy(internal_nodes, "parse")
+        node = await Node.get_by_name(session, "default.regional_level_agg")
+        lineage = await internal_nodes.get_column_level_lineage(
+            session,
+            node.current,  # type: ignore
+        )
+        assert [column.dict() for column in lineage] == expected
+
+        def upstreams(columns):
+            for column in columns:
+                if column["node_type"] != "source":
+                    yield column["node_name"]
+                yield from upstreams(column["lineage"])
+
+        assert parse_spy.call_count == len(set(upstreams(expected)))
+
 
 @pytest.mark.asyncio
 async def test_node_similarity(
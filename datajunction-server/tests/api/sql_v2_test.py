@@ -1,9 +1,12 @@
 """Tests for all /sql endpoints that use node SQL build v2"""
 # pylint: disable=line-too-long,too-many-lines
+from unittest import mock
+
 import duckdb
 import pytest
 from httpx import AsyncClient
 
+from datajunction_server.construction.build_v2 import QueryBuilder
 from datajunction_server.sql.parsing.backends.antlr4 import parse
 
 
@@ -502,3 +505,50 @@ async def test_measures_sql_include_all_columns(
     assert str(parse(str(expected_sql))) == str(parse(str(translated_sql["sql"])))
     result = duckdb_conn.sql(translated_sql["sql"])
     assert len(result.fetchall()) == 4
+
+
+@pytest.mark.asyncio
+async def test_measures_sql_batch(
+    module__client_with_roads: AsyncClient,
+):
+    """
+    Test ``POST /sql/measures/v2/batch`` returns the same SQL as individual requests,
+    only building identical requests once.
+    """
+    await fix_dimension_links(module__client_with_roads)
+    requests = [
+        {
+            "metrics": ["default.avg_time_to_dispatch"],
+            "dimensions": [
+                "default.us_state.state_name",
+                "default.dispatcher.company_name",
+            ],
+            "filters": ["default.us_state.state_name = 'New Jersey'"],
+        },
+        {
+            "metrics": ["default.num_repair_orders"],
+            "dimensions": ["default.hard_hat.last_name"],
+            "include_all_columns": True,
+        },
+    ]
+    expected = []
+    for request in requests:
+        response = await module__client_with_roads.get(
+            "/sql/measures/v2",
+            params=request,
+        )
+        expected.append(response.json())
+
+    with mock.patch.object(
+        QueryBuilder,
+        "build",
+        autospec=True,
+        side_effect=QueryBuilder.build,
+    ) as build:
+        response = await module__client_with_roads.post(
+            "/sql/measures/v2/batch",
+            json=[requests[0], requests[1], requests[0]],
+        )
+    assert response.status_code == 200
+    assert build.call_count == 2
+    assert response.json() == [expected[0], expected[1], expected[0]]
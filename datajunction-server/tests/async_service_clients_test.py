@@ -0,0 +1,488 @@
+"""
+Tests for the async query service client and query watcher in
+``datajunction_server.service_clients``.
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from datajunction_server.database.engine import Engine
+from datajunction_server.errors import DJError, DJQueryServiceClientException, ErrorCode
+from datajunction_server.models.query import QueryCreate, QueryWithResults
+from datajunction_server.service_clients import AsyncQueryServiceClient, QueryWatcher
+
+
+@pytest.fixture
+def transport() -> httpx.MockTransport:
+    """
+    A mock transport for the query service. Tests set its handler, and can swap it
+    for another one while using the same client.
+    """
+    return httpx.MockTransport(lambda request: httpx.Response(404))
+
+
+class TestAsyncQueryServiceClient:
+    """
+    Test using the async query service client.
+    """
+
+    endpoint = "http://queryservice:8001"
+
+    query = {
+        "id": "ef209eef-c31a-4089-aae6-833259a08e22",
+        "submitted_query": "SELECT 1 as num",
+        "state": "FINISHED",
+        "results": [
+            {
+                "sql": "SELECT 1 as num",
+                "columns": [{"name": "num", "type": "STR"}],
+                "rows": [[1]],
+                "row_count": 1,
+            },
+        ],
+        "errors": [],
+    }
+
+    @pytest.mark.asyncio
+    async def test_requests(
+        self,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test getting columns for tables, submitting a query and getting a query.
+        """
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.startswith("/table/"):
+                return httpx.Response(
+                    200,
+                    json={"columns": [{"name": "id", "type": "INT"}]},
+                )
+            if request.url.path.endswith("/fingerprints/"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "name": "hive.test",
+                        "fingerprints": {"hive.test.pies": "abc"},
+                        "missing": [],
+                    },
+                )
+            if request.url.path.startswith("/schema/"):
+                return httpx.Response(
+                    200,
+                    json={
+                        "name": "hive.test",
+                        "tables": [
+                            {
+                                "name": "hive.test.pies",
+                                "columns": [{"name": "id", "type": "INT"}],
+                            },
+                        ],
+                        "missing": [],
+                    },
+                )
+            return httpx.Response(200, json=self.query)
+
+        transport.handler = handler
+        query_service_client = AsyncQueryServiceClient(
+            uri=self.endpoint,
+            transport=transport,
+        )
+        columns = await query_service_client.get_columns_for_table(
+            "hive",
+            "test",
+            "pies",
+            request_headers={"Accept-Encoding": "gzip", "X-Custom": "1"},
+            engine=Engine(name="spark", version="2.4.4"),
+        )
+        assert [(column.name, str(column.type)) for column in columns] == [
+            ("id", "INT"),
+        ]
+        assert str(requests[-1].url) == (
+            "http://queryservice:8001/table/hive.test.pies/columns/"
+            "?engine=spark&engine_version=2.4.4"
+        )
+        assert requests[-1].headers["X-Custom"] == "1"
+        assert requests[-1].headers["Accept-Encoding"] != "gzip"
+
+        columns_by_table = await query_service_client.get_columns_for_tables(
+            "hive",
+            "test",
+            ["pies"],
+        )
+        assert list(columns_by_table) == ["pies"]
+        assert requests[-1].method == "POST"
+        assert requests[-1].url.path == "/schema/hive.test/columns/"
+        assert json.loads(requests[-1].content) == {"tables": ["pies"]}
+
+        assert await query_service_client.get_table_fingerprints(
+            "hive",
+            "test",
+            ["pies"],
+            engine=Engine(name="spark", version="2.4.4"),
+        ) == ({"pies": "abc"}, {})
+        assert str(requests[-1].url) == (
+            "http://queryservice:8001/schema/hive.test/fingerprints/"
+            "?engine=spark&engine_version=2.4.4"
+        )
+
+        query_create = QueryCreate(
+            catalog_name="default",
+            engine_name="postgres",
+            engine_version="15.2",
+            submitted_query="SELECT 1",
+            async_=False,
+        )
+        query = await query_service_client.submit_query(query_create)
+        assert query.id == "ef209eef-c31a-4089-aae6-833259a08e22"
+        assert requests[-1].method == "POST"
+        assert json.loads(requests[-1].content) == query_create.dict()
+
+        query = await query_service_client.get_query(query.id)
+        assert query.results.__root__[0].rows == [(1,)]
+        assert requests[-1].url.path == f"/queries/{query.id}/"
+        await query_service_client.close()
+
+    @pytest.mark.asyncio
+    async def test_errors(
+        self,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test handling error responses from the query service.
+        """
+        transport.handler = lambda request: httpx.Response(
+            400,
+            json={"message": "Errors", "errors": ["a"]},
+        )
+        query_service_client = AsyncQueryServiceClient(
+            uri=self.endpoint,
+            transport=transport,
+        )
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.get_query("ef209eef")
+        assert "Error response from query service" in str(exc_info.value)
+
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.submit_query(
+                QueryCreate(
+                    catalog_name="hive",
+                    engine_name="postgres",
+                    engine_version="15.2",
+                    submitted_query="SELECT 1",
+                ),
+            )
+        assert exc_info.value.errors == [
+            DJError(code=ErrorCode.QUERY_SERVICE_ERROR, message="a"),
+        ]
+
+        def read_timeout(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("Timed out", request=request)
+
+        transport.handler = read_timeout
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.get_query("ef209eef")
+        assert "Error requesting query service: Timed out" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_retries(
+        self,
+        mocker: MockerFixture,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test that connection failures and retryable statuses are retried with backoff.
+        """
+        sleep = mocker.patch(
+            "datajunction_server.service_clients.asyncio.sleep",
+            AsyncMock(),
+        )
+        responses = iter([503, 200])
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(next(responses), json=self.query)
+
+        transport.handler = handler
+        query_service_client = AsyncQueryServiceClient(
+            uri=self.endpoint,
+            retries=2,
+            transport=transport,
+        )
+        query = await query_service_client.get_query("ef209eef")
+        assert query.state == "FINISHED"
+        assert len(attempts) == 3
+        assert [call.args for call in sleep.call_args_list] == [(1.5,), (3.0,)]
+
+        # Out of retries
+        query_service_client.retries = 0
+        responses = iter([503])
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.get_query("ef209eef")
+        assert "Error response from query service" in str(exc_info.value)
+
+        attempts.clear()
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.get_query("ef209eef")
+        assert "Unable to reach query service" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_retries_non_idempotent(
+        self,
+        mocker: MockerFixture,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test that submitting a query is only retried if the request never reached the
+        query service, so that an accepted query is never resubmitted.
+        """
+        mocker.patch(
+            "datajunction_server.service_clients.asyncio.sleep",
+            AsyncMock(),
+        )
+        responses = iter([502, 201])
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("Connection refused", request=request)
+            return httpx.Response(
+                next(responses),
+                json={**self.query, "message": "Bad gateway", "errors": []},
+            )
+
+        transport.handler = handler
+        query_service_client = AsyncQueryServiceClient(
+            uri=self.endpoint,
+            retries=2,
+            transport=transport,
+        )
+        query_create = QueryCreate(
+            catalog_name="default",
+            engine_name="postgres",
+            engine_version="15.2",
+            submitted_query="SELECT 1",
+        )
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            await query_service_client.submit_query(query_create)
+        assert exc_info.value.http_status_code == 502
+        assert len(attempts) == 2
+
+        # Read-only lookups sent as POST requests are still retried
+        attempts.clear()
+        responses = iter([502, 200])
+        handler_response = {"fingerprints": {"hive.test.pies": "abc"}}
+        transport.handler = lambda request: (
+            attempts.append(request)
+            or httpx.Response(next(responses), json=handler_response)
+        )
+        assert await query_service_client.get_table_fingerprints(
+            "hive",
+            "test",
+            ["pies"],
+        ) == ({"pies": "abc"}, {})
+        assert len(attempts) == 2
+
+
+class TestQueryWatcher:
+    """
+    Test watching queries on behalf of several subscribers.
+    """
+
+    @staticmethod
+    def query(state: str, progress: float = 0.0) -> dict:
+        """
+        A query service response for a query in the given state.
+        """
+        return {
+            "id": "ef209eef",
+            "submitted_query": "SELECT 1 as num",
+            "state": state,
+            "progress": progress,
+            "results": [],
+            "errors": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_fan_out(
+        self,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test that a query is polled once for all of its subscribers, and that every
+        change is pushed to each of them.
+        """
+        responses = iter(
+            [
+                self.query("RUNNING", 0.1),
+                self.query("RUNNING", 0.1),
+                self.query("RUNNING", 0.5),
+                self.query("FINISHED", 1.0),
+            ],
+        )
+        polls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            polls.append(request)
+            return httpx.Response(200, json=next(responses))
+
+        transport.handler = handler
+        query_service_client = AsyncQueryServiceClient(
+            uri="http://queryservice:8001",
+            transport=transport,
+        )
+        watcher = QueryWatcher(query_service_client, poll_interval=0)
+
+        async def watch():
+            return [
+                (query.state, query.progress)
+                async for query in watcher.subscribe("ef209eef")
+            ]
+
+        first, second = await asyncio.gather(watch(), watch())
+        assert (
+            first
+            == second
+            == [
+                ("RUNNING", 0.1),
+                ("RUNNING", 0.5),
+                ("FINISHED", 1.0),
+            ]
+        )
+        assert len(polls) == 4
+        assert not watcher.subscribers
+        assert not watcher.tasks
+        assert not watcher.latest
+
+    @pytest.mark.asyncio
+    async def test_backoff(self, mocker: MockerFixture) -> None:
+        """
+        Test that the poll interval backs off while the query is unchanged.
+        """
+        sleep = mocker.patch(
+            "datajunction_server.service_clients.asyncio.sleep",
+            AsyncMock(),
+        )
+        query_service_client = MagicMock()
+        query_service_client.get_query = AsyncMock(
+            side_effect=[
+                QueryWithResults(**self.query("RUNNING")),
+                QueryWithResults(**self.query("RUNNING")),
+                QueryWithResults(**self.query("RUNNING")),
+                QueryWithResults(**self.query("RUNNING", 0.5)),
+                QueryWithResults(**self.query("FINISHED", 1.0)),
+            ],
+        )
+        watcher = QueryWatcher(
+            query_service_client,
+            poll_interval=1.0,
+            max_poll_interval=2.0,
+            backoff_factor=1.5,
+        )
+        updates = [query async for query in watcher.subscribe("ef209eef")]
+        assert len(updates) == 3
+        assert [call.args for call in sleep.call_args_list] == [
+            (1.0,),
+            (1.5,),
+            (2.0,),
+            (1.0,),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_errors_and_unsubscribe(self) -> None:
+        """
+        Test that errors are raised to subscribers, and that polling stops when the
+        last subscriber leaves.
+        """
+        query_service_client = MagicMock()
+        query_service_client.get_query = AsyncMock(
+            side_effect=DJQueryServiceClientException("Query ef209eef not found."),
+        )
+        watcher = QueryWatcher(query_service_client)
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            async for _ in watcher.subscribe("ef209eef"):
+                pass  # pragma: no cover
+        assert "Query ef209eef not found." in str(exc_info.value)
+
+        query_service_client.get_query = AsyncMock(
+            return_value=QueryWithResults(**self.query("RUNNING")),
+        )
+        subscription = watcher.subscribe("ef209eef")
+        # The anext() built-in is only available from Python 3.10
+        next_query = (
+            await subscription.__anext__()
+        )  # pylint: disable=unnecessary-dunder-call
+        assert next_query.state == "RUNNING"
+        task = watcher.tasks[("ef209eef", ())]
+
+        # A late subscriber gets the latest state right away
+        late_subscription = watcher.subscribe("ef209eef")
+        # The anext() built-in is only available from Python 3.10
+        next_query = (
+            await late_subscription.__anext__()
+        )  # pylint: disable=unnecessary-dunder-call
+        assert next_query.state == "RUNNING"
+        await late_subscription.aclose()
+        assert not task.cancelled()
+
+        await subscription.aclose()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert not watcher.subscribers
+        assert not watcher.tasks
+        assert not watcher.latest
+
+    @pytest.mark.asyncio
+    async def test_polls_per_credentials(
+        self,
+        transport: httpx.MockTransport,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """
+        Test that subscribers with different credentials never share a poll, while
+        subscribers with the same credentials do.
+        """
+        polls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            polls.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json=self.query("FINISHED", 1.0))
+
+        transport.handler = handler
+        query_service_client = AsyncQueryServiceClient(
+            uri="http://queryservice:8001",
+            transport=transport,
+        )
+        watcher = QueryWatcher(query_service_client, poll_interval=0)
+
+        async def watch(authorization: str):
+            return [
+                query.state
+                async for query in watcher.subscribe(
+                    "ef209eef",
+                    {"Authorization": authorization, "User-Agent": authorization},
+                )
+            ]
+
+        assert (
+            await asyncio.gather(
+                watch("Bearer alice"),
+                watch("Bearer bob"),
+                watch("Bearer alice"),
+            )
+            == [["FINISHED"]] * 3
+        )
+        assert sorted(polls) == ["Bearer alice", "Bearer bob"]
+        assert watcher.watch_key(
+            "ef209eef",
+            {"authorization": "Bearer alice", "X-Other": "1"},
+        ) == ("ef209eef", (("authorization", "Bearer alice"),))
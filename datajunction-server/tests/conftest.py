@@ -18,6 +18,7 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Tuple,
 )
 from unittest.mock import MagicMock, patch
 
@@ -39,16 +40,24 @@ from datajunction_server.config import Settings
 from datajunction_server.database.base import Base
 from datajunction_server.database.column import Column
 from datajunction_server.database.engine import Engine
+from datajunction_server.database.node import NodeRevision
 from datajunction_server.database.user import User
-from datajunction_server.errors import DJQueryServiceClientException
+from datajunction_server.errors import (
+    DJDoesNotExistException,
+    DJQueryServiceClientException,
+)
 from datajunction_server.internal.access.authorization import validate_access
 from datajunction_server.models.access import AccessControl, ValidateAccessFn
 from datajunction_server.models.materialization import MaterializationInfo
 from datajunction_server.models.query import QueryCreate, QueryWithResults
 from datajunction_server.models.user import OAuthProvider
-from datajunction_server.service_clients import QueryServiceClient
+from datajunction_server.service_clients import (
+    AsyncQueryServiceClient,
+    QueryServiceClient,
+)
 from datajunction_server.typing import QueryState
 from datajunction_server.utils import (
+    get_async_query_service_client,
     get_query_service_client,
     get_session,
     get_settings,
@@ -213,6 +222,57 @@ def query_service_client(
         mock_get_columns_for_table,
     )
 
+    def mock_get_columns_for_tables(
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        engine: Optional[Engine] = None,  # pylint: disable=unused-argument
+        request_headers: Optional[  # pylint: disable=unused-argument
+            Dict[str, str]
+        ] = None,
+    ) -> Dict[str, List[Column]]:
+        return {
+            table: COLUMN_MAPPINGS[f"{catalog}.{schema}.{table}"]
+            for table in tables
+            if f"{catalog}.{schema}.{table}" in COLUMN_MAPPINGS
+        }
+
+    mocker.patch.object(
+        qs_client,
+        "get_columns_for_tables",
+        mock_get_columns_for_tables,
+    )
+
+    def mock_get_table_fingerprints(
+        catalog: str,
+        schema: str,
+        tables: List[str],
+        engine: Optional[Engine] = None,  # pylint: disable=unused-argument
+        request_headers: Optional[  # pylint: disable=unused-argument
+            Dict[str, str]
+        ] = None,
+        fingerprints: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, List[Column]]]:
+        # Fingerprint whatever the (possibly patched) columns of each table are, and
+        # return the columns of the tables with different fingerprints than the given
+        table_fingerprints, changed_columns = {}, {}
+        for table in tables:
+            try:
+                columns = qs_client.get_columns_for_table(catalog, schema, table)
+            except (KeyError, DJDoesNotExistException):
+                continue
+            if columns:
+                table_fingerprints[table] = NodeRevision.fingerprint_columns(columns)
+                if (fingerprints or {}).get(table) != table_fingerprints[table]:
+                    changed_columns[table] = columns
+        return table_fingerprints, changed_columns
+
+    mocker.patch.object(
+        qs_client,
+        "get_table_fingerprints",
+        mock_get_table_fingerprints,
+    )
+
     def mock_submit_query(
         query_create: QueryCreate,
         request_headers: Optional[  # pylint: disable=unused-argument
@@ -309,6 +369,32 @@ def query_service_client(
     yield qs_client
 
 
+def async_query_service_client_for(
+    query_service_client: QueryServiceClient,
+) -> AsyncQueryServiceClient:
+    """
+    An async query service client that delegates to a mocked query service client, so
+    that patching the mocked client also applies to the async endpoints.
+    """
+    async_client = AsyncQueryServiceClient(uri=query_service_client.uri)
+
+    def delegate(name: str):
+        async def _delegate(*args, **kwargs):
+            return getattr(query_service_client, name)(*args, **kwargs)
+
+        return _delegate
+
+    for name in (
+        "get_columns_for_table",
+        "get_columns_for_tables",
+        "get_table_fingerprints",
+        "submit_query",
+        "get_query",
+    ):
+        setattr(async_client, name, delegate(name))
+    return async_client
+
+
 @pytest_asyncio.fixture
 async def client(  # pylint: disable=too-many-statements
     session: AsyncSession,
@@ -558,6 +644,11 @@ async def client_with_query_service_example_loader(  # pylint: disable=too-many-
     def get_query_service_client_override() -> QueryServiceClient:
         return query_service_client
 
+    async_query_service_client = async_query_service_client_for(query_service_client)
+
+    def get_async_query_service_client_override() -> AsyncQueryServiceClient:
+        return async_query_service_client
+
     def get_session_override() -> AsyncSession:
         return session
 
@@ -569,6 +660,9 @@ async def client_with_query_service_example_loader(  # pylint: disable=too-many-
     app.dependency_overrides[
         get_query_service_client
     ] = get_query_service_client_override
+    app.dependency_overrides[
+        get_async_query_service_client
+    ] = get_async_query_service_client_override
 
     # The test client includes a signed and encrypted JWT in the authorization headers.
     # Even though the user is mocked to always return a "dj" user, this allows for the
@@ -675,6 +769,13 @@ async def module__client(  # pylint: disable=too-many-statements
     def get_query_service_client_override() -> QueryServiceClient:
         return module__query_service_client
 
+    async_query_service_client = async_query_service_client_for(
+        module__query_service_client,
+    )
+
+    def get_async_query_service_client_override() -> AsyncQueryServiceClient:
+        return async_query_service_client
+
     def get_session_override() -> AsyncSession:
         return module__session
 
@@ -693,6 +794,9 @@ async def module__client(  # pylint: disable=too-many-statements
     app.dependency_overrides[
         get_query_service_client
     ] = get_query_service_client_override
+    app.dependency_overrides[
+        get_async_query_service_client
+    ] = get_async_query_service_client_override
 
     async with AsyncClient(app=app, base_url="http://test") as test_client:
         test_client.headers.update(
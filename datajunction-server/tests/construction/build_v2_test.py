@@ -1,9 +1,11 @@
 # pylint: disable=redefined-outer-name,too-many-lines
 """Tests for building nodes"""
+from dataclasses import FrozenInstanceError
 from typing import List, Tuple
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import datajunction_server.sql.parsing.types as ct
@@ -12,6 +14,7 @@ from datajunction_server.construction.build_v2 import (
     combine_filter_conditions,
     dimension_join_path,
 )
+from datajunction_server.construction.snapshots import NodeSnapshots
 from datajunction_server.database.attributetype import AttributeType, ColumnAttribute
 from datajunction_server.database.column import Column
 from datajunction_server.database.dimensionlink import DimensionLink, JoinType
@@ -568,14 +571,14 @@ async def test_dimension_join_path(
         events_agg.current,
         "shared.devices.device_manufacturer",
     )
-    assert [link.dimension.name for link in path] == ["shared.devices"]  # type: ignore
+    assert [link.dimension_name for link in path] == ["shared.devices"]  # type: ignore
 
     path = await dimension_join_path(
         session,
         events_agg.current,
         "shared.manufacturers.name",
     )
-    assert [link.dimension.name for link in path] == [  # type: ignore
+    assert [link.dimension_name for link in path] == [  # type: ignore
         "shared.devices",
         "shared.manufacturers",
     ]
@@ -602,6 +605,50 @@ async def test_dimension_join_path(
     assert path == []
 
 
+@pytest.mark.asyncio
+async def test_node_snapshots(
+    session: AsyncSession,
+    events_agg: Node,
+    events_agg_devices_link: Node,  # pylint: disable=unused-argument
+):
+    """
+    Test loading node snapshots along with the dimensions graph.
+    """
+    statements = []
+
+    def count_statement(orm_execute_state):
+        statements.append(orm_execute_state.statement)
+
+    event.listen(session.sync_session, "do_orm_execute", count_statement)
+    snapshots = NodeSnapshots(session)
+    snapshot = await snapshots.get(events_agg.current)
+    assert snapshot.name == "agg.events"
+    assert [col.name for col in snapshot.columns][:2] == ["user_id", "utc_date"]
+    assert [link.dimension_name for link in snapshot.dimension_links] == [
+        "shared.devices",
+    ]
+    assert snapshot.dimension_links[0].foreign_keys_reversed == {
+        "shared.devices.device_id": "agg.events.device_id",
+    }
+    with pytest.raises(FrozenInstanceError):
+        snapshot.name = "agg.other"  # type: ignore
+
+    await snapshots.load_dimension_graph(snapshot)
+    assert snapshots.current("shared.devices").dimension_links[  # type: ignore
+        0
+    ].foreign_keys_reversed == {
+        "shared.manufacturers.name": "shared.devices.device_manufacturer",
+    }
+    assert snapshots.current("shared.manufacturers").dimension_links == ()  # type: ignore
+
+    # Loading again is served from the snapshots
+    num_statements = len(statements)
+    assert await snapshots.get(events_agg.current) is snapshot
+    await snapshots.load_dimension_graph(snapshot)
+    assert len(statements) == num_statements
+    event.remove(session.sync_session, "do_orm_execute", count_statement)
+
+
 @pytest.mark.asyncio
 async def test_build_source_node(
     session: AsyncSession,
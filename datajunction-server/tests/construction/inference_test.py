@@ -1,6 +1,8 @@
 """Test type inference."""
 
 # pylint: disable=W0621,C0325
+from unittest import mock
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,6 +29,7 @@ from datajunction_server.sql.parsing.types import (
     StringType,
     TimestampType,
     TimeType,
+    parse_column_type,
 )
 
 
@@ -638,6 +641,30 @@ def test_column_type_validation():
     assert ColumnType.validate("array<int>") == ListType(IntegerType())
 
 
+def test_parse_column_type():
+    """
+    Test that parsed column types are interned and primitive types skip ANTLR
+    """
+    parse_column_type.cache_clear()
+    with mock.patch(
+        "datajunction_server.sql.parsing.backends.antlr4.parse_sql",
+    ) as parse_sql:
+        assert parse_column_type("INT") is IntegerType()
+        assert parse_column_type(" bigint ") is BigIntType()
+        assert parse_column_type("long") is BigIntType()
+    parse_sql.assert_not_called()
+
+    map_type = parse_column_type("map<string, array<int>>")
+    assert map_type == MapType(StringType(), ListType(IntegerType()))
+    assert parse_column_type("map<string, array<int>>") is map_type
+    assert ColumnType.validate("map<string, array<int>>") is map_type
+    assert parse_column_type("decimal(10, 8)") == DecimalType(10, 8)
+
+    with pytest.raises(DJException) as exc_info:
+        parse_column_type("decimal")
+    assert "DJ does not recognize the type `decimal`" in str(exc_info)
+
+
 @pytest.mark.asyncio
 async def test_infer_types_datetime(construction_session: AsyncSession):
     """
@@ -4,11 +4,16 @@ Tests for building nodes and extracting dependencies
 
 # pylint: disable=too-many-lines
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from datajunction_server.construction.utils import get_dj_node
-from datajunction_server.errors import DJErrorException
+from datajunction_server.construction.utils import get_dj_node, prefetch_dj_nodes
+from datajunction_server.database.node import Node, NodeRevision
+from datajunction_server.database.user import User
+from datajunction_server.errors import DJErrorException, DJException
 from datajunction_server.models.node_type import NodeType
+from datajunction_server.sql.parsing import ast
+from datajunction_server.sql.parsing.backends.antlr4 import parse
 
 
 @pytest.mark.asyncio
@@ -49,3 +54,73 @@ async def test_get_dj_node_raise_unknown_node_exception(session: AsyncSession):
     assert "No node `event_type` exists of kind transform" in str(
         exc_info.value,
     )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_dj_nodes(
+    session: AsyncSession,
+    current_user: User,
+    mocker: MockerFixture,
+):
+    """
+    Test that nodes are loaded in one query and then served from the session until
+    something is written
+    """
+    for name, type_ in [("a", NodeType.SOURCE), ("b", NodeType.TRANSFORM)]:
+        node = Node(
+            name=name,
+            type=type_,
+            current_version="v1",
+            created_by_id=current_user.id,
+        )
+        session.add(
+            NodeRevision(
+                node=node,
+                name=name,
+                type=type_,
+                version="v1",
+                created_by_id=current_user.id,
+            ),
+        )
+    await session.commit()
+
+    execute = mocker.spy(session, "execute")
+    await prefetch_dj_nodes(session, ["a", "b", "c"])
+    assert execute.call_count == 1
+    assert (await get_dj_node(session, "a")).name == "a"
+    assert (await get_dj_node(session, "b", current=False)).type == NodeType.TRANSFORM
+    with pytest.raises(DJErrorException):
+        await get_dj_node(session, "c")
+    with pytest.raises(DJErrorException):
+        await get_dj_node(session, "a", kinds={NodeType.TRANSFORM})
+    assert execute.call_count == 1
+
+    # Writes clear the loaded nodes
+    session.add(
+        Node(
+            name="c",
+            type=NodeType.SOURCE,
+            current_version="v1",
+            created_by_id=current_user.id,
+        ),
+    )
+    await session.flush()
+    assert (await get_dj_node(session, "c", current=False)).name == "c"
+    assert execute.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_prefetch_dj_nodes_skips_ctes(
+    session: AsyncSession,
+    mocker: MockerFixture,
+):
+    """
+    Test that compiling a query doesn't prefetch the names of its CTEs
+    """
+    prefetch = mocker.spy(ast, "prefetch_dj_nodes")
+    query = parse(
+        "WITH cte AS (SELECT 1 AS x FROM a), other AS (SELECT 1 AS y FROM cte) "
+        "SELECT 1 AS z FROM other CROSS JOIN b",
+    )
+    await query.compile(ast.CompileContext(session=session, exception=DJException()))
+    assert prefetch.call_args_list[0].args[1] == {"a", "b"}
@@ -0,0 +1,114 @@
+"""
+Tests for ``datajunction_server.database.queryrequest``.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cachelib.simple import SimpleCache
+from pytest_mock import MockerFixture
+
+from datajunction_server.database.queryrequest import (
+    QueryBuildType,
+    QueryRequest,
+    QueryRequestCache,
+)
+
+
+@pytest.mark.asyncio
+async def test_versioned_query_request_cache(mocker: MockerFixture) -> None:
+    """
+    Test that the versioned request key is only rebuilt when the graph changes
+    """
+    fingerprint = mocker.patch(
+        "datajunction_server.database.queryrequest.GraphIndex.fingerprint",
+        AsyncMock(return_value=(1, "a")),
+    )
+    versioned = {
+        "nodes": ["default.num_repair_orders@v1.0"],
+        "parents": ["default.repair_orders@v1.0"],
+        "dimensions": [],
+        "filters": [],
+        "orderby": [],
+    }
+    to_versioned = mocker.patch.object(
+        QueryRequest,
+        "to_versioned_query_request",
+        AsyncMock(return_value=versioned),
+    )
+    session = MagicMock()
+    args = (
+        session,
+        ["default.num_repair_orders"],
+        [],
+        [],
+        [],
+        QueryBuildType.METRICS,
+    )
+    assert await QueryRequest.get_versioned_query_request(*args) == versioned
+    assert await QueryRequest.get_versioned_query_request(*args) == versioned
+    assert to_versioned.call_count == 1
+
+    # A graph change produces a new fingerprint, which rebuilds the key
+    fingerprint.return_value = (2, "b")
+    assert await QueryRequest.get_versioned_query_request(*args) == versioned
+    assert to_versioned.call_count == 2
+
+
+def test_query_request_cache() -> None:
+    """
+    Test the two tiers of the query request cache
+    """
+    shared = SimpleCache()
+    cache = QueryRequestCache(maxsize=2, ttl=60, shared=shared)
+    versioned = {"nodes": ["a@v1.0"], "parents": ["b@v1.0"]}
+    key = cache.key(QueryBuildType.NODE, versioned, None, None, 10, None)
+    assert cache.get(key) is None
+    cache.set(key, 1)
+    assert cache.get(key) == 1
+
+    # A new version of a parent is a different key
+    bumped = {"nodes": ["a@v1.0"], "parents": ["b@v2.0"]}
+    assert cache.key(QueryBuildType.NODE, bumped, None, None, 10, None) != key
+
+    # Local misses fall back to the shared tier
+    cache.local.clear()
+    assert cache.get(key) == 1
+    assert key in cache.local
+
+    cache.evict(key)
+    assert cache.get(key) is None
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+
+def test_query_request_cache_key() -> None:
+    """
+    Test that a saved query request is only a cache hit for its own request key
+    """
+    versioned = {
+        "nodes": ["default.num_repair_orders@v1.0"],
+        "parents": ["default.repair_orders@v1.0"],
+        "dimensions": ["default.hard_hat.state@v1.0"],
+        "filters": [],
+        "orderby": [],
+    }
+    query_request = QueryRequest(
+        query_type=QueryBuildType.METRICS,
+        engine_name=None,
+        engine_version=None,
+        limit=None,
+        other_args={},
+        **versioned,
+    )
+    key = QueryRequestCache.key(
+        QueryBuildType.METRICS,
+        versioned,
+        None,
+        None,
+        None,
+        None,
+    )
+    assert query_request.cache_key() == key
+
+    # A row id that now points at a different request must not be a hit
+    query_request.dimensions = ["default.hard_hat.city@v1.0"]
+    assert query_request.cache_key() != key
@@ -11,6 +11,7 @@ from datajunction_server.database.engine import Engine
 from datajunction_server.errors import (
     DJDoesNotExistException,
     DJError,
+    DJNotImplementedException,
     DJQueryServiceClientException,
     ErrorCode,
 )
@@ -148,6 +149,147 @@ class TestQueryServiceClient:  # pylint: disable=too-few-public-methods
             query_service_client.get_columns_for_table("hive", "test", "pies")
         assert "No columns found" in str(exc_info.value)
 
+    def test_query_service_client_get_columns_for_tables(
+        self,
+        mocker: MockerFixture,
+    ) -> None:
+        """
+        Test getting the columns of many tables in a schema at once.
+        """
+        mock_request = mocker.patch("requests.Session.request")
+        mock_request.return_value = MagicMock(
+            status_code=200,
+            json=MagicMock(
+                return_value={
+                    "name": "hive.test",
+                    "tables": [
+                        {
+                            "name": "hive.test.pies",
+                            "columns": [{"name": "id", "type": "INT"}],
+                        },
+                    ],
+                    "missing": ["hive.test.cakes"],
+                },
+            ),
+        )
+        query_service_client = QueryServiceClient(uri=self.endpoint)
+        columns = query_service_client.get_columns_for_tables(
+            "hive",
+            "test",
+            ["pies", "cakes"],
+            engine=Engine(name="spark", version="2.4.4"),
+        )
+        assert {
+            table: [(column.name, str(column.type)) for column in table_columns]
+            for table, table_columns in columns.items()
+        } == {"pies": [("id", "INT")]}
+        mock_request.assert_called_with(
+            "POST",
+            "http://queryservice:8001/schema/hive.test/columns/",
+            data=None,
+            json={"tables": ["pies", "cakes"]},
+            params={"engine": "spark", "engine_version": "2.4.4"},
+            headers=ANY,
+        )
+
+        mock_request.return_value = MagicMock(
+            status_code=404,
+            text="No such schema",
+            headers={"X-DJ-Error": "true"},
+        )
+        with pytest.raises(DJDoesNotExistException) as exc_info:
+            query_service_client.get_columns_for_tables("hive", "test", ["pies"])
+        assert "Schema not found" in str(exc_info.value)
+
+        # A query service without the endpoint
+        mock_request.return_value = MagicMock(
+            status_code=404,
+            text="Not Found",
+            headers={},
+            url="http://queryservice:8001/schema/hive.test/columns/",
+        )
+        with pytest.raises(DJNotImplementedException) as exc_info:
+            query_service_client.get_columns_for_tables("hive", "test", ["pies"])
+        assert "Query service endpoint not found" in str(exc_info.value)
+
+        mock_request.return_value = MagicMock(status_code=400, text="Unknown")
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            query_service_client.get_columns_for_tables("hive", "test", ["pies"])
+        assert "Error response from query service" in str(exc_info.value)
+
+    def test_query_service_client_get_table_fingerprints(
+        self,
+        mocker: MockerFixture,
+    ) -> None:
+        """
+        Test getting the fingerprints of many tables in a schema at once.
+        """
+        mock_request = mocker.patch("requests.Session.request")
+        mock_request.return_value = MagicMock(
+            status_code=200,
+            json=MagicMock(
+                return_value={
+                    "name": "hive.test",
+                    "fingerprints": {"hive.test.pies": "abc", "hive.test.tarts": "def"},
+                    "tables": [
+                        {
+                            "name": "hive.test.tarts",
+                            "columns": [{"name": "id", "type": "int"}],
+                        },
+                    ],
+                    "missing": ["hive.test.cakes"],
+                },
+            ),
+        )
+        query_service_client = QueryServiceClient(uri=self.endpoint)
+        fingerprints, columns = query_service_client.get_table_fingerprints(
+            "hive",
+            "test",
+            ["pies", "tarts", "cakes"],
+            fingerprints={"pies": "abc", "tarts": "xyz"},
+        )
+        assert fingerprints == {"pies": "abc", "tarts": "def"}
+        assert {
+            table: [(column.name, str(column.type)) for column in table_columns]
+            for table, table_columns in columns.items()
+        } == {"tarts": [("id", "int")]}
+        mock_request.assert_called_with(
+            "POST",
+            "http://queryservice:8001/schema/hive.test/fingerprints/",
+            data=None,
+            json={
+                "tables": ["pies", "tarts", "cakes"],
+                "fingerprints": {"pies": "abc", "tarts": "xyz"},
+            },
+            params={},
+            headers=ANY,
+        )
+
+        mock_request.return_value = MagicMock(
+            status_code=404,
+            text="No such schema",
+            headers={"X-DJ-Error": "true"},
+        )
+        with pytest.raises(DJDoesNotExistException) as exc_info:
+            query_service_client.get_table_fingerprints("hive", "test", ["pies"])
+        assert "Schema not found" in str(exc_info.value)
+
+        # A query service without the endpoint
+        mock_request.return_value = MagicMock(
+            status_code=404,
+            text="Not Found",
+            headers={},
+            url="http://queryservice:8001/schema/hive.test/fingerprints/",
+        )
+        with pytest.raises(DJNotImplementedException) as exc_info:
+            query_service_client.get_table_fingerprints("hive", "test", ["pies"])
+        assert "Query service endpoint not found" in str(exc_info.value)
+
+        mock_request.return_value = MagicMock(status_code=400, text="Unknown")
+        with pytest.raises(DJQueryServiceClientException) as exc_info:
+            query_service_client.get_table_fingerprints("hive", "test", ["pies"])
+        assert "Error response from query service" in str(exc_info.value)
+
     def test_query_service_client_submit_query(self, mocker: MockerFixture) -> None:
         """
         Test submitting a query to a query service client.
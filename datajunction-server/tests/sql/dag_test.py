@@ -10,7 +10,12 @@ from datajunction_server.database.node import Node, NodeRevision
 from datajunction_server.database.user import User
 from datajunction_server.errors import DJException
 from datajunction_server.models.node import DimensionAttributeOutput, NodeType
-from datajunction_server.sql.dag import get_dimensions, topological_sort
+from datajunction_server.sql.dag import (
+    get_dimensions,
+    get_shared_dimensions,
+    topological_levels,
+    topological_sort,
+)
 from datajunction_server.sql.parsing.types import IntegerType, StringType
 
 
@@ -109,6 +114,99 @@ async def test_get_dimensions(session: AsyncSession, current_user: User) -> None
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_shared_dimensions_derived_metrics(
+    session: AsyncSession,
+    current_user: User,
+) -> None:
+    """
+    Test ``get_shared_dimensions`` with derived metrics, which take their dimensions
+    from their first parent.
+    """
+    dimension_ref = Node(
+        name="B",
+        type=NodeType.DIMENSION,
+        current_version="1",
+        created_by_id=current_user.id,
+    )
+    dimension_ref.current = NodeRevision(
+        node=dimension_ref,
+        name=dimension_ref.name,
+        type=dimension_ref.type,
+        display_name="B",
+        version="1",
+        columns=[Column(name="id", type=IntegerType(), order=0)],
+        created_by_id=current_user.id,
+    )
+    parent_ref = Node(
+        name="A",
+        current_version="1",
+        type=NodeType.SOURCE,
+        created_by_id=current_user.id,
+    )
+    parent_ref.current = NodeRevision(
+        node=parent_ref,
+        name=parent_ref.name,
+        type=parent_ref.type,
+        display_name="A",
+        version="1",
+        columns=[
+            Column(name="b_id", type=IntegerType(), dimension=dimension_ref, order=0),
+        ],
+        created_by_id=current_user.id,
+    )
+    session.add_all([dimension_ref, parent_ref])
+
+    metrics = {}
+    for name, parents in [("C", [parent_ref]), ("E", [])]:
+        metric_ref = Node(
+            name=name,
+            current_version="1",
+            type=NodeType.METRIC,
+            created_by_id=current_user.id,
+        )
+        metric_ref.current = NodeRevision(
+            node=metric_ref,
+            name=name,
+            display_name=name,
+            version="1",
+            query="SELECT COUNT(*) FROM A",
+            parents=parents,
+            type=NodeType.METRIC,
+            created_by_id=current_user.id,
+        )
+        session.add(metric_ref)
+        metrics[name] = metric_ref
+    for name, parent in [("F", "C"), ("G", "E")]:
+        metric_ref = Node(
+            name=name,
+            current_version="1",
+            type=NodeType.METRIC,
+            created_by_id=current_user.id,
+        )
+        metric_ref.current = NodeRevision(
+            node=metric_ref,
+            name=name,
+            display_name=name,
+            version="1",
+            query=f"SELECT {parent}",
+            parents=[metrics[parent]],
+            type=NodeType.METRIC,
+            created_by_id=current_user.id,
+        )
+        session.add(metric_ref)
+        metrics[name] = metric_ref
+    await session.commit()
+
+    assert [
+        dim.name for dim in await get_shared_dimensions(session, [metrics["F"]])
+    ] == ["B.id"]
+
+    # A derived metric whose parent metric has no parents has no dimensions
+    assert await get_shared_dimensions(session, [metrics["G"]]) == []
+    assert await get_shared_dimensions(session, [metrics["F"], metrics["G"]]) == []
+
+
 @pytest.mark.asyncio
 async def test_topological_sort(session: AsyncSession) -> None:
     """
@@ -187,3 +285,35 @@ async def test_topological_sort(session: AsyncSession) -> None:
     with pytest.raises(DJException) as exc_info:
         topological_sort([node_a, node_b, node_c, node_d, node_e, node_f])
     assert "Graph has at least one cycle" in str(exc_info)
+
+
+@pytest.mark.asyncio
+async def test_topological_levels(session: AsyncSession) -> None:
+    """
+    Test ``topological_levels``.
+    """
+    nodes = {}
+    for name, parents in [
+        ("test.A", []),
+        ("test.B", ["test.A"]),
+        ("test.D", ["test.A"]),
+        ("test.C", ["test.B", "test.D"]),
+        ("test.E", ["test.C", "test.B"]),
+    ]:
+        node = Node(name=name, type=NodeType.TRANSFORM)
+        node.current = NodeRevision(
+            node=node,
+            name=name,
+            parents=[nodes[parent] for parent in parents],
+        )
+        session.add(node)
+        nodes[name] = node
+
+    levels = topological_levels(list(nodes.values()))
+    assert [[node.name for node in level] for level in levels] == [
+        ["test.A"],
+        ["test.D", "test.B"],
+        ["test.C"],
+        ["test.E"],
+    ]
+    assert not topological_levels([])
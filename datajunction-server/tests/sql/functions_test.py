@@ -64,6 +64,37 @@ async def test_bad_combo_types() -> None:
     assert "got an invalid combination of types" in str(exc)
 
 
+def test_dispatch_resolution_cache() -> None:
+    """
+    Tests that dispatches are resolved once per combination of argument types,
+    including varargs and invalid combinations
+    """
+    # Registering a function clears the resolved dispatches
+    Avg.register(Avg.dispatch("infer_type", ast.Number(1)))
+    assert not F.Dispatch.resolved
+
+    args = (
+        ast.Column(ast.Name("x"), _type=NullType()),
+        ast.Column(ast.Name("y"), _type=BigIntType()),
+        ast.Column(ast.Name("z"), _type=StringType()),
+    )
+    assert Coalesce.infer_type(*args) == BigIntType()
+    key = (
+        Coalesce,
+        "infer_type",
+        ((0, NullType), (1, BigIntType), (2, StringType)),
+    )
+    assert F.Dispatch.resolved[key] is not None
+    assert Coalesce.dispatch("infer_type", *args) is F.Dispatch.resolved[key]
+
+    column = ast.Column(ast.Name("x"), _type=StringType())
+    for _ in range(2):
+        with pytest.raises(TypeError) as exc:
+            Avg.infer_type(column)
+        assert "got an invalid combination of types: StringType" in str(exc)
+    assert F.Dispatch.resolved[(Avg, "infer_type", ((0, StringType),))] is None
+
+
 @pytest.mark.asyncio
 async def test_abs(session: AsyncSession):
     """
@@ -0,0 +1,139 @@
+"""
+Tests for ``datajunction_server.sql.graph_index``.
+"""
+from datetime import datetime
+
+import pytest
+
+from datajunction_server.models.node_type import NodeType
+from datajunction_server.sql.graph_index import GraphIndex, GraphSnapshot, IndexedNode
+
+
+def _graph() -> GraphSnapshot:
+    """
+    A small graph:
+        source.a -> transform.b -> metric.c
+        source.a -> metric.d
+        source.a --(a_id)--> dim.e --[birth]--> dim.f
+    """
+    graph = GraphSnapshot()
+    for node_id, name, type_ in [
+        (1, "source.a", NodeType.SOURCE),
+        (2, "transform.b", NodeType.TRANSFORM),
+        (3, "metric.c", NodeType.METRIC),
+        (4, "metric.d", NodeType.METRIC),
+        (5, "dim.e", NodeType.DIMENSION),
+        (6, "dim.f", NodeType.DIMENSION),
+    ]:
+        graph.nodes[node_id] = IndexedNode(
+            id=node_id,
+            name=name,
+            type=type_,
+            active=True,
+            current_revision_id=node_id * 10,
+            display_name=name,
+        )
+    graph.parents = {20: {1}, 30: {2}, 40: {1}}
+    graph.children = {
+        1: {(2, True, NodeType.TRANSFORM), (4, True, NodeType.METRIC)},
+        2: {(3, True, NodeType.METRIC)},
+    }
+    graph.branches = {10: [("a_id", 5)], 50: [("[birth]", 6)]}
+    graph.referencing = {5: {1}, 6: {5}}
+    return graph
+
+
+def test_downstream_depths() -> None:
+    """
+    Test finding downstream nodes and their depths
+    """
+    graph = _graph()
+    assert graph.downstream_depths(1) == {2: 0, 3: 1, 4: 0}
+    assert graph.downstream_depths(2) == {3: 0}
+    assert graph.downstream_depths(3) == {}
+
+
+def test_upstream_ids() -> None:
+    """
+    Test finding upstream nodes
+    """
+    graph = _graph()
+    assert graph.upstream_ids(30) == {1, 2}
+    graph.nodes[2].current_revision_id = None
+    assert graph.upstream_ids(30) == set()
+
+
+def test_dimension_paths() -> None:
+    """
+    Test walking the dimensions graph, skipping inactive dimensions
+    """
+    graph = _graph()
+    assert graph.dimension_paths(10, "source.a") == [
+        (5, "source.a.a_id,dim.e"),
+        (6, "source.a.a_id,dim.e.[birth],dim.f"),
+    ]
+    graph.nodes[6].active = False
+    assert graph.dimension_paths(10, "source.a") == [(5, "source.a.a_id,dim.e")]
+
+
+def test_nodes_with_dimension() -> None:
+    """
+    Test finding all nodes that can be joined to a dimension
+    """
+    graph = _graph()
+    assert graph.nodes_with_dimension(6) == {1, 2, 3, 4}
+    graph.nodes[2].active = False
+    assert graph.nodes_with_dimension(5) == {1, 4}
+
+
+def test_nodes_with_common_dimensions() -> None:
+    """
+    Test finding nodes that can be joined to all of a set of dimensions in one sweep
+    """
+    graph = _graph()
+    graph.nodes[7] = IndexedNode(
+        id=7,
+        name="dim.g",
+        type=NodeType.DIMENSION,
+        active=True,
+        current_revision_id=70,
+        display_name="dim.g",
+    )
+    graph.referencing[7] = {2}
+    assert graph.nodes_with_common_dimensions([]) == set()
+    assert graph.nodes_with_common_dimensions([5, 6]) == {1, 2, 3, 4}
+    assert graph.nodes_with_common_dimensions([6, 7]) == {2, 3}
+
+
+def test_reachability_key() -> None:
+    """
+    Test that the reachability key changes when a dimension gets a new revision
+    """
+    graph = _graph()
+    paths = graph.dimension_paths(10, "source.a")
+    key = graph.reachability_key(paths)
+    assert key == (
+        (5, 50, "source.a.a_id,dim.e"),
+        (6, 60, "source.a.a_id,dim.e.[birth],dim.f"),
+    )
+    graph.nodes[6].current_revision_id = 61
+    graph.branches[61] = []
+    assert graph.reachability_key(graph.dimension_paths(10, "source.a")) != key
+
+
+@pytest.mark.asyncio
+async def test_carry_over_recreated_database() -> None:
+    """
+    Test that nothing is carried over from a snapshot of a database whose history
+    started at a different time, since its ids can refer to different nodes
+    """
+    previous = _graph()
+    previous.fingerprint = (5, None, 50, None, 6, 0, 2, datetime(2024, 1, 1))
+    previous.labels = {10: ("source.a", "source.a")}
+    previous.columns = {10: []}
+    snapshot = GraphSnapshot(
+        fingerprint=(9, None, 50, None, 6, 0, 2, datetime(2024, 2, 1)),
+    )
+    await GraphIndex.carry_over(None, previous, snapshot)  # type: ignore
+    assert not snapshot.labels
+    assert not snapshot.branches
@@ -5,7 +5,12 @@ Tests for custom antlr4 parser
 
 import pytest
 
-from datajunction_server.sql.parsing.backends.antlr4 import parse
+from datajunction_server.sql.parsing import ast
+from datajunction_server.sql.parsing.backends.antlr4 import (
+    PARSE_TREE_BYTES_PER_TOKEN,
+    ParseCache,
+    parse,
+)
 
 
 @pytest.mark.parametrize(
@@ -119,3 +124,32 @@ def test_antlr4_lambda_function():
     assert "FOO('a', 'b', c -> d) AS e" in str(query)
     query = parse("SELECT FOO('a', 'b', (c, c2, c3) -> d) AS e;")
     assert "FOO('a', 'b', (c, c2, c3) -> d) AS e" in str(query)
+
+
+def test_antlr4_parse_cache(mocker):
+    """
+    Test that the parse cache reuses parse trees but builds independent asts
+    """
+    cache = ParseCache(maxsize=40 * PARSE_TREE_BYTES_PER_TOKEN)
+    mocker.patch(
+        "datajunction_server.sql.parsing.backends.antlr4.parse_cache",
+        cache,
+    )
+    query = parse("SELECT sum(a) FROM b")
+    query.select.projection[0].args[0].name.name = "c"
+    assert "sum(a)" in str(parse("SELECT sum(a) FROM b"))
+    assert cache.info() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 10 * PARSE_TREE_BYTES_PER_TOKEN,
+        "maxsize": 40 * PARSE_TREE_BYTES_PER_TOKEN,
+    }
+    assert all(
+        func.parent is not None
+        for func in parse("SELECT sum(a) FROM b").find_all(ast.Function)
+    )
+
+    # Evicted once the estimated size of the cached trees exceeds the bound
+    parse("SELECT " + ", ".join(f"col{idx}" for idx in range(12)) + " FROM b")
+    assert cache.info()["evictions"] == 1
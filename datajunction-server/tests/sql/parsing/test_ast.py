@@ -1235,3 +1235,53 @@ async def test_ast_hints():
     assert cast(ast.Hint, query.select.hints[0]).name.name == "REBALANCE"
     assert [str(col) for col in query.select.hints[0].parameters] == ["3", "c"]
     assert "/*+ REBALANCE(3, c) */" in str(query)
+
+
+def test_ast_copy():
+    """
+    Test that copying an ast rebuilds the whole tree it belongs to, remapping
+    references within it and keeping parents consistent
+    """
+    query = parse("SELECT a.x + 1 AS y FROM a WHERE a.x > 2")
+    table = query.select.from_.relations[0].primary  # type: ignore
+    column = next(query.select.where.find_all(ast.Column))  # type: ignore
+    column.add_table(table)
+    column.add_type(types.IntegerType())
+
+    copied = query.copy()
+    assert str(copied) == str(query)
+    assert copied.select is not query.select
+    copied_column = next(copied.select.where.find_all(ast.Column))  # type: ignore
+    assert copied_column is not column
+    assert copied_column.table is copied.select.from_.relations[0].primary  # type: ignore
+    assert copied_column.type is column.type
+    for node in copied.find_all(ast.Node):
+        for child in node.children:
+            assert child.parent is node
+
+    # Copying a subtree copies the tree around it too, as deepcopy would
+    where = query.select.where.copy()  # type: ignore
+    assert where.parent is not query.select
+    assert where.parent.where is where  # type: ignore
+
+
+def test_ast_traversal_order():
+    """
+    Test that traversals visit nodes in pre-order and track depth
+    """
+    query = parse("SELECT a, b + c FROM t WHERE d > (SELECT max(e) FROM u)")
+    assert [str(col) for col in query.find_all(ast.Column)] == [
+        "a",
+        "b",
+        "c",
+        "d",
+        "e",
+    ]
+    column_e = list(query.find_all(ast.Column))[-1]
+    ancestors = 0
+    node = column_e.parent
+    while node:
+        ancestors += 1
+        node = node.parent
+    assert column_e.depth == ancestors > 0
+    assert query.depth == 0
@@ -19,6 +19,7 @@ from datajunction_server.errors import DJException
 from datajunction_server.utils import (
     Version,
     get_and_update_current_user,
+    get_async_query_service_client,
     get_engine,
     get_issue_url,
     get_query_service_client,
@@ -113,6 +114,24 @@ def test_get_query_service_client(mocker: MockerFixture, settings: Settings) ->
     assert query_service_client.uri == "http://query_service:8001"  # type: ignore
 
 
+def test_get_async_query_service_client(
+    mocker: MockerFixture,
+    settings: Settings,
+) -> None:
+    """
+    Test ``get_async_query_service_client``.
+    """
+    settings.query_service = "http://query_service:8001"
+    settings.query_service_retries = 3
+    mocker.patch("datajunction_server.utils.get_settings", return_value=settings)
+    get_async_query_service_client.cache_clear()
+    query_service_client = get_async_query_service_client()
+    assert query_service_client.uri == "http://query_service:8001"  # type: ignore
+    assert query_service_client.retries == 3  # type: ignore
+    assert get_async_query_service_client() is query_service_client
+    get_async_query_service_client.cache_clear()
+
+
 def test_version_parse() -> None:
     """
     Test version parsing